@@ -0,0 +1,52 @@
+import hashlib
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# TRX 地址负载：0x41 + 20字节地址 + 4字节校验 = 25字节，编码后固定34个字符
+TRX_PAYLOAD_LENGTH = 25
+TRX_ADDRESS_LENGTH = 34
+
+# 两位一组查表，减少一半的 divmod 次数
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+
+
+def encode_int(value, length):
+    """
+    Base58-encode a non-negative integer into exactly ``length`` characters
+    """
+    chunks = []
+    for _ in range(length // 2):
+        value, pair = divmod(value, 3364)
+        chunks.append(_PAIRS[pair])
+    if length % 2:
+        value, digit = divmod(value, 58)
+        chunks.append(ALPHABET[digit])
+    return "".join(reversed(chunks))
+
+
+def encode(data):
+    """
+    Generic Base58 encoding of bytes (leading zero bytes become '1')
+    """
+    stripped = data.lstrip(b"\0")
+    value = int.from_bytes(stripped, "big")
+    digits = []
+    while value:
+        value, digit = divmod(value, 58)
+        digits.append(ALPHABET[digit])
+    return "1" * (len(data) - len(stripped)) + "".join(reversed(digits))
+
+
+def checksum(payload):
+    """
+    First 4 bytes of double SHA-256
+    """
+    return hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+
+
+def encode_trx_address(address_bytes):
+    """
+    Base58Check-encode a 20-byte account hash as a TRX address (T...)
+    """
+    payload = b"\x41" + address_bytes
+    return encode_int(int.from_bytes(payload + checksum(payload), "big"), TRX_ADDRESS_LENGTH)
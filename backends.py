@@ -0,0 +1,205 @@
+import os
+import time
+
+# 各类原语的候选实现，按优先顺序排列；启动时自检并实测速度，选最快的可用实现
+KINDS = ("secp256k1", "keccak", "ed25519")
+
+# 每个候选实现的测速总时长（秒），分几轮交替进行
+BENCH_SECONDS = 0.03
+BENCH_ROUNDS = 3
+
+# 环境变量强制指定实现，例如 VANITY_BACKENDS="secp256k1=pure,keccak=eth_hash"
+ENV_OVERRIDE = "VANITY_BACKENDS"
+
+# 自检向量：私钥 1 的公钥为 G；keccak256(b"")；全零种子的 ed25519 公钥
+_SELF_TESTS = {
+    "secp256k1": (1, bytes.fromhex("79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+                                   "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8")),
+    "keccak": (b"", bytes.fromhex("c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470")),
+    "ed25519": (bytes(32), bytes.fromhex("3b6a27bcceb6a42d62a3a8d02a6f0d73653215771de243a63ac048a18b59da29")),
+}
+
+# 测速输入
+_BENCH_INPUTS = {
+    "secp256k1": 0x6A09E667F3BCC908B2FB1366EA957D3E3ADEC17512775099DA2F590B0667322A,
+    "keccak": bytes(range(64)),
+    "ed25519": bytes(range(32)),
+}
+
+
+def _coincurve():
+    from coincurve import PublicKey
+    return lambda key: PublicKey.from_valid_secret(key.to_bytes(32, "big")).format(False)[1:]
+
+
+def _eth_keys():
+    from eth_keys import keys
+    return lambda key: keys.PrivateKey(key.to_bytes(32, "big")).public_key.to_bytes()
+
+
+def _pure_secp256k1():
+    from secp256k1 import public_key_bytes, scalar_multiply
+    return lambda key: public_key_bytes(scalar_multiply(key))
+
+
+def _pycryptodome():
+    from Crypto.Hash import keccak
+    return lambda data: keccak.new(data=data, digest_bits=256).digest()
+
+
+def _pysha3():
+    import sha3
+    return lambda data: sha3.keccak_256(data).digest()
+
+
+def _eth_hash():
+    from eth_hash.auto import keccak
+    return keccak
+
+
+def _nacl():
+    from nacl.bindings import crypto_sign_seed_keypair
+    return lambda seed: crypto_sign_seed_keypair(seed)[0]
+
+
+def _solders():
+    from solders.keypair import Keypair
+    return lambda seed: bytes(Keypair.from_seed(seed).pubkey())
+
+
+# 种类 -> [(名称, 加载函数)]；加载函数返回实现，缺少依赖时抛出 ImportError
+#   secp256k1: 私钥整数 -> 64字节未压缩公钥 (x || y)
+#   keccak:    bytes -> 32字节 keccak256
+#   ed25519:   32字节种子 -> 32字节公钥
+BACKENDS = {
+    "secp256k1": [("coincurve", _coincurve), ("eth_keys", _eth_keys), ("pure", _pure_secp256k1)],
+    "keccak": [("pycryptodome", _pycryptodome), ("pysha3", _pysha3), ("eth_hash", _eth_hash)],
+    "ed25519": [("nacl", _nacl), ("solders", _solders)],
+}
+
+_selected = {}
+_reports = {}
+_forced = {}
+
+
+def _load(kind, name):
+    for candidate, loader in BACKENDS[kind]:
+        if candidate == name:
+            return loader()
+    raise ValueError(f"Unknown {kind} backend: {name}")
+
+
+def _measure(function, argument, seconds=BENCH_SECONDS):
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        function(argument)
+        calls += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            return calls / (now - start)
+
+
+def _forced_choices():
+    choices = dict(_forced)
+    for item in filter(None, os.environ.get(ENV_OVERRIDE, "").split(",")):
+        kind, _, name = item.partition("=")
+        choices.setdefault(kind.strip(), name.strip())
+    return choices
+
+
+def select(kind):
+    """
+    Pick the implementation of a primitive: forced choice, else fastest passing the self-test
+
+    Returns (name, function). Every candidate is loaded, checked against
+    a known answer and timed for BENCH_SECONDS; the outcome is kept for
+    report(). Earlier (preferred) candidates win unless a later one is
+    more than 10% faster. Raises RuntimeError when no candidate works.
+    """
+    if kind in _selected:
+        return _selected[kind]
+
+    vector_input, expected = _SELF_TESTS[kind]
+    forced = _forced_choices().get(kind)
+    candidates = [(forced, None)] if forced else BACKENDS[kind]
+    results = {}
+    working = []
+    for name, _ in candidates:
+        try:
+            function = _load(kind, name)
+            if function(vector_input) != expected:
+                results[name] = "self-test failed"
+                continue
+        except ImportError:
+            results[name] = "unavailable"
+            continue
+        results[name] = "forced" if forced else "only candidate"
+        working.append((name, function))
+
+    best = None
+    if forced or len(working) == 1:
+        # 只有一个候选时不必测速
+        best = working[0] if working else None
+    elif working:
+        # 交替测几轮取最好成绩，减少偶然抖动；后面的候选需快 10% 以上才替换前面的
+        rates = {name: 0.0 for name, _ in working}
+        for _ in range(BENCH_ROUNDS):
+            for name, function in working:
+                rates[name] = max(rates[name], _measure(function, _BENCH_INPUTS[kind], BENCH_SECONDS / BENCH_ROUNDS))
+        for name, function in working:
+            results[name] = round(rates[name], 1)
+            if best is None or rates[name] > rates[best[0]] * 1.1:
+                best = (name, function)
+
+    _reports[kind] = results
+    if best is None:
+        raise RuntimeError(f"No working {kind} backend: {results}")
+    _selected[kind] = best
+    return _selected[kind]
+
+
+def get(kind):
+    """
+    The selected implementation function of a primitive
+    """
+    selected = _selected.get(kind)
+    return selected[1] if selected else select(kind)[1]
+
+
+def configure(choices):
+    """
+    Force backend names (kind -> name), e.g. to reuse the main process's choice in workers
+    """
+    for kind, name in choices.items():
+        _forced[kind] = name
+        _selected.pop(kind, None)
+
+
+def selected(kinds=KINDS):
+    """
+    kind -> selected backend name, selecting where needed (kinds without a working backend are left out)
+    """
+    names = {}
+    for kind in kinds:
+        try:
+            names[kind] = select(kind)[0]
+        except RuntimeError:
+            continue
+    return names
+
+
+def report(kinds=KINDS):
+    """
+    kind -> {"selected": name, "candidates": {name: ops/s or reason}}
+    """
+    names = selected(kinds)
+    return {kind: {"selected": names.get(kind), "candidates": _reports.get(kind, {})} for kind in kinds}
+
+
+def describe(kinds=KINDS):
+    """
+    One-line summary such as "secp256k1=coincurve keccak=pycryptodome ed25519=nacl"
+    """
+    return " ".join(f"{kind}={name}" for kind, name in selected(kinds).items())
@@ -0,0 +1,308 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+
+DEFAULT_SECONDS = 1.0
+BATCH_SIZE = 1024
+
+# 冷启动计时的重复次数（取中位数）
+COLD_START_RUNS = 3
+
+# 在新解释器中导入注册表并创建一个链的生成器（含后端选择），输出耗时
+COLD_START_SCRIPT = (
+    "import time; start = time.perf_counter(); import chains; chains.create({chain!r}, {{}}); "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure(function, seconds=DEFAULT_SECONDS, per_call=1):
+    """
+    Call function repeatedly for about `seconds` and return (ops/s, calls)
+
+    per_call is the number of operations one call performs (e.g. a batch).
+    """
+    function()  # 预热（缓存、倍数表等）
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        function()
+        calls += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+    return calls * per_call / (now - start), calls
+
+
+def random_hex_key():
+    """原实现中的私钥生成方式：64次 random.choice"""
+    return ''.join(random.choice('0123456789abcdef') for _ in range(64))
+
+
+def account_wallet(matcher):
+    """
+    One attempt of the original ETH path: eth_account's Account.from_key on a random key, then the text match
+    """
+    from eth_account import Account
+    from keysource import random_key_hex
+
+    private_key = "0x" + random_key_hex()
+    address = Account.from_key(private_key).address[2:]
+    return matcher.match(address)
+
+
+def eth_stages(prefix, suffix, case_sensitive):
+    """
+    (backend, stage, function, ops per call) for ETH
+    """
+    from eth_keys import keys
+    from eth_utils import keccak, to_checksum_address
+    import backends
+    import keccak as vector_keccak
+    from eth import ETH, ContractETH, checksum_address, checksum_hash
+    from keysource import random_key_hex
+    from matcher import HexMatcher
+    from secp256k1 import KeyWalker, public_key_bytes
+
+    walker = KeyWalker()
+    public_key = walker.public_key_bytes()
+    address_bytes = keccak(public_key)[12:]
+    matcher = HexMatcher(prefix, suffix, case_sensitive)
+    # 非遍历模式：现在走 keysource + 所选 secp256k1/keccak 后端，原先的 Account.from_key 路径单独保留作对照
+    legacy = ETH(prefix, suffix, case_sensitive)
+    text_matcher = legacy.text_matcher
+    keccak_backend = backends.get("keccak")
+    walk = ETH(prefix, suffix, case_sensitive, walk=True)
+    batch = ETH(prefix, suffix, case_sensitive, walk=True, batch_size=BATCH_SIZE)
+    private_key = bytes.fromhex(random_hex_key())
+    # 合约地址模式（CREATE2）：逐个计算与 numpy 整批计算
+    contract_options = {"deployer": "00" * 20, "init_code_hash": "00" * 32, "batch_size": BATCH_SIZE}
+    contract = ContractETH(prefix, suffix, case_sensitive, **contract_options)
+    contract_loop = ContractETH(prefix, suffix, case_sensitive, **contract_options)
+    contract_loop.vectorized = False
+
+    stages = [
+        ("account", "private_key", random_hex_key, 1),
+        ("keysource", "private_key", random_key_hex, 1),
+        ("eth_keys", "public_key", lambda: keys.PrivateKey(private_key).public_key, 1),
+        ("eth_utils", "encoding", lambda: to_checksum_address(address_bytes), 1),
+        ("account", "end_to_end", lambda: account_wallet(text_matcher), 1),
+        (backends.select("secp256k1")[0], "public_key", lambda: backends.get("secp256k1")(walker.base_key), 1),
+        (backends.select("keccak")[0], "hashing", lambda: keccak_backend(public_key), 1),
+        ("backend", "end_to_end", legacy.generate_wallet, 1),
+        ("walk", "public_key", walker.step, 1),
+        ("walk", "end_to_end", walk.generate_wallet, 1),
+        ("batch", "public_key", lambda: walker.step_batch(BATCH_SIZE), BATCH_SIZE),
+        ("batch", "serialize", lambda: public_key_bytes(walker.point), 1),
+        ("batch", "hashing", lambda: keccak_backend(public_key), 1),
+        ("batch", "matching", lambda: matcher.match_bytes(address_bytes), 1),
+        ("batch", "checksum", lambda: checksum_hash(address_bytes), 1),
+        ("batch", "encoding", lambda: checksum_address(address_bytes), 1),
+        ("batch", "end_to_end", batch.generate_batch, BATCH_SIZE),
+        ("create2", "end_to_end", contract_loop.generate_batch, BATCH_SIZE),
+    ]
+    if contract.vectorized:
+        messages = contract.template[None].repeat(BATCH_SIZE, axis=0)
+        stages += [
+            ("numpy", "hashing", lambda: vector_keccak.keccak256_batch(messages), BATCH_SIZE),
+            ("create2np", "end_to_end", contract.generate_batch, BATCH_SIZE),
+        ]
+    return stages
+
+
+def trx_stages(prefix, suffix, case_sensitive):
+    """
+    (backend, stage, function, ops per call) for TRX
+    """
+    import base58
+    from eth_utils import keccak
+    from b58 import checksum, encode_trx_address
+    from trx import TRX
+    from secp256k1 import KeyWalker
+
+    walker = KeyWalker()
+    public_key = walker.public_key_bytes()
+    address_bytes = keccak(public_key)[12:]
+    payload = b"\x41" + address_bytes
+    single = TRX(prefix, suffix, case_sensitive)
+    batch = TRX(prefix, suffix, case_sensitive, batch_size=BATCH_SIZE)
+
+    return [
+        ("walk", "public_key", walker.step, 1),
+        ("walk", "end_to_end", single.generate_wallet, 1),
+        ("batch", "public_key", lambda: walker.step_batch(BATCH_SIZE), BATCH_SIZE),
+        ("batch", "hashing", lambda: keccak(public_key), 1),
+        ("batch", "checksum", lambda: checksum(payload), 1),
+        ("batch", "encoding", lambda: encode_trx_address(address_bytes), 1),
+        ("base58", "encoding", lambda: base58.b58encode_check(payload), 1),
+        ("batch", "matching", lambda: batch.is_vanity_bytes(address_bytes), 1),
+        ("batch", "end_to_end", batch.generate_batch, BATCH_SIZE),
+    ]
+
+
+def sol_stages(prefix, suffix, case_sensitive):
+    """
+    (backend, stage, function, ops per call) for SOL
+    """
+    import base58
+    from nacl.bindings import crypto_sign_seed_keypair
+    import b58
+    from sol import SOL, keypair_class
+
+    seed = os.urandom(32)
+    public_key = crypto_sign_seed_keypair(seed)[0]
+    legacy = SOL(prefix, suffix, case_sensitive, batch_size=BATCH_SIZE)
+    lean = SOL(prefix, suffix, case_sensitive, lean=True, batch_size=BATCH_SIZE)
+
+    return [
+        ("keypair", "public_key", keypair_class(), 1),
+        ("keypair", "encoding", lambda: base58.b58encode(public_key), 1),
+        ("keypair", "end_to_end", legacy.generate_batch, BATCH_SIZE),
+        ("lean", "private_key", lambda: os.urandom(32 * BATCH_SIZE), BATCH_SIZE),
+        ("lean", "public_key", lambda: crypto_sign_seed_keypair(seed), 1),
+        ("lean", "encoding", lambda: b58.encode(public_key), 1),
+        ("lean", "matching", lambda: lean.is_vanity_bytes(public_key), 1),
+        ("lean", "end_to_end", lean.generate_batch, BATCH_SIZE),
+    ]
+
+
+CHAIN_STAGES = {
+    "ETH": eth_stages,
+    "TRX": trx_stages,
+    "SOL": sol_stages,
+}
+
+
+def cold_start(chain, runs=COLD_START_RUNS):
+    """
+    Median seconds for a fresh interpreter to import and create one chain's generator
+
+    Only the selected chain's module and dependencies are imported (see chains).
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", COLD_START_SCRIPT.format(chain=chain)], cwd=here,
+                                capture_output=True, text=True, check=True).stdout
+        timings.append(float(output.split()[-1]))
+    return sorted(timings)[len(timings) // 2]
+
+
+def machine_info():
+    """
+    Description of the machine and interpreter the benchmark ran on
+    """
+    import backends
+    return {
+        "backends": backends.report(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def log_stderr(text):
+    print(text, file=sys.stderr)
+
+
+def run(chains, seconds=DEFAULT_SECONDS, prefix="", suffix="", case_sensitive=False, stage_filter=None,
+        log=log_stderr):
+    """
+    Run the benchmark and return the JSON-serialisable report
+    """
+    results = []
+    for chain in chains:
+        try:
+            stages = CHAIN_STAGES[chain](prefix, suffix, case_sensitive)
+        except ImportError as e:
+            log(f"{chain}: skipped ({e})")
+            continue
+
+        if not stage_filter or "cold_start" in stage_filter:
+            seconds_taken = cold_start(chain)
+            results.append({
+                "chain": chain,
+                "backend": "registry",
+                "stage": "cold_start",
+                "ops_per_sec": round(1 / seconds_taken, 3),
+                "us_per_op": round(seconds_taken * 1e6, 1),
+                "calls": COLD_START_RUNS,
+            })
+            log(f"{chain:4} {'registry':8} {'cold_start':12} {seconds_taken * 1000:14,.1f} ms")
+
+        for backend, stage, function, per_call in stages:
+            if stage_filter and stage not in stage_filter:
+                continue
+            ops, calls = measure(function, seconds, per_call)
+            results.append({
+                "chain": chain,
+                "backend": backend,
+                "stage": stage,
+                "ops_per_sec": round(ops, 1),
+                "us_per_op": round(1e6 / ops, 3),
+                "calls": calls,
+            })
+            log(f"{chain:4} {backend:8} {stage:12} {ops:14,.0f} ops/s {1e6 / ops:10.2f} us")
+
+    return {
+        "version": 1,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine_info(),
+        "settings": {
+            "seconds": seconds,
+            "batch_size": BATCH_SIZE,
+            "prefix": prefix,
+            "suffix": suffix,
+            "case_sensitive": case_sensitive,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, log=print):
+    """
+    Print the speed ratio of each result against a baseline report
+    """
+    previous = {(r["chain"], r["backend"], r["stage"]): r["ops_per_sec"] for r in baseline["results"]}
+    for result in report["results"]:
+        key = (result["chain"], result["backend"], result["stage"])
+        if key in previous and previous[key]:
+            log(f"{key[0]:4} {key[1]:8} {key[2]:12} x{result['ops_per_sec'] / previous[key]:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-stage vanity generator benchmark")
+    parser.add_argument("--chains", nargs="+", default=list(CHAIN_STAGES), choices=list(CHAIN_STAGES))
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS, help="time budget per stage")
+    parser.add_argument("--stages", nargs="+", help="only run these stages")
+    parser.add_argument("--prefix", default="88")
+    parser.add_argument("--suffix", default="")
+    parser.add_argument("--case-sensitive", action="store_true")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    report = run(args.chains, args.seconds, args.prefix, args.suffix, args.case_sensitive, args.stages)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import importlib
+from collections import namedtuple
+
+# 链的声明：生成器所在模块与类名只在第一次选用该链时才导入，
+# 未选用的链不会加载其依赖（eth_utils、solana 等），以加快启动
+#   defaults: 引擎默认使用的快速模式参数
+#   kinds:    用到的加密原语（见 backends）
+#   variants: (选项名, 类名, defaults, kinds)，选项中给出该选项时改用这个生成器类（如 ETH 合约地址模式）
+ChainSpec = namedtuple("ChainSpec", ["name", "module", "class_name", "defaults", "kinds", "variants"])
+
+_registry = {}
+_loaded = {}
+
+
+def register(name, module, class_name, defaults=None, kinds=(), variants=()):
+    """
+    Declare a chain; its generator module is imported only by load()
+    """
+    variants = tuple((option, variant_class, dict(variant_defaults), tuple(variant_kinds))
+                     for option, variant_class, variant_defaults, variant_kinds in variants)
+    _registry[name] = ChainSpec(name, module, class_name, dict(defaults or {}), tuple(kinds), variants)
+    for key in [key for key in _loaded if key[0] == name]:
+        del _loaded[key]
+
+
+def names():
+    """
+    Registered chain names in registration order
+    """
+    return tuple(_registry)
+
+
+def spec(name):
+    """
+    The ChainSpec of a chain; ValueError for unknown chains
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"Unsupported chain: {name}") from None
+
+
+def variant(name, options=None):
+    """
+    (class_name, defaults, kinds) of the generator a chain uses for these options
+    """
+    chain = spec(name)
+    for option, class_name, defaults, variant_kinds in chain.variants:
+        if options and options.get(option):
+            return class_name, defaults, variant_kinds
+    return chain.class_name, chain.defaults, chain.kinds
+
+
+def kinds(name, options=None):
+    """
+    Crypto primitives a chain's generator uses
+    """
+    return variant(name, options)[2]
+
+
+def load(name, class_name=None):
+    """
+    Generator class of a chain (or of one of its variants), importing its module on first use
+    """
+    class_name = class_name or spec(name).class_name
+    generator_class = _loaded.get((name, class_name))
+    if generator_class is None:
+        generator_class = getattr(importlib.import_module(spec(name).module), class_name)
+        _loaded[(name, class_name)] = generator_class
+    return generator_class
+
+
+def create(name, options, on_found_callback=None):
+    """
+    Create the wallet generator for a chain from its options dict (over the chain defaults)
+    """
+    class_name, defaults, _ = variant(name, options)
+    options = dict(defaults, **options)
+    return load(name, class_name)(on_found_callback=on_found_callback, **options)
+
+
+register("ETH", "eth", "ETH", {"walk": True, "batch_size": 1024}, ("secp256k1", "keccak"),
+         variants=[("deployer", "ContractETH", {"batch_size": 1024}, ("keccak",))])
+register("TRX", "trx", "TRX", {"batch_size": 1024}, ("keccak",))
+register("SOL", "sol", "SOL", {"lean": True, "batch_size": 1024}, ("ed25519",))
@@ -0,0 +1,58 @@
+import os
+import copy
+import json
+
+CONFIG_FILE = "wallet_config.json"
+
+DEFAULT_CONFIG = {
+    "save_local": True,
+    "chains": {
+        "ETH": {
+            "enabled": True,
+            "prefix": "",
+            "suffix": ""
+        },
+        "TRX": {
+            "enabled": True,
+            "prefix": "",
+            "suffix": ""
+        },
+        "SOL": {
+            "enabled": True,
+            "prefix": "",
+            "suffix": ""
+        }
+    }
+}
+
+
+def load_config(path=CONFIG_FILE):
+    """加载配置文件，文件中的顶层键覆盖默认配置；文件不存在时返回默认配置"""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            config.update(json.load(f))
+    return config
+
+
+def save_config(config, path=CONFIG_FILE):
+    """保存配置到文件"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=4, ensure_ascii=False)
+
+
+def chain_options(config, chain):
+    """从配置中取出某条链传给搜索引擎的参数"""
+    settings = config["chains"].get(chain, {})
+    options = {
+        "prefix": settings.get("prefix", ""),
+        "suffix": settings.get("suffix", ""),
+        "case_sensitive": settings.get("case_sensitive", config.get("case_sensitive", False))
+    }
+    if settings.get("pattern_file"):
+        options["pattern_file"] = settings["pattern_file"]
+    # 合约地址模式（见 eth.ContractETH）与跨链调度的目标命中数、优先级（见 scheduler）
+    for key in ("deployer", "init_code_hash", "nonce", "target", "priority"):
+        if key in settings:
+            options[key] = settings[key]
+    return options
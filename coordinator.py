@@ -0,0 +1,457 @@
+import os
+import sys
+import hmac
+import json
+import time
+import socket
+import argparse
+import ipaddress
+import threading
+import socketserver
+import multiprocessing
+from collections import deque
+
+from engine import SUPPORTED_CHAINS, Hit, create_generator, key_field, search_plan
+from keyspace import load_checkpoint, new_seed, save_checkpoint
+from patternset import load_patterns
+
+DEFAULT_PORT = 8765
+
+# 每个租约覆盖的候选数量（一个分片中的一段）
+LEASE_SIZE = 1 << 26
+
+# 超过该时间（秒）没有上报进度的租约收回，从最后上报的位置重新分配
+LEASE_TIMEOUT = 30
+
+# 工作进程上报进度和命中的间隔（秒）
+PROGRESS_INTERVAL = 2
+
+# 未给出 --token 时从该环境变量读取共享令牌（避免令牌出现在进程列表中）
+TOKEN_ENV = "VANITY_COORDINATOR_TOKEN"
+
+
+def log(text):
+    print(f"[{time.strftime('%H:%M:%S')}] {text}", flush=True)
+
+
+class Coordinator:
+    """
+    Hands out keyspace leases to remote workers and collects their hits
+
+    A lease is the range [start, end) of one chain's shard (see keyspace):
+    every new lease takes the next unused shard, so leases never overlap.
+    Workers report their position, attempts and hits every
+    PROGRESS_INTERVAL seconds; a lease without a report for lease_timeout
+    seconds goes back to the pool and is handed out again from the last
+    reported position. handle() implements the whole protocol on plain
+    dicts; serve() wraps it in a JSON-lines TCP server.
+
+    The hello reply carries the search seed, from which every hit's
+    private key can be rebuilt (keyspace.private_key_at), so with a
+    ``token`` every message must carry it; serve() refuses to listen on
+    a non-loopback address without one.
+    """
+
+    def __init__(self, chains, seed=None, lease_size=LEASE_SIZE, lease_timeout=LEASE_TIMEOUT,
+                 on_hit=None, state_file=None, token=None):
+        """
+        chains: dict of chain name -> generator options, as for SearchEngine
+        on_hit: called with each Hit reported by a worker
+        state_file: save the seed, next shards and unfinished leases here and resume from it
+            (ValueError if it was written for other chain options or another seed)
+        token: shared secret that every message must carry
+        """
+        self.chains = []
+        for chain, options in chains.items():
+            if chain not in SUPPORTED_CHAINS:
+                raise ValueError(f"Unsupported chain: {chain}")
+            options = dict(options)
+            pattern_file = options.pop("pattern_file", None)
+            if pattern_file:
+                options["patterns"] = load_patterns(pattern_file)
+            if options.get("public_key"):
+                from splitkey import check_split_key
+                check_split_key(chain, options["public_key"])
+            self.chains.append((chain, options))
+        if not self.chains:
+            raise ValueError("At least one chain is required")
+
+        self.seed = seed or new_seed()
+        self.lease_size = lease_size
+        self.lease_timeout = lease_timeout
+        self.on_hit = on_hit
+        self.state_file = state_file
+        self.token = token
+
+        self.leases = {}
+        self.free = deque()
+        self.next_shard = {chain: 0 for chain, _ in self.chains}
+        self.workers = {}
+        self.hits = 0
+        self._next_id = 1
+        self._next_chain = 0
+        self._lock = threading.Lock()
+
+        if state_file:
+            try:
+                self._restore(load_checkpoint(state_file), seed)
+            except FileNotFoundError:
+                pass
+
+    def _restore(self, state, seed):
+        # 规则不同的搜索不能沿用租约，否则会跳过从未按新规则搜索过的范围
+        if search_plan(state["chains"]) != search_plan(self.chains):
+            raise ValueError(f"{self.state_file} was written for a different search")
+        if seed and seed != state["seed"]:
+            raise ValueError(f"{self.state_file} was written for seed {state['seed']}")
+        # 未完成的租约全部放回待分配队列
+        self.seed = state["seed"]
+        self.next_shard = state["next_shard"]
+        for lease in state["leases"]:
+            self._add_free(lease["chain"], lease["shard"], lease["position"], lease["end"])
+
+    def state(self):
+        with self._lock:
+            return {
+                "seed": self.seed,
+                "chains": search_plan(self.chains),
+                "next_shard": dict(self.next_shard),
+                "leases": [{key: lease[key] for key in ("chain", "shard", "position", "end")}
+                           for lease in self.leases.values()],
+            }
+
+    def save_state(self):
+        if self.state_file:
+            save_checkpoint(self.state_file, self.state())
+
+    def _new_lease(self, chain, shard, position, end):
+        lease = {"id": self._next_id, "chain": chain, "shard": shard, "position": position, "end": end,
+                 "worker": None, "last_seen": 0}
+        self._next_id += 1
+        self.leases[lease["id"]] = lease
+        return lease
+
+    def _add_free(self, chain, shard, position, end):
+        self.free.append(self._new_lease(chain, shard, position, end)["id"])
+
+    def _expire(self, now):
+        for lease in self.leases.values():
+            if lease["worker"] and now - lease["last_seen"] > self.lease_timeout:
+                log(f"lease {lease['id']} ({lease['chain']} shard {lease['shard']}) of {lease['worker']} "
+                    f"expired at {lease['position']}, reassigning")
+                lease["worker"] = None
+                self.free.append(lease["id"])
+
+    def _assign(self, worker, now):
+        self._expire(now)
+        if self.free:
+            lease = self.leases[self.free.popleft()]
+        else:
+            # 轮流为各链分配新的分片
+            chain = self.chains[self._next_chain % len(self.chains)][0]
+            self._next_chain += 1
+            shard = self.next_shard[chain]
+            self.next_shard[chain] += 1
+            lease = self._new_lease(chain, shard, 0, self.lease_size)
+        lease["worker"] = worker
+        lease["last_seen"] = now
+        return lease
+
+    def handle(self, message):
+        """
+        Process one protocol message and return the reply
+
+        ops: hello -> search plan; lease -> next lease; progress (lease,
+        position, hits) -> {"stop": lease was taken away}; done -> lease
+        finished. Hits are [chain, address, private_key, patterns] lists.
+        Messages that are not objects or lack the token get an error reply.
+        """
+        if not isinstance(message, dict):
+            return {"error": "message must be a JSON object"}
+        if self.token is not None and not hmac.compare_digest(str(message.get("token", "")).encode(),
+                                                              self.token.encode()):
+            return {"error": "invalid token"}
+        op = message.get("op")
+        worker = message.get("worker", "?")
+        now = time.time()
+        hits = []
+
+        with self._lock:
+            info = self.workers.setdefault(worker, {"attempts": 0, "rate": 0.0, "hits": 0,
+                                                    "last_seen": now, "started": now})
+            info["last_seen"] = now
+
+            if op == "hello":
+                return {"seed": self.seed, "chains": self.chains}
+
+            if op == "lease":
+                lease = self._assign(worker, now)
+                return {"lease": {key: lease[key] for key in ("id", "chain", "shard", "position", "end")}}
+
+            if op in ("progress", "done"):
+                lease = self.leases.get(message.get("lease"))
+                for chain, address, private_key, patterns in message.get("hits", []):
+                    hits.append(Hit(chain, address, private_key, patterns))
+                info["hits"] += len(hits)
+                self.hits += len(hits)
+
+                stop = lease is None or lease["worker"] != worker
+                if not stop:
+                    position = message.get("position", lease["position"])
+                    attempts = max(0, position - lease["position"])
+                    elapsed = now - lease["last_seen"]
+                    if elapsed > 0:
+                        info["rate"] = attempts / elapsed
+                    info["attempts"] += attempts
+                    lease["position"] = position
+                    lease["last_seen"] = now
+                    if op == "done" or position >= lease["end"]:
+                        del self.leases[lease["id"]]
+                        stop = True
+                reply = {"stop": stop}
+            else:
+                reply = {"error": f"unknown op: {op}"}
+
+        # 回调在锁外执行，避免保存结果时阻塞其他工作进程
+        if self.on_hit:
+            for hit in hits:
+                self.on_hit(hit)
+        return reply
+
+    def status_lines(self, now=None):
+        """
+        One line per live worker plus a summary line
+        """
+        now = now or time.time()
+        with self._lock:
+            self._expire(now)
+            live = {name: info for name, info in self.workers.items() if now - info["last_seen"] <= self.lease_timeout}
+            lines = [f"{name}: {info['rate']:.0f}/s attempts={info['attempts']} hits={info['hits']}"
+                     for name, info in sorted(live.items())]
+            total_rate = sum(info["rate"] for info in live.values())
+            attempts = sum(info["attempts"] for info in self.workers.values())
+            busy = sum(1 for lease in self.leases.values() if lease["worker"])
+            lines.append(f"workers={len(live)} speed={total_rate:.0f}/s attempts={attempts} hits={self.hits} "
+                         f"leases active={busy} pending={len(self.free)}")
+        return lines
+
+    def serve(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """
+        Create the threaded TCP server (call serve_forever() on it)
+
+        Raises ValueError for a non-loopback host without a token.
+        """
+        if self.token is None and not is_loopback(host):
+            raise ValueError(f"listening on {host} requires a shared token (--token or {TOKEN_ENV}): "
+                             "the coordinator hands out the seed every private key is derived from")
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        reply = coordinator.handle(json.loads(line))
+                    except (ValueError, TypeError, KeyError) as e:
+                        reply = {"error": str(e)}
+                    self.wfile.write((json.dumps(reply) + "\n").encode())
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        server = socketserver.ThreadingTCPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+def is_loopback(host):
+    """
+    Whether a listen address only accepts local connections
+    """
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+
+class CoordinatorClient:
+    """
+    Blocking JSON-lines client for one worker connection
+    """
+
+    def __init__(self, host, port, worker, timeout=30, token=None):
+        self.worker = worker
+        self.token = token
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._socket.makefile("rwb")
+
+    def request(self, op, **fields):
+        message = dict(fields, op=op, worker=self.worker)
+        if self.token is not None:
+            message["token"] = self.token
+        self._file.write((json.dumps(message) + "\n").encode())
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("coordinator closed the connection")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return reply
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+
+def work(host, port, worker, token=None):
+    """
+    Worker loop: take leases from the coordinator and search them with the chain generators
+
+    Runs until interrupted; reconnects with a delay when the coordinator
+    is unreachable.
+    """
+    while True:
+        try:
+            client = CoordinatorClient(host, port, worker, token=token)
+        except OSError as e:
+            log(f"{worker}: cannot reach coordinator ({e}), retrying")
+            time.sleep(5)
+            continue
+        try:
+            plan = client.request("hello")
+            chains = dict(plan["chains"])
+            while True:
+                _work_lease(client, plan["seed"], chains, client.request("lease")["lease"])
+        except (OSError, ValueError) as e:
+            log(f"{worker}: {e}, reconnecting")
+            time.sleep(1)
+        finally:
+            client.close()
+
+
+def _work_lease(client, seed, chains, lease):
+    pending = []
+    callback = lambda address, private_key, patterns=None, ch=lease["chain"]: \
+        pending.append([ch, address, private_key, patterns])
+    generator = create_generator(lease["chain"], dict(chains[lease["chain"]], seed=seed, shard=lease["shard"],
+                                                      offset=lease["position"]), callback)
+    next_report = time.time() + PROGRESS_INTERVAL
+    while generator.position() < lease["end"]:
+        generator.generate_batch()
+        if time.time() >= next_report:
+            next_report = time.time() + PROGRESS_INTERVAL
+            reply = client.request("progress", lease=lease["id"], position=generator.position(), hits=pending)
+            pending.clear()
+            if reply["stop"]:
+                return
+    client.request("done", lease=lease["id"], position=generator.position(), hits=pending)
+
+
+def _work_process(host, port, worker, token):
+    try:
+        work(host, port, worker, token)
+    except KeyboardInterrupt:
+        pass
+
+
+def run_workers(host, port, workers=None, name=None, token=None):
+    """
+    Start one worker process per core connected to the coordinator and wait
+    """
+    name = name or socket.gethostname()
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_work_process, args=(host, port, f"{name}-{index}", token),
+                                     daemon=True)
+                 for index in range(workers or multiprocessing.cpu_count())]
+    for process in processes:
+        process.start()
+    log(f"started {len(processes)} workers for {host}:{port}")
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join(5)
+
+
+def serve(args):
+    from hexer import save_result
+
+    # 拆分私钥模式下工作进程只知道公钥，报告的是部分私钥
+    key_name = key_field({"public_key": args.public_key})
+
+    def on_hit(hit):
+        log(f"FOUND {hit.chain} address={hit.address} {key_name}={hit.private_key}")
+        if not args.no_save:
+            try:
+                save_result(hit.chain, hit.private_key, hit.address, hit.patterns, key_name)
+            except OSError as e:
+                log(f"save failed: {e}")
+
+    options = {"prefix": args.prefix, "suffix": args.suffix, "case_sensitive": args.case_sensitive}
+    if args.pattern_file:
+        options["pattern_file"] = args.pattern_file
+    if args.public_key:
+        options["public_key"] = args.public_key
+    try:
+        coordinator = Coordinator({chain: options for chain in args.chains}, seed=args.seed,
+                                  lease_size=args.lease_size, lease_timeout=args.lease_timeout, on_hit=on_hit,
+                                  state_file=args.state, token=args.token)
+        server = coordinator.serve(args.host, args.port)
+    except ValueError as e:
+        log(str(e))
+        return 1
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    log(f"coordinator listening on {args.host}:{args.port}, seed={coordinator.seed}")
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            for line in coordinator.status_lines():
+                log(line)
+            coordinator.save_state()
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    coordinator.save_state()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distribute a vanity search across machines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    server = commands.add_parser("serve", help="run the coordinator")
+    server.add_argument("--host", default="127.0.0.1", help="listen address (0.0.0.0 for all interfaces)")
+    server.add_argument("--port", type=int, default=DEFAULT_PORT)
+    server.add_argument("--chains", nargs="+", default=["ETH"], choices=SUPPORTED_CHAINS)
+    server.add_argument("--prefix", default="")
+    server.add_argument("--suffix", default="")
+    server.add_argument("--case-sensitive", action="store_true")
+    server.add_argument("--pattern-file", help="pattern list file (one 'prefix*suffix' per line)")
+    server.add_argument("--seed", help="hex search seed (default: random)")
+    server.add_argument("--public-key",
+                        help="split-key mode (ETH/TRX): workers only see this public key and report partial keys")
+    server.add_argument("--lease-size", type=int, default=LEASE_SIZE, help="candidates per lease")
+    server.add_argument("--lease-timeout", type=float, default=LEASE_TIMEOUT,
+                        help="seconds without progress before a lease is reassigned")
+    server.add_argument("--state", help="save leases here and resume from it if it exists")
+    server.add_argument("--interval", type=float, default=10, help="seconds between status lines")
+    server.add_argument("--no-save", action="store_true", help="do not save hits locally")
+    server.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                        help=f"shared secret workers must send (default: ${TOKEN_ENV}); "
+                             "required unless listening on a loopback address")
+
+    worker = commands.add_parser("work", help="run worker processes for a coordinator")
+    worker.add_argument("--host", default="127.0.0.1")
+    worker.add_argument("--port", type=int, default=DEFAULT_PORT)
+    worker.add_argument("--workers", type=int, help="worker processes (default: number of cores)")
+    worker.add_argument("--name", help="worker name prefix (default: host name)")
+    worker.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                        help=f"the coordinator's shared secret (default: ${TOKEN_ENV})")
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return serve(args)
+    run_workers(args.host, args.port, args.workers, args.name, args.token)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
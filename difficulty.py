@@ -0,0 +1,158 @@
+import math
+from functools import lru_cache
+
+from b58 import ALPHABET
+from matcher import HEX_CHARS, HexMatcher, Base58Matcher
+from patternset import parse_pattern
+from wildcard import HexWildcardMatcher, WildcardPattern, is_wildcard
+
+# 超过该时间（90%概率命中所需时间）的规则视为不可行
+DEFAULT_MAX_ETA = 365 * 24 * 3600
+
+# 各链 Base58 负载的取值范围：SOL 为32字节公钥，TRX 为 0x41 开头的25字节
+_PAYLOAD_RANGES = {
+    "SOL": (32, "", 0, 1 << 256),
+    "TRX": (25, "T", 0x41 << 192, 0x42 << 192),
+}
+
+
+def match_probability(chain, prefix="", suffix="", case_sensitive=False):
+    """
+    Probability that one random candidate matches the prefix/suffix
+
+    ETH counts 1/16 per hex nibble and another 1/2 per case-sensitive
+    letter (EIP-55 case is one checksum bit). TRX/SOL measure the exact
+    numeric intervals and residues of the Base58 matcher, so the uneven
+    distribution of leading characters (e.g. TRX's second char) is
+    accounted for; each leading '1' of a SOL prefix is a zero byte
+    (probability 2^-8) and the rest is measured on the remaining bytes.
+    """
+    if not prefix and not suffix:
+        return 1.0
+
+    if is_wildcard(prefix) or is_wildcard(suffix):
+        return _wildcard_probability(chain, prefix, suffix, case_sensitive)
+
+    if chain == "ETH":
+        matcher = HexMatcher(prefix, suffix, case_sensitive)
+        if not matcher.possible:
+            return 0.0
+        nibbles = bin(matcher.mask).count("1") // 4
+        return 16.0 ** -nibbles * 2.0 ** -len(matcher.letter_cases)
+
+    if chain not in _PAYLOAD_RANGES:
+        raise ValueError(f"Unsupported chain: {chain}")
+
+    payload_length, lead, low, high = _PAYLOAD_RANGES[chain]
+    ones = len(prefix) - len(prefix.lstrip("1"))
+    if ones and not lead:
+        # 每个开头的 '1' 编码一个前导零字节（概率 2^-8），其余前缀按剩下的字节计算
+        if ones > payload_length or (ones == payload_length and prefix[ones:]):
+            return 0.0
+        remaining = payload_length - ones
+        return 2.0 ** (-8 * ones) * _base58_probability(prefix[ones:], suffix, case_sensitive,
+                                                        remaining, lead, 0, 1 << (8 * remaining))
+    return _base58_probability(prefix, suffix, case_sensitive, payload_length, lead, low, high)
+
+
+def _base58_probability(prefix, suffix, case_sensitive, payload_length, lead, low, high):
+    """
+    Probability that a payload uniform in [low, high) matches, its prefix not starting with a leading-zero '1'
+    """
+    matcher = Base58Matcher(prefix, suffix, case_sensitive, payload_length, lead)
+    if not matcher.numeric:
+        # 无法按数值编译时，按每个字符 1/58 估算
+        variants = matcher.text_matcher
+        count = len(variants.prefixes or (prefix,)) * len(variants.suffixes or (suffix,))
+        return min(1.0, count / 58.0 ** (len(prefix) + len(suffix)))
+
+    probability = 1.0
+    if suffix:
+        probability *= len(matcher.residues) / matcher.modulus
+    if prefix:
+        covered = 0
+        for start, end in zip(matcher.interval_starts, matcher.interval_ends):
+            covered += max(0, min(end, high) - max(start, low))
+        probability *= covered / (high - low)
+    return probability
+
+
+def _wildcard_probability(chain, prefix, suffix, case_sensitive):
+    """
+    Match probability of a wildcard pattern with uniformly distributed characters
+
+    ETH nibbles are uniform and an EIP-55 letter is upper-case half of the
+    time. Base58 counts 1/58 per character except the first one after
+    the lead, whose uneven distribution is measured like a literal prefix.
+    """
+    if chain == "ETH":
+        matcher = HexWildcardMatcher(prefix, suffix, case_sensitive)
+        if not matcher.possible:
+            return 0.0
+        weights = {char: 1 / 16 for char in HEX_CHARS}
+        if case_sensitive:
+            for char in HEX_CHARS[10:]:
+                weights[char] = weights[char.upper()] = 1 / 32
+        return matcher.pattern.probability(weights)
+
+    if chain not in _PAYLOAD_RANGES:
+        raise ValueError(f"Unsupported chain: {chain}")
+
+    skip = len(_PAYLOAD_RANGES[chain][1])
+    pattern = WildcardPattern(prefix, suffix, case_sensitive, ALPHABET, skip)
+    weights = {}
+    leading = {}
+    for char in ALPHABET:
+        folded = pattern.fold(char)
+        weights[folded] = weights.get(folded, 0) + 1 / 58
+        leading[folded] = leading.get(folded, 0) + _leading_probability(chain, char)
+    return pattern.probability(weights, {skip: leading})
+
+
+@lru_cache(maxsize=None)
+def _leading_probability(chain, char):
+    return match_probability(chain, char, "", True)
+
+
+def expected_attempts(chain, prefix="", suffix="", case_sensitive=False, patterns=None):
+    """
+    Expected number of candidates per hit (inf if the pattern can never match)
+
+    With a pattern list the probabilities of the patterns are summed.
+    """
+    if patterns:
+        probability = min(1.0, sum(match_probability(chain, *parse_pattern(pattern), case_sensitive)
+                                   for pattern in patterns))
+    else:
+        probability = match_probability(chain, prefix, suffix, case_sensitive)
+    return 1.0 / probability if probability > 0 else math.inf
+
+
+def eta(expected, rate, probability=0.5):
+    """
+    Seconds until a hit is found with the given probability at rate attempts/s
+
+    Hits are geometric, so the time is -ln(1 - probability) * expected / rate.
+    """
+    if rate <= 0 or math.isinf(expected):
+        return math.inf
+    return -math.log(1 - probability) * expected / rate
+
+
+def format_duration(seconds):
+    """
+    Compact human-readable duration (e.g. 45s, 12.5m, 3.2h, 4.1d, 2.0y)
+    """
+    if math.isinf(seconds):
+        return "∞"
+    for unit, size in (("y", 365 * 24 * 3600), ("d", 24 * 3600), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.1f}{unit}"
+    return f"{seconds:.0f}s"
+
+
+def is_feasible(expected, rate, max_seconds=DEFAULT_MAX_ETA):
+    """
+    Whether a hit is 90% likely within max_seconds at the given rate
+    """
+    return eta(expected, rate, 0.9) <= max_seconds
@@ -0,0 +1,768 @@
+import os
+import time
+import queue
+import threading
+import multiprocessing
+from collections import namedtuple
+
+import backends
+import chains as chain_registry
+from difficulty import DEFAULT_MAX_ETA, eta, expected_attempts, format_duration
+from instrument import format_breakdown, merge
+from journal import write_records
+from keyspace import load_checkpoint, new_seed, save_checkpoint
+from patternset import load_patterns
+from scheduler import CYCLE_SECONDS, DEFAULT_PRIORITY, SCHEDULE_INTERVAL, assign, shares
+from scoring import TopK
+
+# 不支持批量生成的链，每个工作进程每轮尝试的次数，之后再更新一次计数
+CHUNK_SIZE = 256
+
+# 已注册的链（见 chains，生成器模块在首次选用时才导入）
+SUPPORTED_CHAINS = chain_registry.names()
+
+# 启动后经过该时间才根据实测速度判断规则是否可行
+WARMUP_SECONDS = 5
+
+# 开启性能分析时，工作进程上报分阶段统计的间隔（秒）
+STATS_INTERVAL = 1.0
+
+# 命中/统计队列的容量（消息数，每条消息为一批结果）；队列满时工作进程不等待
+HIT_QUEUE_SIZE = 1024
+STATS_QUEUE_SIZE = 256
+
+# 检查点写入间隔（秒）
+CHECKPOINT_INTERVAL = 30
+
+# 决定搜索空间的参数：检查点只能用于这些参数相同的搜索
+SEARCH_KEYS = ("prefix", "suffix", "case_sensitive", "patterns", "public_key", "score",
+               "deployer", "init_code_hash", "nonce")
+
+# 调度参数：每条链的目标命中数（0 为不限）与优先级，不传给生成器
+SCHEDULE_KEYS = ("target", "priority")
+
+# 一个工作进程分到的链都已完成时，每次检查新分配前等待的时间（秒）
+IDLE_WAIT = 0.2
+
+# 工作进程上报的命中结果；patterns 为多规则模式下匹配到的规则，score 为评分模式下的分数
+Hit = namedtuple("Hit", ["chain", "address", "private_key", "patterns", "score"], defaults=[None, None])
+
+def create_generator(chain, options, on_found_callback=None):
+    """
+    Create the wallet generator for a chain from its options dict (over the chain's fast-mode defaults)
+    """
+    return chain_registry.create(chain, options, on_found_callback)
+
+
+def search_plan(chains):
+    """
+    The (chain, options) pairs reduced to the SEARCH_KEYS, as saved in checkpoints
+
+    Two searches with the same plan and seed cover the same keyspace.
+    """
+    return [[chain, {key: options[key] for key in SEARCH_KEYS if key in options}] for chain, options in chains]
+
+
+def key_field(options):
+    """
+    Result field of the key carried by a chain's hits under these options
+    """
+    if options.get("public_key"):
+        return "partial_key"
+    if options.get("deployer"):
+        return "salt" if options.get("init_code_hash") else "nonce"
+    return "private_key"
+
+
+def _publish(hit_queue, pending):
+    """
+    Send the pending hits as one message; keep them for later if the queue is full
+    """
+    if not pending:
+        return
+    try:
+        hit_queue.put_nowait(list(pending))
+        pending.clear()
+    except queue.Full:
+        pass
+
+
+def _worker_main(index, chains, counts, hit_queue, stop_event, chunk_size, profiling=None, stats_queue=None,
+                 seed=None, shard=0, positions=None, backend_choices=None, score_threshold=None,
+                 assignment=None, busy=None):
+    """
+    Worker process entry point: loop over the chains until stopped
+
+    Each round gives every chain slot ``assignment[slot]`` seconds of
+    credit, as set by the main process's scheduler, and runs batches of
+    the slot while its credit is positive, charging each batch's time;
+    a batch longer than the credit leaves a debt that later rounds pay
+    off first (one batch per slot per round without an assignment).
+    Chains assigned 0 are skipped. The time spent on each slot is added
+    to ``busy`` so the scheduler can measure the cost per attempt.
+
+    With a seed, the worker searches shard ``shard`` of every chain
+    starting after the offset in ``positions`` and writes its position
+    back after every batch.
+
+    Hits are buffered locally and published once per batch, so a slow
+    consumer never blocks the search. While the shared ``profiling`` flag
+    is set, the generators' stage timers are enabled and their deltas are
+    sent on ``stats_queue`` about once per STATS_INTERVAL.
+
+    backend_choices pins the crypto backends selected by the main
+    process, so workers skip their own self-test and benchmark.
+
+    In top-K mode ``score_threshold`` is the shared score of the K-th
+    best address; it is copied into the generators every round so they
+    only report candidates that can still enter the list.
+    """
+    if backend_choices:
+        backends.configure(backend_choices)
+    pending = []
+    generators = []
+    for slot, (chain, options) in enumerate(chains):
+        # 回调只记录结果，每批结束后统一发送给主进程
+        callback = lambda address, private_key, patterns=None, score=None, ch=chain: \
+            pending.append(Hit(ch, address, private_key, patterns, score))
+        counter_index = index * len(chains) + slot
+        if seed is not None:
+            options = dict(options, seed=seed, shard=shard, offset=positions[counter_index])
+        generators.append((counter_index, create_generator(chain, options, callback)))
+
+    # 各链的时间余额（秒），为负表示上一批超出了分到的时间
+    credit = [0.0] * len(generators)
+    next_stats = time.time() + STATS_INTERVAL
+    try:
+        while not stop_event.is_set():
+            if profiling is not None:
+                enabled = bool(profiling.value)
+                now = time.time()
+                for (_, generator), (chain, _) in zip(generators, chains):
+                    stats = getattr(generator, "stats", None)
+                    if stats is None:
+                        continue
+                    if enabled and not stats.enabled:
+                        # 关闭期间累计的计数不计入新一轮统计
+                        stats.reset()
+                    stats.enabled = enabled
+                    if enabled and now >= next_stats:
+                        try:
+                            stats_queue.put_nowait((chain, stats.take()))
+                        except queue.Full:
+                            pass
+                if now >= next_stats:
+                    next_stats = now + STATS_INTERVAL
+
+            if score_threshold is not None:
+                threshold = score_threshold.value
+                for _, generator in generators:
+                    generator.threshold = threshold
+
+            idle = True
+            for slot, (counter_index, generator) in enumerate(generators):
+                if assignment is None:
+                    credit[slot] = 0.0
+                else:
+                    budget = assignment[counter_index]
+                    if not budget:
+                        credit[slot] = 0.0
+                        continue
+                    credit[slot] += budget
+                idle = False
+                if credit[slot] < 0:
+                    continue
+                start = time.perf_counter()
+                while True:
+                    if hasattr(generator, "generate_batch"):
+                        generator.generate_batch()
+                        counts[counter_index] += generator.batch_size
+                    else:
+                        for _ in range(chunk_size):
+                            generator.generate_wallet()
+                        counts[counter_index] += chunk_size
+                    if positions is not None:
+                        positions[counter_index] = generator.position()
+                    _publish(hit_queue, pending)
+                    elapsed = time.perf_counter() - start
+                    if stop_event.is_set() or elapsed >= credit[slot]:
+                        break
+                credit[slot] -= elapsed
+                if busy is not None:
+                    busy[counter_index] += elapsed
+                if stop_event.is_set():
+                    break
+            if idle:
+                # 分到的链都已达到目标，等待重新分配
+                stop_event.wait(IDLE_WAIT)
+    except KeyboardInterrupt:
+        pass
+
+    # 退出前把剩余结果发完（主进程在 stop() 中持续取出）
+    if pending:
+        try:
+            hit_queue.put(pending, timeout=5)
+        except (queue.Full, OSError, ValueError):
+            pass
+
+
+class SearchEngine:
+    """
+    Multi-process vanity search engine
+
+    Spawns one worker process per core (or ``workers``), each running every
+    selected chain. Hits are streamed back in per-batch messages through a
+    bounded queue and attempt counts through a shared per-worker counter
+    array; the consumer polls both, so it never runs on the search path.
+    """
+
+    def __init__(self, chains, workers=None, chunk_size=CHUNK_SIZE, seed=None, checkpoint=None, top_k=0):
+        """
+        chains: dict of chain name -> generator options (prefix, suffix, case_sensitive, ...)
+
+        A "pattern_file" option is loaded once here and passed to the
+        workers as the chain's pattern list. Patterns that can never match
+        are refused with ValueError, as are invalid "public_key" options
+        (split-key mode, ETH/TRX only).
+
+        The keyspace is defined by ``seed`` (random when omitted): worker i
+        searches shard i of every chain (see keyspace), so each hit can be
+        reproduced from the seed, shard and offset. With ``checkpoint``,
+        the worker positions are saved to that file every
+        CHECKPOINT_INTERVAL seconds and on stop; if the file already exists
+        the search resumes from it, taking over its seed and worker count.
+
+        With ``top_k`` the search has no pattern: every chain scores its
+        candidates (see scoring) and the engine keeps the top_k best
+        addresses over all workers and chains. The K-th best score is
+        shared with the workers so they skip candidates that cannot enter
+        the list; get_hits() returns only the hits that entered it.
+
+        Chain options may also carry a "target" hit count and a
+        "priority" (see scheduler). Every SCHEDULE_INTERVAL, and as soon
+        as a chain reaches its target, the workers' rounds are re-divided
+        between the unfinished chains by priority and remaining expected
+        work; finished chains stop being searched.
+        """
+        if not chains:
+            raise ValueError("At least one chain is required")
+        for chain in chains:
+            if chain not in SUPPORTED_CHAINS:
+                raise ValueError(f"Unsupported chain: {chain}")
+
+        self.chains = []
+        self.targets = {}
+        self.priorities = {}
+        for chain, options in chains.items():
+            options = dict(options)
+            self.targets[chain] = int(options.pop("target", 0) or 0)
+            self.priorities[chain] = float(options.pop("priority", DEFAULT_PRIORITY))
+            if self.targets[chain] < 0 or self.priorities[chain] <= 0:
+                raise ValueError(f"{chain} target must be >= 0 and priority > 0")
+            pattern_file = options.pop("pattern_file", None)
+            if pattern_file:
+                options["patterns"] = load_patterns(pattern_file)
+                if not options["patterns"]:
+                    raise ValueError(f"No patterns in {pattern_file}")
+            if options.get("public_key"):
+                from splitkey import check_split_key
+                check_split_key(chain, options["public_key"])
+            if top_k:
+                options["score"] = True
+            self.chains.append((chain, options))
+        self.top = TopK(top_k) if top_k else None
+
+        # 每条链命中一次的期望尝试次数（评分模式没有固定规则）
+        self.expected = {}
+        for chain, options in self.chains:
+            if self.top is not None:
+                self.expected[chain] = float("inf")
+                continue
+            self.expected[chain] = expected_attempts(chain, options.get("prefix", ""), options.get("suffix", ""),
+                                                     options.get("case_sensitive", False), options.get("patterns"))
+            if self.expected[chain] == float("inf"):
+                raise ValueError(f"{chain} pattern can never match")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        # 在主进程中选定加密后端（自检 + 测速），工作进程沿用同样的选择
+        kinds = [kind for kind in backends.KINDS
+                 if any(kind in chain_registry.kinds(chain, options) for chain, options in self.chains)]
+        self.backends = backends.selected(kinds)
+
+        # 每条链已找到的命中数（评分模式不计）
+        self.found = {chain: 0 for chain, _ in self.chains}
+
+        self.checkpoint = checkpoint
+        self.seed = seed or new_seed()
+        self.resumed_attempts = 0
+        self.positions = None
+        if checkpoint and os.path.exists(checkpoint):
+            self._resume(load_checkpoint(checkpoint), seed)
+        if self.positions is None:
+            self.positions = [0] * (self.workers * len(self.chains))
+        for chain, options in self.chains:
+            if options.get("deployer"):
+                from eth import check_contract_options
+                check_contract_options(chain, options, self.workers)
+
+        # spawn 在各平台行为一致，且不会把 Tk 等父进程状态带入子进程
+        self._context = multiprocessing.get_context("spawn")
+        self._processes = []
+        self._counts = None
+        self._positions = None
+        self._checkpoint_thread = None
+        self._checkpoint_stop = None
+        self._hit_queue = None
+        self._stop_event = None
+        self._profiling = None
+        self._stats_queue = None
+        self._score_threshold = None
+        self._assignment = None
+        self._busy = None
+        self._next_schedule = 0
+        # 最近一次调度给各链的算力比例
+        self.shares = {}
+        self._stage_stats = {}
+        self.profiling = False
+        self.start_time = 0
+        self.stop_time = 0
+
+    def start(self):
+        """
+        Start the worker processes
+        """
+        if self.is_running():
+            return
+
+        self._counts = self._context.Array("Q", self.workers * len(self.chains), lock=False)
+        self._positions = self._context.Array("Q", self.positions, lock=False)
+        self._hit_queue = self._context.Queue(HIT_QUEUE_SIZE)
+        self._stop_event = self._context.Event()
+        self._profiling = self._context.Value("b", self.profiling, lock=False)
+        self._stats_queue = self._context.Queue(STATS_QUEUE_SIZE)
+        if self.top is not None:
+            self._score_threshold = self._context.Value("d", self.top.threshold(), lock=False)
+        # 开始时各未完成的链平分每轮的时间，测出各链速度后再按调度重新分配
+        active = sum(not self.finished(chain) for chain, _ in self.chains) or 1
+        self._assignment = self._context.Array("d", [0 if self.finished(chain) else CYCLE_SECONDS / active
+                                                     for _ in range(self.workers) for chain, _ in self.chains],
+                                               lock=False)
+        self._busy = self._context.Array("d", self.workers * len(self.chains), lock=False)
+        self._next_schedule = time.time() + SCHEDULE_INTERVAL
+        self._stage_stats = {}
+        self._processes = []
+
+        for index in range(self.workers):
+            process = self._context.Process(target=_worker_main,
+                                            args=(index, self.chains, self._counts, self._hit_queue,
+                                                  self._stop_event, self.chunk_size,
+                                                  self._profiling, self._stats_queue,
+                                                  self.seed, index, self._positions, self.backends,
+                                                  self._score_threshold, self._assignment, self._busy),
+                                            daemon=True)
+            process.start()
+            self._processes.append(process)
+
+        if self.checkpoint:
+            self._checkpoint_stop = threading.Event()
+            self._checkpoint_thread = threading.Thread(target=self._checkpoint_loop, daemon=True)
+            self._checkpoint_thread.start()
+
+        self.start_time = time.time()
+        self.stop_time = 0
+
+    def stop(self, timeout=5):
+        """
+        Signal the workers to stop and wait for them to exit
+
+        Returns any hits that were still queued.
+        """
+        if not self._processes:
+            return []
+
+        self._stop_event.set()
+        deadline = time.time() + timeout
+        remaining = []
+        while self.is_running() and time.time() < deadline:
+            # 等待期间持续取出结果，避免子进程因队列已满无法退出
+            remaining.extend(self.get_hits(timeout=0.1))
+            self.stage_stats()
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+                process.join(1)
+        remaining.extend(self.get_hits())
+        self.stage_stats()
+
+        # 工作进程已退出，记录最终位置
+        self.positions = list(self._positions)
+        if self._checkpoint_thread:
+            self._checkpoint_stop.set()
+            self._checkpoint_thread.join()
+            self._checkpoint_thread = None
+            self.save_checkpoint()
+
+        for channel in (self._hit_queue, self._stats_queue):
+            channel.close()
+            channel.cancel_join_thread()
+        self._processes = []
+        self.stop_time = time.time()
+        return remaining
+
+    def _resume(self, state, seed):
+        """
+        Take over seed, worker count and positions from a checkpoint
+        """
+        if search_plan(state["chains"]) != search_plan(self.chains):
+            raise ValueError(f"{self.checkpoint} was written for a different search")
+        if seed and seed != state["seed"]:
+            raise ValueError(f"{self.checkpoint} was written for seed {state['seed']}")
+
+        self.seed = state["seed"]
+        self.workers = state["workers"]
+        self.positions = list(state["positions"])
+        self.resumed_attempts = state.get("attempts", 0)
+        if self.top is not None:
+            for record in state.get("top", []):
+                self.top.push(record)
+        for chain, count in state.get("found", {}).items():
+            if chain in self.found:
+                self.found[chain] = count
+
+    def is_split_key(self, chain):
+        """
+        Whether the chain runs in split-key mode (hits carry partial keys)
+        """
+        return self.key_name(chain) == "partial_key"
+
+    def key_name(self, chain):
+        """
+        Result field of the key the chain's hits carry (see key_field)
+        """
+        return next((key_field(options) for name, options in self.chains if name == chain), "private_key")
+
+    def checkpoint_state(self):
+        """
+        JSON-serialisable search plan and per-worker positions
+        """
+        positions = list(self._positions) if self._positions is not None else self.positions
+        state = {
+            "seed": self.seed,
+            "workers": self.workers,
+            "chains": search_plan(self.chains),
+            # 第 i 个工作进程第 j 条链（分片 i）最后尝试的偏移
+            "positions": positions,
+            "attempts": self.resumed_attempts + self.total_attempts(),
+            "found": dict(self.found),
+        }
+        if self.top is not None:
+            state["top"] = self.top.records()
+        return state
+
+    def save_checkpoint(self):
+        """
+        Write the checkpoint file now (no-op without a checkpoint path)
+        """
+        if self.checkpoint:
+            save_checkpoint(self.checkpoint, self.checkpoint_state())
+
+    def _checkpoint_loop(self):
+        while not self._checkpoint_stop.wait(CHECKPOINT_INTERVAL):
+            try:
+                self.save_checkpoint()
+            except OSError as e:
+                print(f"Checkpoint error: {str(e)}")
+
+    def is_running(self):
+        """
+        Whether any worker process is still alive
+        """
+        return any(process.is_alive() for process in self._processes)
+
+    def get_hits(self, timeout=None, limit=None):
+        """
+        Return the hits found so far as a list of Hit tuples
+
+        With a timeout, wait up to that many seconds for the first hit.
+        With a limit, stop draining once at least that many hits were
+        taken; the rest stay queued for the next call. Hits of a chain
+        that has already reached its target are dropped.
+        """
+        hits = []
+        if self._hit_queue is None:
+            return hits
+        try:
+            if timeout:
+                hits.extend(self._hit_queue.get(timeout=timeout))
+            while limit is None or len(hits) < limit:
+                hits.extend(self._hit_queue.get_nowait())
+        except (queue.Empty, OSError, ValueError):
+            pass
+        if self.top is not None:
+            return self._rank(hits)
+        finished = False
+        delivered = []
+        for hit in hits:
+            # 链达到目标后，仍在运行的批次和队列中的命中直接丢弃，最多交付 target 个
+            if self.finished(hit.chain):
+                continue
+            delivered.append(hit)
+            self.found[hit.chain] += 1
+            finished = finished or self.finished(hit.chain)
+        self.schedule(force=finished)
+        return delivered
+
+    def finished(self, chain):
+        """
+        Whether the chain has reached its target hit count
+        """
+        return bool(self.targets[chain]) and self.found[chain] >= self.targets[chain]
+
+    def is_done(self):
+        """
+        Whether every chain has a target and has reached it
+        """
+        return all(self.finished(chain) for chain, _ in self.chains)
+
+    def schedule(self, force=False):
+        """
+        Re-divide the workers between the chains (every SCHEDULE_INTERVAL, or now with force)
+
+        Each chain's remaining expected work is expected attempts per hit
+        x hits still wanted (1 without a target) x measured CPU-seconds
+        per attempt. The CPU fractions from scheduler.shares are turned
+        into per-worker time budgets and written to the shared assignment.
+        """
+        if self._assignment is None or self.top is not None:
+            return
+        now = time.time()
+        if not force and now < self._next_schedule:
+            return
+        self._next_schedule = now + SCHEDULE_INTERVAL
+
+        width = len(self.chains)
+        attempts = self.attempts()
+        work = {}
+        for slot, (chain, _) in enumerate(self.chains):
+            busy = sum(self._busy[index * width + slot] for index in range(self.workers))
+            cost = busy / attempts[chain] if attempts[chain] else None
+            if self.finished(chain):
+                work[chain] = 0
+            elif cost is None:
+                # 尚未测出速度时保持当前分配；必须重新分配时按不可估计的链平分
+                if not force:
+                    return
+                work[chain] = float("inf")
+            else:
+                remaining = self.targets[chain] - self.found[chain] if self.targets[chain] else 1
+                work[chain] = self.expected[chain] * remaining * cost
+
+        self.shares = shares(work, self.priorities)
+        plan = assign([self.shares[chain] for chain, _ in self.chains], self.workers)
+        self._assignment[:] = [seconds for row in plan for seconds in row]
+
+    def schedule_text(self):
+        """
+        CPU share of each chain, "done" for chains that reached their target
+        """
+        current = self.shares or {chain: 1 / len(self.chains) for chain, _ in self.chains}
+        return ", ".join(f"{chain} done" if self.finished(chain) else f"{chain} {current.get(chain, 0):.0%}"
+                         for chain, _ in self.chains)
+
+    def _rank(self, hits):
+        """
+        Offer scored hits to the top-K list; returns those that entered it
+        """
+        entered = [hit for hit in hits if self.top.push(self.hit_record(hit))]
+        if entered and self._score_threshold is not None:
+            self._score_threshold.value = self.top.threshold()
+        return entered
+
+    def hit_record(self, hit):
+        """
+        Result record of a hit, in the result journal's format
+        """
+        now = time.time()
+        record = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            "ts": round(now, 3),
+            "chain": hit.chain,
+            "address": hit.address,
+            self.key_name(hit.chain): hit.private_key,
+        }
+        if hit.patterns:
+            record["patterns"] = list(hit.patterns)
+        if hit.score is not None:
+            record["score"] = hit.score
+        return record
+
+    def top_records(self):
+        """
+        The current top-K records, best first (empty outside top-K mode)
+        """
+        return self.top.records() if self.top is not None else []
+
+    def export_top(self, path, fmt="txt"):
+        """
+        Atomically write the current top-K list while the search keeps running
+
+        fmt is "txt" or "jsonl" as for journal.export; returns the record count.
+        """
+        return write_records(path, self.top_records(), fmt)
+
+    def set_profiling(self, enabled):
+        """
+        Switch the workers' per-stage instrumentation on or off at runtime
+        """
+        self.profiling = bool(enabled)
+        if self._profiling is not None:
+            self._profiling.value = self.profiling
+        if self.profiling:
+            # 重新开启时从零开始统计
+            self._stage_stats = {}
+
+    def stage_stats(self):
+        """
+        Per-chain stage timings and counters reported by the workers so far
+
+        Only collected while profiling is on; see instrument.Instrumentation.
+        """
+        if self._stats_queue is not None:
+            try:
+                while True:
+                    chain, delta = self._stats_queue.get_nowait()
+                    merge(self._stage_stats.setdefault(chain, {}), delta)
+            except (queue.Empty, OSError, ValueError):
+                pass
+        return self._stage_stats
+
+    def stats_text(self):
+        """
+        One line per chain with its per-stage breakdown (empty when not profiling)
+        """
+        return "\n".join(f"{chain}: {format_breakdown(summary)}" for chain, summary in self.stage_stats().items())
+
+    def worker_attempts(self):
+        """
+        Attempt count per worker process, summed over its chains
+        """
+        if self._counts is None:
+            return [0] * self.workers
+        width = len(self.chains)
+        return [sum(self._counts[index * width:(index + 1) * width]) for index in range(self.workers)]
+
+    def attempts(self):
+        """
+        Attempt count per chain, summed over all workers
+        """
+        result = {chain: 0 for chain, _ in self.chains}
+        if self._counts is None:
+            return result
+        for index in range(self.workers):
+            for slot, (chain, _) in enumerate(self.chains):
+                result[chain] += self._counts[index * len(self.chains) + slot]
+        return result
+
+    def total_attempts(self):
+        """
+        Attempt count over all chains and workers
+        """
+        return sum(self.attempts().values())
+
+    def elapsed(self):
+        """
+        Seconds since the engine was started
+        """
+        if not self.start_time:
+            return 0
+        return (self.stop_time or time.time()) - self.start_time
+
+    def speed(self):
+        """
+        Average attempts per second since start
+        """
+        elapsed = self.elapsed()
+        return self.total_attempts() / elapsed if elapsed > 0 else 0
+
+    def chain_speeds(self):
+        """
+        Average attempts per second since start, per chain
+        """
+        elapsed = self.elapsed()
+        return {chain: (count / elapsed if elapsed > 0 else 0) for chain, count in self.attempts().items()}
+
+    def etas(self, probability=0.5):
+        """
+        Seconds until each chain finds a hit with the given probability at the measured rate
+        """
+        return {chain: eta(self.expected[chain], rate, probability) for chain, rate in self.chain_speeds().items()}
+
+    def eta_text(self):
+        """
+        One-line 50%/90% ETA summary for all chains (the top-K status in top-K mode)
+        """
+        if self.top is not None:
+            return f"top {len(self.top)}/{self.top.size}, score threshold {self.top.threshold():.1f} bits"
+        etas50 = self.etas(0.5)
+        etas90 = self.etas(0.9)
+        return ", ".join(f"{chain} done ({self.found[chain]}/{self.targets[chain]})" if self.finished(chain) else
+                         f"{chain} 50%: {format_duration(etas50[chain])} 90%: {format_duration(etas90[chain])}"
+                         for chain in etas50)
+
+    def infeasible_chains(self, max_seconds=DEFAULT_MAX_ETA):
+        """
+        Chains whose 90% ETA at the current rate exceeds max_seconds, as chain -> ETA
+        """
+        if self.top is not None or not self.total_attempts():
+            return {}
+        return {chain: value for chain, value in self.etas(0.9).items()
+                if value > max_seconds and not self.finished(chain)}
+
+
+def print_hit(hit):
+    """
+    Print a hit in the console format of the chain modules
+    """
+    print(f"\nFound matching address:")
+    print(f"Address: {hit.address}")
+    print(f"Private key: {hit.private_key}")
+    if hit.patterns:
+        print(f"Patterns: {', '.join(hit.patterns)}")
+    if hit.score is not None:
+        print(f"Score: {hit.score} bits")
+
+
+def run_console(chain, prefix="", suffix="", case_sensitive=False, workers=None, pattern_file=None):
+    """
+    Console search loop used by the chain modules' __main__ blocks
+    """
+    options = {"prefix": prefix, "suffix": suffix, "case_sensitive": case_sensitive}
+    if pattern_file:
+        options["pattern_file"] = pattern_file
+    engine = SearchEngine({chain: options}, workers=workers)
+
+    print(f"Starting {chain} address generation on {engine.workers} processes...")
+    print(f"Expected attempts per hit: {engine.expected[chain]:.3g}")
+    engine.start()
+    warned = False
+
+    try:
+        while engine.is_running():
+            for hit in engine.get_hits(timeout=1):
+                print_hit(hit)
+
+            print(f"\rTried: {engine.total_attempts()}, Speed: {engine.speed():.2f}/s, {engine.eta_text()}", end="")
+
+            if not warned and engine.elapsed() > WARMUP_SECONDS:
+                warned = True
+                for name, value in engine.infeasible_chains().items():
+                    print(f"\nWarning: {name} pattern is infeasible at the current speed (90% ETA {format_duration(value)})")
+
+    except KeyboardInterrupt:
+        print("\n\nStopped")
+
+    for hit in engine.stop():
+        print_hit(hit)
+
+    print(f"Total: {engine.total_attempts()}, Average speed: {engine.speed():.2f}/s")
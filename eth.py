@@ -1,102 +1,316 @@
-import os
-import random
-import binascii
-import time
-from eth_account import Account
-from hexer import is_valid_pattern
-
-class ETH:
-    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None):
-        """
-        Initialize ETH class
-        """
-        self.prefix = prefix
-        self.suffix = suffix
-        self.case_sensitive = case_sensitive
-        self.on_found_callback = on_found_callback
-        
-    def generate_wallet(self):
-        """
-        Generate a random ETH wallet
-        """
-        try:
-            # 启用本地账户功能
-            Account.enable_unaudited_hdwallet_features()
-            
-            # 生成随机私钥
-            private_key = '0x' + ''.join(random.choice('0123456789abcdef') for _ in range(64))
-            
-            # 从私钥生成账户
-            account = Account.from_key(private_key)
-            
-            # 提取地址，去掉前缀"0x"
-            address = account.address[2:]
-            
-            if self.is_vanity_address(address):
-                # 如果符合靓号条件，回调处理
-                private_key_raw = private_key[2:]  # 移除0x前缀
-                
-                if self.on_found_callback:
-                    self.on_found_callback(address, private_key_raw)
-                    
-                return (address, private_key_raw)
-                
-            return None
-            
-        except Exception as e:
-            print(f"ETH wallet generation error: {str(e)}")
-            return None
-        
-    def is_vanity_address(self, address):
-        """
-        Check if address matches vanity criteria
-        """
-        # 检查前缀
-        if self.prefix:
-            check_prefix = address[:len(self.prefix)]
-            if self.case_sensitive:
-                if check_prefix != self.prefix:
-                    return False
-            else:
-                if check_prefix.lower() != self.prefix.lower():
-                    return False
-                
-        # 检查后缀
-        if self.suffix:
-            check_suffix = address[-len(self.suffix):]
-            if self.case_sensitive:
-                if check_suffix != self.suffix:
-                    return False
-            else:
-                if check_suffix.lower() != self.suffix.lower():
-                    return False
-                
-        return True
-
-if __name__ == "__main__":
-    # 测试代码
-    eth = ETH(prefix="88", suffix="88")
-    
-    print("Starting ETH address generation...")
-    start_time = time.time()
-    count = 0
-    
-    try:
-        while True:
-            result = eth.generate_wallet()
-            count += 1
-            
-            if result:
-                address, private_key = result
-                print(f"\nFound matching address:")
-                print(f"Address: {address}")
-                print(f"Private key: {private_key}")
-                
-            if count % 100 == 0:
-                elapsed = time.time() - start_time
-                print(f"\rTried: {count}, Speed: {count/elapsed:.2f}/s", end="")
-                
-    except KeyboardInterrupt:
-        print("\n\nStopped")
-        elapsed = time.time() - start_time
-        print(f"Total: {count}, Average speed: {count/elapsed:.2f}/s") 
\ No newline at end of file
+import sys
+import secrets
+from time import perf_counter
+
+import backends
+import keccak
+from generator import KeyWalkGenerator, VanityGenerator
+from keysource import default_source
+from keyspace import shard_salt
+from patternset import HexPatternSet
+from scoring import score_text
+from wildcard import hex_matcher, text_matcher
+
+def checksum_hash(address_bytes):
+    """
+    EIP-55 checksum hash: keccak256 of the lower-case hex address
+    """
+    return backends.get("keccak")(address_bytes.hex().encode())
+
+def checksum_address(address_bytes):
+    """
+    EIP-55 mixed-case hex of a 20-byte address, without 0x
+    """
+    text = address_bytes.hex()
+    digest = checksum_hash(address_bytes).hex()
+    # 校验和哈希对应半字节 >= 8 的字母大写
+    return "".join(char.upper() if nibble in "89abcdef" else char for char, nibble in zip(text, digest))
+
+def parse_hex(text, length, name):
+    """
+    Bytes of a 0x-optional hex string of exactly ``length`` bytes; ValueError otherwise
+    """
+    try:
+        value = bytes.fromhex(text[2:] if text.lower().startswith("0x") else text)
+    except (ValueError, AttributeError):
+        raise ValueError(f"{name} is not hex: {text!r}") from None
+    if len(value) != length:
+        raise ValueError(f"{name} must be {length} bytes, got {len(value)}")
+    return value
+
+def rlp_nonce(nonce):
+    """
+    RLP encoding of a non-negative integer
+    """
+    if nonce == 0:
+        return b"\x80"
+    if nonce < 0x80:
+        return bytes([nonce])
+    data = nonce.to_bytes((nonce.bit_length() + 7) // 8, "big")
+    return bytes([0x80 + len(data)]) + data
+
+def create_address(deployer, nonce):
+    """
+    20-byte address of the contract created by ``deployer`` with ``nonce`` (CREATE)
+    """
+    # keccak256(rlp([deployer, nonce]))，列表总长不超过 55 字节
+    payload = b"\x94" + deployer + rlp_nonce(nonce)
+    return backends.get("keccak")(bytes([0xC0 + len(payload)]) + payload)[12:]
+
+def create2_address(deployer, salt, init_code_hash):
+    """
+    20-byte address of the contract created by ``deployer`` with ``salt`` and ``init_code_hash`` (CREATE2)
+    """
+    return backends.get("keccak")(b"\xff" + deployer + salt + init_code_hash)[12:]
+
+def check_contract_options(chain, options, workers):
+    """
+    Validate contract-address search options; ValueError on bad input
+    """
+    if chain != "ETH":
+        raise ValueError(f"Contract-address mode is not supported for {chain}")
+    parse_hex(options["deployer"], 20, "deployer")
+    if options.get("init_code_hash"):
+        parse_hex(options["init_code_hash"], 32, "init_code_hash")
+    elif workers > 1:
+        # CREATE 只有一条从 nonce 起的序列，多个分片会重复搜索
+        raise ValueError("CREATE mode scans a single nonce sequence; use one worker or give init_code_hash")
+    if options.get("public_key"):
+        raise ValueError("Contract-address mode cannot be combined with split-key mode")
+
+class ETH(KeyWalkGenerator):
+    chain = "ETH"
+    encode_address = staticmethod(checksum_address)
+    
+    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None, walk=False,
+                 batch_size=1, patterns=None, seed=None, shard=0, offset=0, public_key=None, score=False):
+        """
+        Initialize ETH class
+        
+        walk: 顺序遍历模式，从一个随机私钥 k 出发依次尝试 k+1, k+2, ...
+        batch_size: generate_batch 每批尝试的数量，顺序遍历模式下整批共享一次模逆
+        patterns: 多规则模式，规则列表（"前缀*后缀"），一次检查匹配全部规则
+        seed/shard/offset: 确定性分片遍历（见 keyspace），从该分片的 offset 之后继续，隐含顺序遍历模式
+        public_key: 拆分私钥模式，遍历 P + k*G，命中时报告的是部分私钥 k（见 splitkey），隐含顺序遍历模式
+        score: 评分模式，忽略前后缀，上报高于阈值的地址及其分数（见 scoring）
+        """
+        super().__init__(prefix, suffix, case_sensitive, on_found_callback, batch_size,
+                         walk, seed, shard, offset, public_key, score)
+        self.build_matchers(prefix, suffix, case_sensitive, patterns)
+        
+        # 非顺序遍历模式下使用启动时选出的最快 secp256k1 实现（见 backends）
+        self.public_key = backends.get("secp256k1") if self.walker is None else None
+        
+    def build_matchers(self, prefix, suffix, case_sensitive, patterns):
+        """
+        Precompile the matchers for raw addresses and address strings
+        """
+        # 十六进制半字节掩码用于原始地址字节，文本匹配用于字符串地址；
+        # 含通配符的规则（见 wildcard）先按固定位置的半字节粗筛，再做完整检查
+        self.matcher = hex_matcher(prefix, suffix, case_sensitive, checksum_hash)
+        self.text_matcher = text_matcher(prefix, suffix, case_sensitive, alphabet="0123456789abcdefABCDEF")
+        self.pattern_set = HexPatternSet(patterns, case_sensitive, checksum_hash) if patterns else None
+        
+    def generate_wallet(self):
+        """
+        Generate a random ETH wallet
+        """
+        if self.walker:
+            return super().generate_wallet()
+        
+        try:
+            # 从共享的批量随机源取私钥
+            private_key = default_source().take_int()
+            
+            # 地址为公钥 keccak256 的后20字节
+            address_bytes = self.keccak(self.public_key(private_key))[12:]
+            
+            matched = self.is_vanity_bytes(address_bytes)
+            if matched:
+                # 只为命中的地址生成字符串
+                return self.report_found(checksum_address(address_bytes), format(private_key, "064x"), matched)
+                
+            return None
+            
+        except Exception as e:
+            self.report_error(e)
+            return None
+        
+    def generate_batch(self):
+        """
+        Try batch_size candidates and return the list of matching wallets
+        """
+        if not self.walker:
+            return VanityGenerator.generate_batch(self)
+        return super().generate_batch()
+        
+    def is_vanity_address(self, address):
+        """
+        Check if address matches vanity criteria
+        
+        多规则模式下返回匹配到的规则列表
+        """
+        if self.pattern_set:
+            return self.pattern_set.match(address)
+        return self.text_matcher.match(address)
+        
+    def is_vanity_bytes(self, address_bytes):
+        """
+        Check a raw 20-byte address without building its hex string
+        """
+        if self.pattern_set:
+            return self.pattern_set.match_bytes(address_bytes)
+        if not self.matcher.match_bytes(address_bytes):
+            return False
+        if self.case_sensitive:
+            # 先按不区分大小写的半字节粗筛，只对通过的地址计算 EIP-55 校验和
+            return self.matcher.match_checksum(checksum_hash(address_bytes))
+        return True
+        
+    def address_score(self, address_bytes):
+        """
+        Score of a raw 20-byte address on its lower-case hex (leading zeros count twice)
+        """
+        return score_text(address_bytes.hex(), 16, zero="0")
+
+class ContractETH(ETH):
+    """
+    Vanity contract addresses of a deployer: CREATE2 salts or CREATE nonces
+
+    No elliptic-curve math is involved. With init_code_hash the search
+    walks salts and the address is keccak256(0xff ++ deployer ++ salt ++
+    init_code_hash)[12:]; hits report the salt as 0x-hex. Without it the
+    search walks the deployer's nonces from ``nonce`` and hits report the
+    nonce.
+
+    Salt offset i of a shard is the shard's 256-bit base salt with i added
+    to its low 64 bits (see keyspace.shard_salt). When numpy is installed,
+    batches of salts are hashed together by the vectorized keccak-f[1600]
+    (see keccak) and pre-filtered on the pattern's fixed nibbles as a
+    whole array; only the survivors go through the full check.
+    """
+    
+    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None, deployer=None,
+                 init_code_hash=None, nonce=0, batch_size=1, patterns=None, seed=None, shard=0, offset=0,
+                 score=False):
+        """
+        deployer: 部署合约的地址（工厂合约或外部账户）
+        init_code_hash: CREATE2 初始化代码的 keccak256；不提供时按 CREATE 搜索 nonce
+        nonce: CREATE 模式的起始 nonce
+        其余参数同 ETH
+        """
+        VanityGenerator.__init__(self, prefix, suffix, case_sensitive, on_found_callback, batch_size, score)
+        self.build_matchers(prefix, suffix, case_sensitive, patterns)
+        self.keccak = backends.get("keccak")
+        self.deployer = parse_hex(deployer, 20, "deployer")
+        self.init_code_hash = parse_hex(init_code_hash, 32, "init_code_hash") if init_code_hash else None
+        self.offset = offset
+        if self.init_code_hash:
+            base = shard_salt(seed, shard) if seed is not None else secrets.randbits(256)
+            self.salt_high = (base >> 64).to_bytes(24, "big")
+            self.salt_low = base & (2 ** 64 - 1)
+        else:
+            self.nonce = nonce
+        # 批量模式：numpy 可用时整批向量化计算哈希与粗筛
+        self.vectorized = self.init_code_hash is not None and keccak.available()
+        if self.vectorized:
+            import numpy as np
+            self.template = np.frombuffer(b"\xff" + self.deployer + self.salt_high + bytes(8) + self.init_code_hash,
+                                          dtype=np.uint8)
+            # 不区分大小写的固定半字节；多规则与评分模式没有统一的掩码，不做粗筛
+            mask = 0 if self.pattern_set or self.scoring else self.matcher.mask
+            self.nibble_mask = np.frombuffer(mask.to_bytes(20, "big"), dtype=np.uint8) if mask else None
+            self.nibble_value = np.frombuffer(self.matcher.value.to_bytes(20, "big"), dtype=np.uint8)
+        
+    def position(self):
+        """
+        Offset of the last salt/nonce tried
+        """
+        return self.offset
+        
+    def salt(self, offset):
+        """
+        The 32-byte salt at an offset of this shard
+        """
+        return self.salt_high + ((self.salt_low + offset) % 2 ** 64).to_bytes(8, "big")
+        
+    def generate_wallet(self):
+        """
+        Try the next salt (CREATE2) or nonce (CREATE)
+        """
+        try:
+            self.offset += 1
+            if self.init_code_hash:
+                salt = self.salt(self.offset)
+                address_bytes = self.keccak(b"\xff" + self.deployer + salt + self.init_code_hash)[12:]
+                key = "0x" + salt.hex()
+            else:
+                nonce = self.nonce + self.offset - 1
+                address_bytes = create_address(self.deployer, nonce)
+                key = str(nonce)
+            
+            matched = self.is_vanity_bytes(address_bytes)
+            if matched:
+                return self.report_found(checksum_address(address_bytes), key, matched)
+            return None
+            
+        except Exception as e:
+            self.report_error(e)
+            return None
+        
+    def generate_batch(self):
+        """
+        Try the next batch_size salts/nonces and return the list of matching contract addresses
+        """
+        if not self.vectorized:
+            return VanityGenerator.generate_batch(self)
+        
+        import numpy as np
+        stats = self.stats
+        timed = stats.sampling()
+        try:
+            if timed:
+                start = perf_counter()
+            count = self.batch_size
+            first = self.offset + 1
+            messages = np.tile(self.template, (count, 1))
+            # 盐值低 64 位 = 分片基准低 64 位 + 偏移（按 2^64 回绕），大端写入
+            counters = np.arange(first, first + count, dtype=np.uint64) + np.uint64(self.salt_low)
+            messages[:, 45:53] = counters.astype(">u8").view(np.uint8).reshape(count, 8)
+            addresses = keccak.keccak256_batch(messages)[:, 12:]
+            self.offset += count
+            if timed:
+                hash_done = perf_counter()
+                stats.add_time("hash", hash_done - start, count)
+            
+            if self.nibble_mask is not None:
+                # 整批按固定半字节粗筛，只有少量地址进入完整检查
+                candidates = np.flatnonzero(~((addresses & self.nibble_mask) ^ self.nibble_value).any(axis=1))
+            else:
+                candidates = range(count)
+            found = []
+            for index in candidates:
+                address_bytes = addresses[index].tobytes()
+                matched = self.is_vanity_bytes(address_bytes)
+                if matched:
+                    address = stats.timed("encode", checksum_address, address_bytes)
+                    key = "0x" + self.salt(first + int(index)).hex()
+                    found.append(self.report_found(address, key, matched))
+            if timed:
+                stats.add_time("match", perf_counter() - hash_done, count)
+            
+            stats.count("attempts", count)
+            stats.count("hits", len(found))
+            return found
+            
+        except Exception as e:
+            self.report_error(e)
+            return []
+
+if __name__ == "__main__":
+    from engine import run_console
+
+    # 可选参数：多规则模式的规则文件
+    pattern_file = sys.argv[1] if len(sys.argv) > 1 else None
+
+    run_console("ETH", prefix="88", suffix="88", pattern_file=pattern_file)
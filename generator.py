@@ -0,0 +1,209 @@
+from time import perf_counter
+
+import backends
+from instrument import Instrumentation
+from keyspace import shard_base_key
+from scoring import SCORE_FLOOR
+from secp256k1 import KeyWalker, public_key_bytes
+
+
+class VanityGenerator:
+    """
+    Common part of the chain generators
+
+    A subclass sets ``chain``, builds ``self.matcher`` (and
+    ``self.pattern_set`` in pattern-set mode) after calling this
+    __init__, and implements generate_wallet(), is_vanity_bytes() and
+    address_score().
+
+    With score=True (top-K mode, see scoring) the pattern is ignored:
+    is_vanity_bytes is replaced by score_filter, which passes candidates
+    scoring above ``threshold`` and reports them with their score.
+    """
+
+    chain = None
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None, batch_size=1,
+                 score=False):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case_sensitive = case_sensitive
+        self.on_found_callback = on_found_callback
+        self.batch_size = batch_size
+        self.matcher = None
+        self.pattern_set = None
+        self.stats = Instrumentation()
+        self.scoring = score
+        # 评分模式下只上报高于该分数的地址，由工作进程按全局榜单更新
+        self.threshold = SCORE_FLOOR
+        if score:
+            # 实例属性覆盖方法，普通模式的匹配路径没有额外开销
+            self.is_vanity_bytes = self.score_filter
+
+    def position(self):
+        """
+        Offset of the last candidate tried in a deterministic search (None for random candidates)
+        """
+        return None
+
+    def generate_wallet(self):
+        """
+        Try one candidate; the (address, private_key) of a hit or None
+        """
+        raise NotImplementedError
+
+    def generate_batch(self):
+        """
+        Try batch_size candidates and return the list of matching wallets
+        """
+        results = (self.generate_wallet() for _ in range(self.batch_size))
+        found = [result for result in results if result]
+        self.stats.count("attempts", self.batch_size)
+        self.stats.count("hits", len(found))
+        return found
+
+    def report_found(self, address, private_key, matched):
+        """
+        Invoke the callback for a hit; in pattern-set mode also pass the matched patterns,
+        in score mode the score
+        """
+        if self.on_found_callback:
+            if self.scoring:
+                self.stats.timed("callback", self.on_found_callback, address, private_key, None, matched)
+            elif self.pattern_set:
+                self.stats.timed("callback", self.on_found_callback, address, private_key, matched)
+            else:
+                self.stats.timed("callback", self.on_found_callback, address, private_key)
+        return (address, private_key)
+
+    def report_error(self, error):
+        self.stats.count("errors")
+        print(f"{self.chain} wallet generation error: {error}")
+
+    def is_vanity_address(self, address):
+        """
+        Check if address matches vanity criteria
+
+        In pattern-set mode returns the list of matched patterns.
+        """
+        if self.pattern_set:
+            return self.pattern_set.match(address)
+        return self.matcher.match(address)
+
+    def is_vanity_bytes(self, address_bytes):
+        """
+        Check a raw address/public key without encoding it
+        """
+        raise NotImplementedError
+
+    def address_score(self, address_bytes):
+        """
+        Score in bits of a raw address/public key (see scoring)
+        """
+        raise NotImplementedError
+
+    def score_filter(self, address_bytes):
+        """
+        The candidate's score if it beats the current threshold, else 0
+        """
+        score = self.address_score(address_bytes)
+        return score if score > self.threshold else 0
+
+
+class KeyWalkGenerator(VanityGenerator):
+    """
+    secp256k1/keccak chains (ETH, TRX): address = keccak256(public key)[12:]
+
+    Candidates come from a sequential KeyWalker whose batches share one
+    field inversion. seed/shard/offset start the walk at a deterministic
+    shard position (see keyspace); public_key walks P + k*G and reports
+    the partial key k (split-key mode, see splitkey). Without walk, seed
+    or public_key there is no walker and the subclass generates random
+    keys itself. Subclasses set encode_address (a static function of
+    the 20-byte account hash).
+    """
+
+    # 20字节账户哈希 -> 地址字符串
+    encode_address = None
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None, batch_size=1,
+                 walk=True, seed=None, shard=0, offset=0, public_key=None, score=False):
+        super().__init__(prefix, suffix, case_sensitive, on_found_callback, batch_size, score)
+        base_point = None
+        if public_key:
+            from splitkey import load_public_key
+            base_point = load_public_key(public_key)
+        if seed is not None:
+            self.walker = KeyWalker(shard_base_key(seed, self.chain, shard), offset, base_point)
+        else:
+            self.walker = KeyWalker(base_point=base_point) if walk or base_point else None
+        # 启动时选出的最快 keccak 实现（见 backends）
+        self.keccak = backends.get("keccak")
+
+    def position(self):
+        """
+        Offset of the last candidate tried in the key walk (None without a walk)
+        """
+        return self.walker.offset if self.walker else None
+
+    def generate_wallet(self):
+        """
+        Try the next key of the walk
+        """
+        try:
+            # 公钥加 G 得到下一个私钥对应的公钥
+            self.walker.step()
+            address_bytes = self.keccak(self.walker.public_key_bytes())[12:]
+
+            matched = self.is_vanity_bytes(address_bytes)
+            if matched:
+                # 只为命中的地址生成字符串；私钥 = 起点私钥 + 偏移
+                address = self.encode_address(address_bytes)
+                return self.report_found(address, format(self.walker.private_key(), "064x"), matched)
+
+            return None
+
+        except Exception as e:
+            self.report_error(e)
+            return None
+
+    def generate_batch(self):
+        """
+        Try the next batch_size keys of the walk and return the list of matching wallets
+        """
+        stats = self.stats
+        # 抽样批次分阶段计时，关闭时只有一次属性检查
+        timed = stats.sampling()
+        try:
+            if timed:
+                start = perf_counter()
+            start_offset = self.walker.offset
+            points = self.walker.step_batch(self.batch_size)
+            if timed:
+                keygen_done = perf_counter()
+                stats.add_time("keygen", keygen_done - start, len(points))
+
+            keccak = self.keccak
+            addresses = [keccak(public_key_bytes(point))[12:] for point in points]
+            if timed:
+                hash_done = perf_counter()
+                stats.add_time("hash", hash_done - keygen_done, len(points))
+
+            found = []
+            for index, address_bytes in enumerate(addresses, 1):
+                # 匹配阶段包含校验和计算
+                matched = self.is_vanity_bytes(address_bytes)
+                if matched:
+                    address = stats.timed("encode", self.encode_address, address_bytes)
+                    private_key = format(self.walker.private_key(start_offset + index), "064x")
+                    found.append(self.report_found(address, private_key, matched))
+            if timed:
+                stats.add_time("match", perf_counter() - hash_done, len(points))
+
+            stats.count("attempts", len(points))
+            stats.count("hits", len(found))
+            return found
+
+        except Exception as e:
+            self.report_error(e)
+            return []
@@ -1,46 +1,32 @@
-import random
-import time
-import os
-import json
-from datetime import datetime
+from functools import lru_cache
+from journal import get_journal
+from keysource import random_key_hex
+from wildcard import text_matcher
 
 def mHash():
     """
     生成一个64字符长度的随机十六进制字符串，用作私钥
+
+    取自系统密码学随机源的批量缓冲区，保证是合法的 secp256k1 私钥
     """
-    hex_chars = '0123456789abcdef'
-    return ''.join(random.choice(hex_chars) for _ in range(64))
+    return random_key_hex()
 
-def save_result(chain, privkey, address):
-    """将找到的靓号保存到本地文件"""
-    try:
-        os.makedirs("results", exist_ok=True)
-        
-        result_file = os.path.join("results", f"{chain}_wallet_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        
-        with open(result_file, "w") as f:
-            f.write(f"Chain: {chain}\n")
-            f.write(f"Private Key: {privkey}\n")
-            f.write(f"Address: {address}\n")
-            f.write(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        
-        return result_file
-    except Exception:
-        return None
+def save_result(chain, privkey, address, patterns=None, key_name="private_key"):
+    """
+    将找到的靓号追加到本地结果日志（results/journal-*.jsonl）
 
-def is_valid_pattern(address, prefix="", suffix="", case_sensitive=False):
-    """检查地址是否符合指定的模式"""
-    if not case_sensitive:
-        address = address.lower()
-        prefix = prefix.lower()
-        suffix = suffix.lower()
-    
-    if prefix and not address.startswith(prefix):
-        return False
-    
-    if suffix and not address.endswith(suffix):
-        return False
-    
-    return True
+    由后台线程成组写入，返回当前日志分段的路径；写入失败时抛出 OSError。
+    key_name 为保存 privkey 的字段名：拆分私钥模式为 partial_key，合约地址模式为 salt/nonce
+    """
+    journal = get_journal()
+    journal.append(chain, address, privkey, patterns, key_name)
+    return journal.path
 
+@lru_cache(maxsize=64)
+def _compile_pattern(prefix, suffix, case_sensitive):
+    """编译并缓存匹配规则（支持 ?、[...]、{n}、(x)/\\1 通配符，见 wildcard）"""
+    return text_matcher(prefix, suffix, case_sensitive)
 
+def is_valid_pattern(address, prefix="", suffix="", case_sensitive=False):
+    """检查地址是否符合指定的模式"""
+    return _compile_pattern(prefix, suffix, case_sensitive).match(address)
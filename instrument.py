@@ -0,0 +1,92 @@
+import time
+
+# 流水线各阶段：密钥生成(含公钥推导)、哈希、匹配、地址编码、命中回调
+STAGES = ("keygen", "hash", "match", "encode", "callback")
+
+# 开启时每隔多少批计时一次
+SAMPLE_EVERY = 8
+
+
+class Instrumentation:
+    """
+    Low-overhead per-stage timers and counters for a wallet generator
+
+    Counters (attempts, hits, errors) are bumped once per batch or per
+    rare event. Stage timers only run when ``enabled`` is set, and then
+    only on every ``sample_every``-th batch, so the disabled cost is one
+    attribute check per batch. take() returns and resets the accumulated
+    delta so it can be shipped from a worker process and merged.
+    """
+
+    def __init__(self, enabled=False, sample_every=SAMPLE_EVERY):
+        self.enabled = enabled
+        self.sample_every = sample_every
+        self._batches = 0
+        self.reset()
+
+    def reset(self):
+        self.counters = {"attempts": 0, "hits": 0, "errors": 0}
+        self.times = {}
+        self.items = {}
+
+    def sampling(self):
+        """
+        Whether the current batch should be timed
+        """
+        if not self.enabled:
+            return False
+        self._batches += 1
+        return self._batches % self.sample_every == 0
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, stage, seconds, items=1):
+        """
+        Record that `items` candidates spent `seconds` in a stage
+        """
+        self.times[stage] = self.times.get(stage, 0.0) + seconds
+        self.items[stage] = self.items.get(stage, 0) + items
+
+    def timed(self, stage, function, *args):
+        """
+        Call function(*args), timing it as one item of stage when enabled
+        """
+        if not self.enabled:
+            return function(*args)
+        start = time.perf_counter()
+        result = function(*args)
+        self.add_time(stage, time.perf_counter() - start)
+        return result
+
+    def take(self):
+        """
+        Return the accumulated counters/timings and start over
+        """
+        delta = {"counters": self.counters, "times": self.times, "items": self.items}
+        self.reset()
+        return delta
+
+
+def merge(total, delta):
+    """
+    Add a take() delta into an aggregate of the same shape
+    """
+    for key in ("counters", "times", "items"):
+        target = total.setdefault(key, {})
+        for name, value in delta.get(key, {}).items():
+            target[name] = target.get(name, 0) + value
+    return total
+
+
+def format_breakdown(summary):
+    """
+    One-line per-stage breakdown: average microseconds per candidate and counters
+    """
+    times = summary.get("times", {})
+    items = summary.get("items", {})
+    parts = [f"{stage} {times[stage] / items[stage] * 1e6:.2f}us"
+             for stage in STAGES if items.get(stage)]
+    counters = summary.get("counters", {})
+    parts += [f"{name}={counters.get(name, 0)}" for name in ("attempts", "hits", "errors")]
+    return " ".join(parts)
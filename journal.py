@@ -0,0 +1,310 @@
+import os
+import json
+import time
+import glob
+import queue
+import atexit
+import threading
+
+RESULTS_DIR = "results"
+
+# 单个日志分段的最大字节数，超过后切换到新分段
+MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# 后台写入线程两次 fsync 之间的最长间隔（秒）
+FSYNC_INTERVAL = 1.0
+
+INDEX_FILE = "journal.index.json"
+SEGMENT_PATTERN = "journal-{:06d}.jsonl"
+
+# 写入队列中的控制消息：立即同步 / 关闭
+_SYNC = "sync"
+_CLOSE = "close"
+
+
+def segment_name(number):
+    return SEGMENT_PATTERN.format(number)
+
+
+def _scan_segment(path):
+    """
+    Rebuild the index entry of a segment from its contents
+    """
+    entry = {"file": os.path.basename(path), "records": 0, "bytes": os.path.getsize(path),
+             "first_time": None, "last_time": None}
+    for record in _read_segment(path):
+        entry["records"] += 1
+        entry["first_time"] = entry["first_time"] or record.get("time")
+        entry["last_time"] = record.get("time")
+    return entry
+
+
+def _read_segment(path):
+    """
+    Yield the records of one segment; a torn last line (crash mid-write) is skipped
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def load_index(directory=RESULTS_DIR):
+    """
+    Segment list of a journal directory, oldest first
+
+    Falls back to scanning the segment files when the index is missing
+    or unreadable, so a crash between a write and an index update only
+    costs a rescan.
+    """
+    path = os.path.join(directory, INDEX_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        segments = index["segments"]
+        if all(os.path.exists(os.path.join(directory, entry["file"])) for entry in segments):
+            return segments
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    files = sorted(glob.glob(os.path.join(directory, SEGMENT_PATTERN.replace("{:06d}", "*"))))
+    return [_scan_segment(file) for file in files]
+
+
+def read_records(directory=RESULTS_DIR, chain=None, since=None):
+    """
+    Stream the journal records (dicts) in write order
+
+    chain: only records of this chain; since: only records with ts >= since.
+    """
+    for entry in load_index(directory):
+        path = os.path.join(directory, entry["file"])
+        if not os.path.exists(path):
+            continue
+        for record in _read_segment(path):
+            if chain and record.get("chain") != chain:
+                continue
+            if since and record.get("ts", 0) < since:
+                continue
+            yield record
+
+
+def format_record(record):
+    """
+    Text block for one record, in the format shown in the UI result panel
+    """
+    if "partial_key" in record:
+        key = f"部分私钥: {record['partial_key']}（需用 splitkey.py combine 合成）"
+    elif "salt" in record:
+        key = f"CREATE2 盐值: {record['salt']}"
+    elif "nonce" in record:
+        key = f"CREATE nonce: {record['nonce']}"
+    else:
+        key = f"私钥: {record['private_key']}"
+    text = f"找到 {record['chain']} 靓号:\n地址: {record['address']}\n{key}\n"
+    if record.get("patterns"):
+        text += f"匹配规则: {', '.join(record['patterns'])}\n"
+    if "score" in record:
+        text += f"评分: {record['score']} 位\n"
+    return text + f"时间: {record['time']}\n"
+
+
+def write_records(path, records, fmt="txt"):
+    """
+    Write records to a text ("txt") or JSON lines ("jsonl") file
+
+    The file is written under a temporary name and then replaced, so it
+    can be rewritten while readers have the old version open. Returns
+    the number of records written.
+    """
+    count = 0
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        for record in records:
+            if fmt == "jsonl":
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                f.write(format_record(record) + "\n")
+            count += 1
+    os.replace(path + ".tmp", path)
+    return count
+
+
+def export(path, directory=RESULTS_DIR, fmt="txt", **filters):
+    """
+    Stream the journal into a text ("txt") or JSON lines ("jsonl") file
+
+    Returns the number of records written.
+    """
+    return write_records(path, read_records(directory, **filters), fmt)
+
+
+class ResultJournal:
+    """
+    Append-only JSON lines journal of found wallets
+
+    append() only enqueues the record; a background thread writes
+    everything that is queued in one write, fsyncs at most every
+    FSYNC_INTERVAL seconds (and on flush/close), and rolls over to a new
+    segment once the current one exceeds max_segment_bytes. The index
+    file lists the segments with their record counts and time range.
+    Write errors are kept and raised from the next append/flush.
+    """
+
+    def __init__(self, directory=RESULTS_DIR, max_segment_bytes=MAX_SEGMENT_BYTES, fsync_interval=FSYNC_INTERVAL):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync_interval = fsync_interval
+        os.makedirs(directory, exist_ok=True)
+
+        self.segments = load_index(directory)
+        if not self.segments or self.segments[-1]["bytes"] >= max_segment_bytes:
+            self.segments.append(self._new_entry(len(self.segments) + 1))
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._write_index()
+
+        self._queue = queue.Queue()
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer, name="result-journal", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _new_entry(number):
+        return {"file": segment_name(number), "records": 0, "bytes": 0, "first_time": None, "last_time": None}
+
+    @property
+    def path(self):
+        """
+        File of the segment currently being written
+        """
+        return os.path.join(self.directory, self.segments[-1]["file"])
+
+    def append(self, chain, address, private_key, patterns=None, key_name="private_key"):
+        """
+        Queue a hit for writing; returns the record
+
+        key_name is the field the key is stored under: "partial_key" for a
+        split-key partial key (see splitkey), "salt"/"nonce" for contract
+        addresses (see eth.ContractETH).
+        """
+        self._check()
+        if self._closed:
+            raise ValueError("result journal is closed")
+        now = time.time()
+        record = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            "ts": round(now, 3),
+            "chain": chain,
+            "address": address,
+            key_name: private_key,
+        }
+        if patterns:
+            record["patterns"] = list(patterns)
+        self._queue.put(record)
+        return record
+
+    def flush(self):
+        """
+        Block until every queued record is written and synced to disk
+        """
+        if not self._closed:
+            self._queue.put(_SYNC)
+            self._queue.join()
+        self._check()
+
+    def close(self):
+        """
+        Write the remaining records, sync and stop the writer thread
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._file.close()
+        self._check()
+
+    def _check(self):
+        if self._error is not None:
+            raise OSError(f"result journal write failed: {self._error}")
+
+    def _writer(self):
+        last_sync = time.time()
+        dirty = False
+        stopping = False
+        while not stopping:
+            # 有待同步数据时最多等到下一次 fsync
+            timeout = max(0.0, last_sync + self.fsync_interval - time.time()) if dirty else None
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [item for item in batch if isinstance(item, dict)]
+            stopping = _CLOSE in batch
+            try:
+                if records:
+                    self._write(records)
+                    dirty = True
+                # 成组提交：到期、flush 或关闭时才同步到磁盘
+                if dirty and (stopping or _SYNC in batch or time.time() - last_sync >= self.fsync_interval):
+                    self._sync()
+                    dirty = False
+                    last_sync = time.time()
+            except OSError as e:
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, records):
+        entry = self.segments[-1]
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self._file.write(data)
+        entry["records"] += len(records)
+        entry["bytes"] += len(data.encode("utf-8"))
+        entry["first_time"] = entry["first_time"] or records[0]["time"]
+        entry["last_time"] = records[-1]["time"]
+
+        if entry["bytes"] >= self.max_segment_bytes:
+            self._sync()
+            self._file.close()
+            self.segments.append(self._new_entry(len(self.segments) + 1))
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._write_index()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._write_index()
+
+    def _write_index(self):
+        # 先写临时文件再替换，避免索引被写坏
+        path = os.path.join(self.directory, INDEX_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "segments": self.segments}, f, indent=1)
+        os.replace(path + ".tmp", path)
+
+
+_default_journal = None
+_default_lock = threading.Lock()
+
+
+def get_journal(directory=RESULTS_DIR):
+    """
+    Process-wide journal for the results directory, closed at exit
+    """
+    global _default_journal
+    with _default_lock:
+        if _default_journal is None or _default_journal._closed:
+            _default_journal = ResultJournal(directory)
+            atexit.register(_default_journal.close)
+        return _default_journal
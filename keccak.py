@@ -0,0 +1,126 @@
+try:
+    import numpy as np
+except ImportError:
+    # numpy 是可选依赖：缺少时批量接口不可用，调用方退回逐个计算的 keccak（见 backends）
+    np = None
+
+# keccak256 的吞吐率（字节），即每个分组 17 个 64 位 lane
+RATE = 136
+ROUNDS = 24
+
+
+def _round_constants():
+    # 轮常数由 x^8 + x^6 + x^5 + x^4 + 1 的 LFSR 生成
+    constants = []
+    state = 1
+    for _ in range(ROUNDS):
+        value = 0
+        for bit in range(7):
+            if state & 1:
+                value |= 1 << ((1 << bit) - 1)
+            state = ((state << 1) ^ (0x171 if state & 0x80 else 0)) & 0xFF
+        constants.append(value)
+    return constants
+
+
+def _rho_pi():
+    # lane 编号 x + 5y；rho 的循环左移位数沿 (x, y) -> (y, 2x + 3y) 的轨道累加，
+    # pi 把 (x, y) 处的 lane 移到 (y, 2x + 3y)
+    rotations = [0] * 25
+    x, y = 1, 0
+    for t in range(ROUNDS):
+        rotations[x + 5 * y] = (t + 1) * (t + 2) // 2 % 64
+        x, y = y, (2 * x + 3 * y) % 5
+    sources = [0] * 25
+    for x in range(5):
+        for y in range(5):
+            sources[y + 5 * ((2 * x + 3 * y) % 5)] = x + 5 * y
+    return rotations, sources
+
+
+ROUND_CONSTANTS = _round_constants()
+ROTATIONS, PI_SOURCES = _rho_pi()
+
+
+def available():
+    """
+    Whether the vectorized keccak can run (numpy is installed)
+    """
+    return np is not None
+
+
+# 每轮用到的下标：theta 的左右相邻列、chi 的同行后两个 lane
+_LEFT = [4, 0, 1, 2, 3]
+_RIGHT = [1, 2, 3, 4, 0]
+_RIGHT2 = [2, 3, 4, 0, 1]
+
+
+def keccak_f(state):
+    """
+    keccak-f[1600] in place on a (25, n) uint64 array: n independent states, one lane per row
+    """
+    count = state.shape[1]
+    rotations = np.array(ROTATIONS, dtype=np.uint64)[:, None]
+    inverse = (np.uint64(64) - rotations) % np.uint64(64)
+    constants = [np.uint64(constant) for constant in ROUND_CONSTANTS]
+    one, sixty_three = np.uint64(1), np.uint64(63)
+    lanes = state.reshape(5, 5, count)
+    # 临时数组在各轮之间复用，避免每步分配
+    parity = np.empty((5, count), dtype=np.uint64)
+    rotated = np.empty((5, count), dtype=np.uint64)
+    spill = np.empty((5, count), dtype=np.uint64)
+    moved = np.empty((25, count), dtype=np.uint64)
+    shuffled = np.empty((25, count), dtype=np.uint64)
+    shuffled_lanes = shuffled.reshape(5, 5, count)
+    neighbour = np.empty((5, 5, count), dtype=np.uint64)
+    for constant in constants:
+        # theta：D[x] = C[x-1] ^ rot(C[x+1], 1)，C 为每列的奇偶校验
+        np.bitwise_xor(lanes[0], lanes[1], out=parity)
+        parity ^= lanes[2]
+        parity ^= lanes[3]
+        parity ^= lanes[4]
+        np.left_shift(parity, one, out=rotated)
+        np.right_shift(parity, sixty_three, out=spill)
+        rotated |= spill
+        np.take(parity, _LEFT, axis=0, out=spill)
+        spill ^= np.take(rotated, _RIGHT, axis=0)
+        lanes ^= spill[None]
+        # rho + pi：各 lane 循环左移后换位（位移 0 时两次移位结果相同，或运算不变）
+        np.left_shift(state, rotations, out=moved)
+        np.right_shift(state, inverse, out=shuffled)
+        moved |= shuffled
+        np.take(moved, PI_SOURCES, axis=0, out=shuffled)
+        # chi：A[x] = B[x] ^ (~B[x+1] & B[x+2])
+        np.take(shuffled_lanes, _RIGHT, axis=1, out=lanes)
+        np.invert(lanes, out=lanes)
+        np.take(shuffled_lanes, _RIGHT2, axis=1, out=neighbour)
+        lanes &= neighbour
+        lanes ^= shuffled_lanes
+        # iota
+        state[0] ^= constant
+    return state
+
+
+def keccak256_batch(messages):
+    """
+    keccak256 of n equal-length messages given as an (n, length) uint8 array
+
+    Returns an (n, 32) uint8 array of digests. All states are permuted
+    together, so the per-message cost is a few numpy element operations
+    per lane instead of a Python call.
+    """
+    count, length = messages.shape
+    # 填充：消息后接 0x01，分组最后一字节异或 0x80
+    padded_length = (length // RATE + 1) * RATE
+    padded = np.zeros((count, padded_length), dtype=np.uint8)
+    padded[:, :length] = messages
+    padded[:, length] ^= 0x01
+    padded[:, -1] ^= 0x80
+    words = padded.view("<u8")
+
+    state = np.zeros((25, count), dtype=np.uint64)
+    lanes_per_block = RATE // 8
+    for start in range(0, padded_length // 8, lanes_per_block):
+        state[:lanes_per_block] ^= words[:, start:start + lanes_per_block].T
+        keccak_f(state)
+    return np.ascontiguousarray(state[:4].T).astype("<u8", copy=False).view(np.uint8)
@@ -0,0 +1,90 @@
+import os
+import queue
+import threading
+
+from secp256k1 import N
+
+KEY_SIZE = 32
+
+# 每次从系统随机源读取的私钥数量
+BUFFER_KEYS = 4096
+
+# 后台预先准备好的缓冲区数量
+PREFETCH_BUFFERS = 2
+
+
+class KeySource:
+    """
+    secp256k1 private keys sliced from bulk OS CSPRNG buffers
+
+    One os.urandom call fills a buffer of buffer_keys keys; a background
+    thread keeps the next buffers ready so take() normally only slices.
+    Values outside 1..N-1 are rejected (probability about 2^-128).
+    """
+
+    def __init__(self, buffer_keys=BUFFER_KEYS, background=True):
+        self.buffer_keys = buffer_keys
+        self._buffer = b""
+        self._position = 0
+        self._lock = threading.Lock()
+        self._ready = None
+        if background:
+            self._ready = queue.Queue(PREFETCH_BUFFERS)
+            threading.Thread(target=self._refill, name="key-source", daemon=True).start()
+
+    def _refill(self):
+        while True:
+            self._ready.put(os.urandom(KEY_SIZE * self.buffer_keys))
+
+    def _next_buffer(self):
+        if self._ready is not None:
+            return self._ready.get()
+        return os.urandom(KEY_SIZE * self.buffer_keys)
+
+    def take_bytes(self):
+        """
+        Next 32-byte big-endian private key
+        """
+        with self._lock:
+            while True:
+                if self._position >= len(self._buffer):
+                    self._buffer = self._next_buffer()
+                    self._position = 0
+                key = self._buffer[self._position:self._position + KEY_SIZE]
+                self._position += KEY_SIZE
+                if 0 < int.from_bytes(key, "big") < N:
+                    return key
+
+    def take_hex(self):
+        """
+        Next private key as 64 lower-case hex characters
+        """
+        return self.take_bytes().hex()
+
+    def take_int(self):
+        """
+        Next private key as an integer
+        """
+        return int.from_bytes(self.take_bytes(), "big")
+
+
+_default_source = None
+_default_pid = None
+
+
+def default_source():
+    """
+    Per-process shared KeySource (a forked child gets its own buffers)
+    """
+    global _default_source, _default_pid
+    if _default_source is None or _default_pid != os.getpid():
+        _default_source = KeySource()
+        _default_pid = os.getpid()
+    return _default_source
+
+
+def random_key_hex():
+    """
+    Random secp256k1 private key as hex from the shared key source
+    """
+    return default_source().take_hex()
@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import secrets
+import hashlib
+
+from secp256k1 import N
+
+# 2：各分片的起点改为分别派生，旧版本检查点中的位置对应的是另一组私钥
+CHECKPOINT_VERSION = 2
+
+
+def new_seed():
+    """
+    Random 32-byte search seed as hex
+    """
+    return secrets.token_hex(32)
+
+
+def _digest(*parts):
+    return hashlib.sha256(":".join(str(part) for part in parts).encode()).digest()
+
+
+def shard_base_key(seed, chain, shard):
+    """
+    Private key at offset 0 of a secp256k1 shard (ETH/TRX)
+
+    Every shard's base is derived on its own from the seed, chain and
+    shard, so a key from one shard reveals nothing about the others
+    (keys of the same shard still differ by their offsets). Random bases
+    make two walks of even 2^64 keys overlap with negligible probability.
+    """
+    key = int.from_bytes(_digest(seed, chain, shard), "big") % N
+    # 0 不是合法私钥（概率可忽略）
+    return key or 1
+
+
+def shard_salt(seed, shard):
+    """
+    Base CREATE2 salt (a 256-bit integer) of a contract-address shard
+
+    Salt offset i of the shard adds i to the low 64 bits of the base (see
+    eth.ContractETH), so every shard has 2^64 salts of its own.
+    """
+    return int.from_bytes(_digest(seed, "ETH-CREATE2", shard), "big")
+
+
+class SeedSequence:
+    """
+    Deterministic ed25519 seeds for one SOL shard
+
+    The seed at offset i is sha256(sha256(seed:SOL:shard) || i). Like the
+    secp256k1 walk, ``offset`` is the last offset handed out and take()
+    continues at offset + 1.
+    """
+
+    def __init__(self, seed, shard=0, offset=0, chain="SOL"):
+        self._prefix = hashlib.sha256(_digest(seed, chain, shard))
+        self.offset = offset
+
+    def seed_at(self, offset):
+        digest = self._prefix.copy()
+        digest.update(offset.to_bytes(8, "big"))
+        return digest.digest()
+
+    def take(self, count):
+        """
+        Concatenated 32-byte seeds for offsets offset+1 .. offset+count
+        """
+        prefix = self._prefix
+        seeds = []
+        for offset in range(self.offset + 1, self.offset + count + 1):
+            digest = prefix.copy()
+            digest.update(offset.to_bytes(8, "big"))
+            seeds.append(digest.digest())
+        self.offset += count
+        return b"".join(seeds)
+
+
+def private_key_at(seed, chain, shard, offset):
+    """
+    Reproduce the private key of a candidate from its seed, shard and offset
+
+    Returns the hex string in the same format as the generator's hits.
+    """
+    if chain == "SOL":
+        from sol import keypair_class, keypair_fields
+        return keypair_fields(keypair_class().from_seed(SeedSequence(seed, shard).seed_at(offset)))[1]
+    return format((shard_base_key(seed, chain, shard) + offset) % N, "064x")
+
+
+def save_checkpoint(path, state):
+    """
+    Atomically write a checkpoint dict (see SearchEngine.checkpoint_state)
+    """
+    state = dict(state, version=CHECKPOINT_VERSION, time=time.strftime("%Y-%m-%d %H:%M:%S"))
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 先写临时文件并同步，再替换，断电时保留旧的检查点
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint written by save_checkpoint; ValueError if it is not one
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a search checkpoint (or was written by an older version)")
+    return state
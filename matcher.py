@@ -0,0 +1,272 @@
+from bisect import bisect_right
+from itertools import product
+
+import b58
+from b58 import ALPHABET
+
+HEX_CHARS = "0123456789abcdef"
+
+# 不区分大小写时最多展开的大小写变体数量，超过后退回逐次 lower() 比较
+MAX_CASE_VARIANTS = 4096
+
+
+class HexMatcher:
+    """
+    Prefix/suffix matcher for ETH addresses compiled into one nibble mask
+
+    The pattern is compiled once into (mask, value) over the 160-bit
+    address integer, so each candidate is checked with a single AND and
+    compare on the raw 20-byte keccak output - no hex string is built.
+    The mask is case-insensitive; for case-sensitive patterns the letter
+    positions are kept so survivors can be confirmed against the EIP-55
+    checksum hash with match_checksum.
+    """
+
+    ADDRESS_NIBBLES = 40
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case_sensitive = case_sensitive
+        self.mask = 0
+        self.value = 0
+        self.letter_cases = []
+        self.possible = True
+
+        nibbles = {}
+        positions = [(i, c) for i, c in enumerate(prefix)]
+        positions += [(self.ADDRESS_NIBBLES - len(suffix) + i, c) for i, c in enumerate(suffix)]
+        for position, char in positions:
+            if not case_sensitive:
+                char = char.lower()
+            # 非十六进制字符、超出地址长度或前后缀重叠冲突时永远无法匹配
+            if char.lower() not in HEX_CHARS or not 0 <= position < self.ADDRESS_NIBBLES \
+                    or nibbles.get(position, char) != char:
+                self.possible = False
+                return
+            nibbles[position] = char
+
+        for position, char in sorted(nibbles.items()):
+            shift = 4 * (self.ADDRESS_NIBBLES - 1 - position)
+            self.mask |= 0xF << shift
+            self.value |= int(char, 16) << shift
+            if case_sensitive and char.isalpha():
+                self.letter_cases.append((position, char.isupper()))
+
+    def match_int(self, address_int):
+        """
+        Check a 160-bit address integer (ignoring case)
+        """
+        return self.possible and address_int & self.mask == self.value
+
+    def match_bytes(self, address_bytes):
+        """
+        Check a raw 20-byte address (ignoring case)
+        """
+        return self.possible and int.from_bytes(address_bytes, "big") & self.mask == self.value
+
+    def match_checksum(self, checksum_hash):
+        """
+        Check the pattern's letter cases against an EIP-55 checksum hash
+
+        checksum_hash is keccak256 of the lower-case hex address; a letter
+        is upper-case in the checksummed address iff its hash nibble >= 8.
+        """
+        for position, upper in self.letter_cases:
+            nibble = checksum_hash[position >> 1] >> (0 if position & 1 else 4) & 0xF
+            if (nibble >= 8) != upper:
+                return False
+        return True
+
+
+def case_variants(text, alphabet=None, limit=MAX_CASE_VARIANTS):
+    """
+    All upper/lower-case spellings of text that only use alphabet chars
+
+    Returns None when there would be more than limit variants.
+    """
+    choices = []
+    count = 1
+    for char in text.lower():
+        options = sorted({char, char.upper()})
+        if alphabet is not None:
+            options = [option for option in options if option in alphabet]
+        choices.append(options)
+        count *= len(options)
+        if count > limit:
+            return None
+    return tuple("".join(variant) for variant in product(*choices))
+
+
+class TextMatcher:
+    """
+    Compiled prefix/suffix matcher for encoded address strings
+
+    Case-insensitive patterns are expanded once into a tuple of case
+    variants so each check is a single startswith/endswith call without
+    lower-casing (and allocating) the candidate address. ``skip`` leading
+    characters of the address are ignored (e.g. TRX's 'T').
+    """
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, alphabet=None, skip=0):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case_sensitive = case_sensitive
+        self.skip = skip
+        self.prefixes = self._compile(prefix, alphabet)
+        self.suffixes = self._compile(suffix, alphabet)
+
+    def _compile(self, text, alphabet):
+        if not text:
+            return None
+        if self.case_sensitive:
+            # 含有字母表以外字符的规则永远无法匹配
+            if alphabet is not None and any(char not in alphabet for char in text):
+                return ()
+            return (text,)
+        return case_variants(text, alphabet)
+
+    def match(self, address):
+        """
+        Check an encoded address
+        """
+        if self.prefix:
+            if self.prefixes is not None:
+                if not address.startswith(self.prefixes, self.skip):
+                    return False
+            elif address[self.skip:self.skip + len(self.prefix)].lower() != self.prefix.lower():
+                return False
+
+        if self.suffix:
+            if len(address) - self.skip < len(self.suffix):
+                return False
+            if self.suffixes is not None:
+                if not address.endswith(self.suffixes):
+                    return False
+            elif address[-len(self.suffix):].lower() != self.suffix.lower():
+                return False
+
+        return True
+
+
+class Base58Matcher:
+    """
+    Prefix/suffix matcher for Base58 addresses on the raw payload integer
+
+    A Base58 suffix of length k is ``value mod 58**k``, and a prefix is a
+    numeric interval of the payload for each possible encoded length. The
+    pattern (with all its case variants) is compiled once into a residue
+    set and a sorted interval table, so a candidate costs one modulus and
+    one bisect; only hits need to be Base58-encoded. ``lead`` is a fixed
+    leading part of every address that the pattern skips (TRX's 'T').
+
+    Payloads with leading zero bytes (encoded as '1') and patterns with too
+    many case variants fall back to text matching on the encoded address.
+    """
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, payload_length=32, lead=""):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.payload_length = payload_length
+        self.lead = lead
+        self.text_matcher = TextMatcher(prefix, suffix, case_sensitive, alphabet=ALPHABET, skip=len(lead))
+
+        self.numeric = self._compile_suffix() and self._compile_prefix()
+
+    def _compile_suffix(self):
+        self.modulus = 58 ** len(self.suffix)
+        self.residues = None
+        if not self.suffix:
+            return True
+        variants = self.text_matcher.suffixes
+        if variants is None:
+            return False
+        self.residues = frozenset(_decode_digits(variant) for variant in variants)
+        return True
+
+    def _compile_prefix(self):
+        self.interval_starts = []
+        self.interval_ends = []
+        if not self.prefix:
+            return True
+        variants = self.text_matcher.prefixes
+        if variants is None:
+            return False
+
+        # 无前导零字节时，负载数值的编码位数范围
+        low = 1 << (8 * (self.payload_length - 1))
+        high = 1 << (8 * self.payload_length)
+        intervals = []
+        for variant in variants:
+            text = self.lead + variant
+            if text[0] == "1":
+                # '1' 开头对应前导零字节，只能按文本匹配
+                return False
+            value = _decode_digits(text)
+            digits = len(text)
+            while 58 ** (digits - 1) < high:
+                scale = 58 ** (digits - len(text))
+                start = max(value * scale, 58 ** (digits - 1), low)
+                end = min((value + 1) * scale, 58 ** digits, high)
+                if start < end:
+                    intervals.append((start, end))
+                digits += 1
+
+        intervals.sort()
+        for start, end in intervals:
+            if self.interval_ends and start <= self.interval_ends[-1]:
+                self.interval_ends[-1] = max(self.interval_ends[-1], end)
+            else:
+                self.interval_starts.append(start)
+                self.interval_ends.append(end)
+        return True
+
+    def match_prefix_int(self, value):
+        """
+        Check only the prefix on a payload integer without leading zero bytes
+        """
+        if not self.prefix:
+            return True
+        index = bisect_right(self.interval_starts, value) - 1
+        return index >= 0 and value < self.interval_ends[index]
+
+    def match_prefix_high(self, high, shift):
+        """
+        Coarse prefix pre-filter on the payload's top bits (value >> shift)
+
+        May return True for a few values just outside an interval, but
+        never False for a real match; confirm with match_int.
+        """
+        if not self.prefix:
+            return True
+        index = bisect_right(self.interval_starts, high << shift | ((1 << shift) - 1)) - 1
+        return index >= 0 and high <= (self.interval_ends[index] - 1) >> shift
+
+    def match_int(self, value):
+        """
+        Check a payload integer without leading zero bytes
+        """
+        if self.residues is not None and value % self.modulus not in self.residues:
+            return False
+        return self.match_prefix_int(value)
+
+    def match_bytes(self, payload):
+        """
+        Check a raw payload (e.g. a 32-byte SOL public key)
+        """
+        if not self.numeric or not payload[0]:
+            return self.text_matcher.match(b58.encode(payload))
+        return self.match_int(int.from_bytes(payload, "big"))
+
+    def match(self, address):
+        """
+        Check an encoded address
+        """
+        return self.text_matcher.match(address)
+
+
+def _decode_digits(text):
+    value = 0
+    for char in text:
+        value = value * 58 + ALPHABET.index(char)
+    return value
@@ -0,0 +1,228 @@
+from bisect import bisect_right
+
+import b58
+from matcher import HexMatcher, TextMatcher, Base58Matcher
+from wildcard import Base58WildcardMatcher, HexWildcardMatcher, is_wildcard
+
+
+def parse_pattern(text):
+    """
+    Split a pattern line into (prefix, suffix)
+
+    "abc*xyz" -> prefix abc, suffix xyz; "abc*" -> prefix only;
+    "*xyz" -> suffix only; a bare "abc" is a prefix.
+    """
+    text = text.strip()
+    if "*" in text:
+        prefix, _, suffix = text.partition("*")
+        return prefix, suffix
+    return text, ""
+
+
+def load_patterns(path):
+    """
+    Load a pattern list file: one pattern per line, '#' starts a comment
+    """
+    patterns = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line and line not in patterns:
+                patterns.append(line)
+    return patterns
+
+
+class HexPatternSet:
+    """
+    Many ETH prefix/suffix patterns indexed for a single lookup per shape
+
+    Patterns are grouped by (prefix length, suffix length). Each group has
+    one nibble mask and a dict from masked address value to the patterns
+    it satisfies, so a candidate costs one AND and one dict lookup per
+    distinct shape regardless of how many patterns are loaded.
+    Case-sensitive patterns are confirmed afterwards against one EIP-55
+    checksum hash (``checksum_hash(address_bytes)``) shared by all
+    surviving patterns. Wildcard patterns (see wildcard) are checked one
+    by one with their own matchers.
+    """
+
+    def __init__(self, patterns, case_sensitive=False, checksum_hash=None):
+        self.patterns = list(patterns)
+        self.case_sensitive = case_sensitive
+        self.checksum_hash = checksum_hash
+        self.matchers = {}
+        self.text_matchers = {}
+        self.wildcards = {}
+        shapes = {}
+
+        for pattern in self.patterns:
+            prefix, suffix = parse_pattern(pattern)
+            if is_wildcard(prefix) or is_wildcard(suffix):
+                wildcard = HexWildcardMatcher(prefix, suffix, case_sensitive, checksum_hash)
+                if wildcard.possible:
+                    self.wildcards[pattern] = wildcard
+                continue
+            matcher = HexMatcher(prefix, suffix, case_sensitive)
+            if not matcher.possible or not (prefix or suffix):
+                continue
+            mask, table = shapes.setdefault((len(prefix), len(suffix)), (matcher.mask, {}))
+            table.setdefault(matcher.value, []).append(pattern)
+            self.matchers[pattern] = matcher
+            if case_sensitive:
+                self.text_matchers[pattern] = TextMatcher(prefix, suffix, True)
+
+        self.shapes = list(shapes.values())
+
+    def match_int(self, address_int):
+        """
+        Patterns whose nibbles match a 160-bit address (case-insensitive)
+        """
+        matched = []
+        for mask, table in self.shapes:
+            hits = table.get(address_int & mask)
+            if hits:
+                matched.extend(hits)
+        return matched
+
+    def match_bytes(self, address_bytes):
+        """
+        Patterns matched by a raw 20-byte address
+        """
+        matched = self.match_int(int.from_bytes(address_bytes, "big"))
+        if matched and self.case_sensitive:
+            # 校验和哈希只为通过半字节筛选的地址计算一次
+            digest = self.checksum_hash(address_bytes)
+            matched = [pattern for pattern in matched if self.matchers[pattern].match_checksum(digest)]
+        if self.wildcards:
+            matched.extend(pattern for pattern, wildcard in self.wildcards.items() if wildcard.match_bytes(address_bytes))
+        return matched
+
+    def match(self, address):
+        """
+        Patterns matched by a hex address string
+        """
+        matched = self.match_int(int(address, 16))
+        if matched and self.case_sensitive:
+            matched = [pattern for pattern in matched if self.text_matchers[pattern].match(address)]
+        if self.wildcards:
+            matched.extend(pattern for pattern, wildcard in self.wildcards.items() if wildcard.match(address))
+        return matched
+
+
+class Base58PatternSet:
+    """
+    Many Base58 prefix/suffix patterns indexed on the payload integer
+
+    Per (prefix length, suffix length) shape, prefixes are a sorted table
+    of disjoint intervals (bisect) and suffixes a dict keyed by
+    ``value mod 58**k``; the pair of keys found selects the patterns. A
+    candidate costs one bisect and one modulus per shape. Patterns that
+    cannot be compiled numerically are checked as text, like
+    Base58Matcher does; wildcard patterns (see wildcard) are checked one
+    by one with their own matchers.
+    """
+
+    def __init__(self, patterns, case_sensitive=False, payload_length=32, lead=""):
+        self.patterns = list(patterns)
+        self.case_sensitive = case_sensitive
+        self.payload_length = payload_length
+        self.lead = lead
+        self.text_matchers = {}
+        self.slow_patterns = []
+        self.wildcards = []
+        shapes = {}
+
+        for pattern in self.patterns:
+            prefix, suffix = parse_pattern(pattern)
+            if not (prefix or suffix):
+                continue
+            if is_wildcard(prefix) or is_wildcard(suffix):
+                wildcard = Base58WildcardMatcher(prefix, suffix, case_sensitive, payload_length, lead)
+                self.text_matchers[pattern] = wildcard
+                if wildcard.numeric:
+                    self.wildcards.append((pattern, wildcard))
+                else:
+                    self.slow_patterns.append(pattern)
+                continue
+            self.text_matchers[pattern] = TextMatcher(prefix, suffix, case_sensitive, alphabet=b58.ALPHABET,
+                                                      skip=len(lead))
+            prefix_key = prefix if case_sensitive else prefix.lower()
+            suffix_key = suffix if case_sensitive else suffix.lower()
+            prefix_matcher = Base58Matcher(prefix, "", case_sensitive, payload_length, lead)
+            suffix_matcher = Base58Matcher("", suffix, case_sensitive, payload_length, lead)
+            if not (prefix_matcher.numeric and suffix_matcher.numeric):
+                self.slow_patterns.append(pattern)
+                continue
+
+            shape = shapes.setdefault((len(prefix), len(suffix)), {
+                "modulus": suffix_matcher.modulus,
+                "prefixes": {},
+                "residues": {},
+                "pairs": {}
+            })
+            if prefix:
+                shape["prefixes"][prefix_key] = prefix_matcher
+            if suffix:
+                for residue in suffix_matcher.residues:
+                    shape["residues"][residue] = suffix_key
+            shape["pairs"].setdefault((prefix_key, suffix_key), []).append(pattern)
+
+        self.shapes = []
+        for (prefix_length, suffix_length), shape in shapes.items():
+            intervals = sorted((start, end, key)
+                               for key, matcher in shape["prefixes"].items()
+                               for start, end in zip(matcher.interval_starts, matcher.interval_ends))
+            self.shapes.append((
+                [start for start, _, _ in intervals] if prefix_length else None,
+                [(end, key) for _, end, key in intervals],
+                shape["modulus"] if suffix_length else None,
+                shape["residues"],
+                shape["pairs"]
+            ))
+
+    def match_int(self, value):
+        """
+        Patterns matched by a payload integer without leading zero bytes
+        """
+        matched = []
+        for starts, ends, modulus, residues, pairs in self.shapes:
+            suffix_key = ""
+            if modulus is not None:
+                suffix_key = residues.get(value % modulus)
+                if suffix_key is None:
+                    continue
+            prefix_key = ""
+            if starts is not None:
+                index = bisect_right(starts, value) - 1
+                if index < 0 or value >= ends[index][0]:
+                    continue
+                prefix_key = ends[index][1]
+            hits = pairs.get((prefix_key, suffix_key))
+            if hits:
+                matched.extend(hits)
+
+        for pattern, wildcard in self.wildcards:
+            if wildcard.match_int(value):
+                matched.append(pattern)
+
+        if self.slow_patterns:
+            address = self.encode(value.to_bytes(self.payload_length, "big"))
+            matched.extend(pattern for pattern in self.slow_patterns if self.text_matchers[pattern].match(address))
+        return matched
+
+    def match_bytes(self, payload):
+        """
+        Patterns matched by a raw payload
+        """
+        if not payload[0]:
+            return self.match(self.encode(payload))
+        return self.match_int(int.from_bytes(payload, "big"))
+
+    def match(self, address):
+        """
+        Patterns matched by an encoded address
+        """
+        return [pattern for pattern, matcher in self.text_matchers.items() if matcher.match(address)]
+
+    def encode(self, payload):
+        return b58.encode(payload)
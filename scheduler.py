@@ -0,0 +1,67 @@
+import math
+
+# 跨链调度：主进程按各链的优先级与剩余期望工作量给出每个工作进程每轮对每条链跑几批，
+# 通过共享数组下发，达到目标的链分配为 0，其算力交给其余的链
+
+# 重新分配的间隔（秒）；有链达到目标时立即重新分配
+SCHEDULE_INTERVAL = 5.0
+
+# 每个未完成的链至少分到的算力比例，简单的链因此很快达到目标，而不会被困难的链占满
+MIN_SHARE = 0.1
+
+# 一个工作进程一轮的时长（秒），各链按分到的比例分得其中的时间
+CYCLE_SECONDS = 0.5
+
+DEFAULT_PRIORITY = 1.0
+
+
+def shares(work, priorities):
+    """
+    CPU fraction per chain from its remaining expected work (CPU-seconds) and priority
+
+    Chains get CPU in proportion to priority * remaining work, so they are
+    expected to reach their targets at about the same time, except that
+    every chain gets at least MIN_SHARE. Chains with no work left get 0.
+    """
+    active = [chain for chain, value in work.items() if value > 0]
+    result = {chain: 0.0 for chain in work}
+    if not active:
+        return result
+    floor = min(MIN_SHARE, 1 / len(active))
+    weights = {chain: priorities.get(chain, DEFAULT_PRIORITY) * work[chain] for chain in active}
+    total = sum(weights.values())
+    spare = 1 - floor * len(active)
+    for chain in active:
+        if math.isinf(total):
+            # 不可行的链之间平分
+            weight = 1 / sum(math.isinf(value) for value in weights.values()) if math.isinf(weights[chain]) else 0
+        else:
+            weight = weights[chain] / total if total > 0 else 1 / len(active)
+        result[chain] = floor + spare * weight
+    return result
+
+
+def assign(fractions, workers):
+    """
+    CPU-seconds per round for each (worker, chain): a list of per-worker lists
+
+    ``fractions`` is the CPU fraction of every chain (in slot order). The
+    chains are laid out over the workers in order, so most workers serve
+    a single chain and only the boundary workers alternate between two;
+    a worker's portion of a chain becomes that part of a CYCLE_SECONDS
+    round. Workers carry the difference between budget and time actually
+    spent over to the next rounds, so a share smaller than one batch is
+    honoured on average instead of being rounded up to a whole batch.
+    """
+    plan = [[0.0] * len(fractions) for _ in range(workers)]
+    worker, free = 0, 1.0
+    for slot, fraction in enumerate(fractions):
+        need = fraction * workers
+        while need > 1e-9 and worker < workers:
+            portion = min(need, free)
+            plan[worker][slot] = portion * CYCLE_SECONDS
+            need -= portion
+            free -= portion
+            if free <= 1e-9:
+                worker, free = worker + 1, 1.0
+    return plan
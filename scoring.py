@@ -0,0 +1,123 @@
+import math
+import heapq
+import itertools
+from bisect import bisect_right
+
+# 评分模式：没有固定规则时按地址的"好看程度"打分，保留所有工作进程中最好的 K 个
+# 分数以比特计，每个"巧合"字符计 log2(字母表大小)，不同链的分数可以直接比较：
+#   开头相同字符的连续长度 L、结尾相同字符的连续长度 T、首尾对称（回文）的字符对数 M，
+#   ETH 开头的连续 0 再额外计一次（Z）
+#   score = (L - 1 + T - 1 + M + Z) * log2(字母表大小)
+DEFAULT_TOP_K = 100
+
+# 榜单未满时工作进程只上报高于该分数的地址，避免刚开始时大量上报
+SCORE_FLOOR = 12.0
+
+# 各进制的 base**i 表与每个字符的比特数
+_powers = {}
+_bits = {16: 4.0, 58: math.log2(58)}
+
+
+def _power_table(base):
+    table = _powers.get(base)
+    if table is None:
+        table = _powers[base] = [base ** i for i in range(80)]
+    return table
+
+
+def score_text(text, base, skip=0, zero=None):
+    """
+    Score in bits of an encoded address (reference implementation on the string)
+
+    skip leading characters are ignored (TRX's 'T'); a leading run of
+    ``zero`` counts twice.
+    """
+    text = text[skip:]
+    length = len(text)
+    lead = length - len(text.lstrip(text[0]))
+    trail = length - len(text.rstrip(text[-1]))
+    mirror = 0
+    while mirror < length // 2 and text[mirror] == text[-1 - mirror]:
+        mirror += 1
+    zeros = lead if zero is not None and text[0] == zero else 0
+    return round((lead - 1 + trail - 1 + mirror + zeros) * _bits[base], 2)
+
+
+def score_int(value, base, length, skip=0, zero=False):
+    """
+    Score in bits of a number's ``length`` base-``base`` digits, without encoding it
+
+    Same result as score_text on the encoded string when digit 0 is the
+    ``zero`` character. Only the digits needed to find where each run
+    ends are extracted, so a typical candidate costs a few divisions.
+    """
+    powers = _power_table(base)
+    length -= skip
+    top = length - 1
+    first = value // powers[top] % base
+    lead = 1
+    while lead < length and value // powers[top - lead] % base == first:
+        lead += 1
+
+    rest, last = divmod(value, base)
+    trail = 1
+    while trail < length:
+        rest, digit = divmod(rest, base)
+        if digit != last:
+            break
+        trail += 1
+
+    mirror = 0
+    while mirror < length // 2 and value // powers[top - mirror] % base == value // powers[mirror] % base:
+        mirror += 1
+    zeros = lead if zero and first == 0 else 0
+    return round((lead - 1 + trail - 1 + mirror + zeros) * _bits[base], 2)
+
+
+def digit_count(value, base):
+    """
+    Number of base-``base`` digits of a positive integer
+    """
+    return bisect_right(_power_table(base), value)
+
+
+class TopK:
+    """
+    The K best-scoring records seen so far (a bounded min-heap)
+
+    threshold() is the score a new record must beat: the K-th best score
+    once the list is full, else ``floor``.
+    """
+
+    def __init__(self, size=DEFAULT_TOP_K, floor=SCORE_FLOOR):
+        self.size = size
+        self.floor = floor
+        self._heap = []
+        # 同分时先到的排在前面
+        self._order = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def threshold(self):
+        return self._heap[0][0] if len(self._heap) >= self.size else self.floor
+
+    def push(self, record):
+        """
+        Offer a record with a "score"; returns True if it entered the list
+        """
+        score = record["score"]
+        if score <= self.threshold():
+            return False
+        entry = (score, -next(self._order), record)
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heapreplace(self._heap, entry)
+        return True
+
+    def records(self):
+        """
+        The records, best first
+        """
+        return [record for _, _, record in sorted(self._heap, reverse=True)]
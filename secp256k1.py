@@ -0,0 +1,267 @@
+import secrets
+
+# secp256k1 曲线参数
+P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+GX = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+GY = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+G = (GX, GY)
+
+
+def point_add(p1, p2):
+    """
+    Add two affine points (None is the point at infinity)
+    """
+    if p1 is None:
+        return p2
+    if p2 is None:
+        return p1
+
+    x1, y1 = p1
+    x2, y2 = p2
+    if x1 == x2:
+        if (y1 + y2) % P == 0:
+            return None
+        # 倍点
+        lam = 3 * x1 * x1 * pow(2 * y1, -1, P) % P
+    else:
+        lam = (y2 - y1) * pow(x2 - x1, -1, P) % P
+
+    x3 = (lam * lam - x1 - x2) % P
+    return (x3, (lam * (x1 - x3) - y1) % P)
+
+
+def _jacobian_double(point):
+    x, y, z = point
+    if not y:
+        return (0, 0, 0)
+    ysq = y * y % P
+    s = 4 * x * ysq % P
+    m = 3 * x * x % P
+    nx = (m * m - 2 * s) % P
+    ny = (m * (s - nx) - 8 * ysq * ysq) % P
+    return (nx, ny, 2 * y * z % P)
+
+
+def _jacobian_add(p1, p2):
+    if not p1[1]:
+        return p2
+    if not p2[1]:
+        return p1
+
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    z1sq = z1 * z1 % P
+    z2sq = z2 * z2 % P
+    u1 = x1 * z2sq % P
+    u2 = x2 * z1sq % P
+    s1 = y1 * z2sq * z2 % P
+    s2 = y2 * z1sq * z1 % P
+    if u1 == u2:
+        if s1 != s2:
+            return (0, 0, 1)
+        return _jacobian_double(p1)
+
+    h = u2 - u1
+    r = s2 - s1
+    h2 = h * h % P
+    h3 = h * h2 % P
+    u1h2 = u1 * h2 % P
+    nx = (r * r - h3 - 2 * u1h2) % P
+    ny = (r * (u1h2 - nx) - s1 * h3) % P
+    return (nx, ny, h * z1 * z2 % P)
+
+
+def scalar_multiply(k, point=G):
+    """
+    Compute k * point with double-and-add in Jacobian coordinates
+    """
+    k %= N
+    if not k or point is None:
+        return None
+
+    result = (0, 0, 1)
+    addend = (point[0], point[1], 1)
+    while k:
+        if k & 1:
+            result = _jacobian_add(result, addend)
+        addend = _jacobian_double(addend)
+        k >>= 1
+
+    x, y, z = result
+    if not y:
+        return None
+    z_inv = pow(z, -1, P)
+    z_inv2 = z_inv * z_inv % P
+    return (x * z_inv2 % P, y * z_inv2 * z_inv % P)
+
+
+def batch_inverse(values):
+    """
+    Invert many field elements with a single modular inversion
+
+    Montgomery's trick: 3 multiplications per element plus one pow(-1).
+    All values must be non-zero mod P.
+    """
+    count = len(values)
+    prefix = [0] * count
+    acc = 1
+    for i in range(count):
+        prefix[i] = acc
+        acc = acc * values[i] % P
+
+    acc = pow(acc, -1, P)
+    result = [0] * count
+    for i in range(count - 1, -1, -1):
+        result[i] = acc * prefix[i] % P
+        acc = acc * values[i] % P
+    return result
+
+
+# 倍数表缓存：batch_size -> [G, 2G, ..., batch_size*G]
+_multiples_cache = {}
+
+
+def multiples_of_g(count):
+    """
+    Affine points [1*G, 2*G, ..., count*G] (cached per count)
+    """
+    table = _multiples_cache.get(count)
+    if table is None:
+        table = [G]
+        for _ in range(count - 1):
+            table.append(point_add(table[-1], G))
+        _multiples_cache[count] = table
+    return table
+
+
+def public_key_bytes(point):
+    """
+    64-byte uncompressed public key (x || y) without the 0x04 prefix
+    """
+    x, y = point
+    return x.to_bytes(32, "big") + y.to_bytes(32, "big")
+
+
+def is_on_curve(point):
+    x, y = point
+    return (y * y - x * x * x - 7) % P == 0
+
+
+def parse_public_key(data):
+    """
+    Affine point from a 33-byte compressed, 65-byte (0x04) or 64-byte raw public key
+
+    Raises ValueError for malformed keys and points not on the curve.
+    """
+    if len(data) == 33 and data[0] in (2, 3):
+        x = int.from_bytes(data[1:], "big")
+        # P ≡ 3 (mod 4)，平方根为 a^((P+1)/4)
+        y = pow((x * x * x + 7) % P, (P + 1) // 4, P)
+        if y & 1 != data[0] & 1:
+            y = P - y
+    elif len(data) in (64, 65):
+        if len(data) == 65 and data[0] != 4:
+            raise ValueError("Uncompressed public key must start with 0x04")
+        x = int.from_bytes(data[-64:-32], "big")
+        y = int.from_bytes(data[-32:], "big")
+    else:
+        raise ValueError("Public key must be 33, 64 or 65 bytes")
+
+    if x >= P or y >= P or not is_on_curve((x, y)):
+        raise ValueError("Public key is not a point on secp256k1")
+    return (x, y)
+
+
+def random_private_key():
+    """
+    Random scalar in [1, N-1]
+    """
+    return secrets.randbelow(N - 1) + 1
+
+
+class KeyWalker:
+    """
+    Sequential key walk: k, k+1, k+2, ... by adding G to the public point
+
+    Each step costs one affine point addition instead of a full scalar
+    multiplication. The private key of the current point is always
+    ``(base_key + offset) % N``.
+
+    With a ``base_point`` Q (split-key mode) the walk visits Q + k*G and
+    private_key() is only the offset k; the owner of Q's secret q
+    recovers the full key as q + k.
+
+    Reaching the point at infinity (key 0 mod N, probability about 2^-256
+    per key) raises ValueError instead of moving to another start, so an
+    offset always stays reproducible from the base key.
+    """
+
+    def __init__(self, base_key=None, offset=0, base_point=None):
+        self.base_key = base_key if base_key is not None else random_private_key()
+        self.base_point = base_point
+        self.offset = offset
+        self.point = point_add(base_point, scalar_multiply(self.private_key()))
+        if self.point is None:
+            raise ValueError(f"key walk starts at the point at infinity (offset {offset})")
+
+    def private_key(self, offset=None):
+        """
+        Private key for an offset from the base key (default: current offset)
+        """
+        return (self.base_key + (self.offset if offset is None else offset)) % N
+
+    def public_key_bytes(self):
+        """
+        64-byte uncompressed public key (x || y) of the current point
+        """
+        return public_key_bytes(self.point)
+
+    def step(self):
+        """
+        Advance to the next key and return its offset
+        """
+        point = point_add(self.point, G)
+        if point is None:
+            # 走到无穷远点（概率可忽略）：该偏移没有有效私钥，停在原位置报错，不换起点
+            raise ValueError(f"key walk reached the point at infinity at offset {self.offset + 1}")
+        self.offset += 1
+        self.point = point
+        return self.offset
+
+    def step_batch(self, batch_size):
+        """
+        Advance by batch_size keys at once
+
+        Returns the affine points for offsets offset+1 .. offset+batch_size.
+        Every point is P + j*G with a precomputed j*G table, and the
+        batch shares one field inversion for all slopes.
+        """
+        table = multiples_of_g(batch_size)
+        px, py = self.point
+        dx = [(qx - px) % P for qx, _ in table]
+
+        if 0 in dx:
+            # P == ±jG（概率可忽略），退回逐个相加；遇到无穷远点时 step 报错，位置回到本批开始处
+            start_offset, start_point = self.offset, self.point
+            points = []
+            try:
+                for _ in range(batch_size):
+                    self.step()
+                    points.append(self.point)
+            except ValueError:
+                self.offset, self.point = start_offset, start_point
+                raise
+            return points
+
+        inverses = batch_inverse(dx)
+        points = [None] * batch_size
+        for j in range(batch_size):
+            qx, qy = table[j]
+            lam = (qy - py) * inverses[j] % P
+            x = (lam * lam - px - qx) % P
+            points[j] = (x, (lam * (px - x) - py) % P)
+
+        self.offset += batch_size
+        self.point = points[-1]
+        return points
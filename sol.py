@@ -1,94 +1,173 @@
 import os
 import sys
-import random
-import time
-import binascii
-from solana.keypair import Keypair
-from base58 import b58encode
-from hexer import is_valid_pattern
+from time import perf_counter
+import backends
+from generator import VanityGenerator
+from keyspace import SeedSequence
+import b58
+from patternset import Base58PatternSet
+from scoring import digit_count, score_int, score_text
+from wildcard import base58_matcher
 
-class SOL:
-    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None):
+_keypair_class = None
+
+def keypair_class():
+    """
+    Keypair class of the installed solana package, imported on first use
+
+    The solana/solders import is only paid by the legacy mode and by hits.
+    """
+    global _keypair_class
+    if _keypair_class is None:
+        try:
+            from solana.keypair import Keypair
+        except ImportError:
+            # solana>=0.30 moved Keypair to solders
+            from solders.keypair import Keypair
+        _keypair_class = Keypair
+    return _keypair_class
+
+def keypair_fields(keypair):
+    """
+    Return (address, private_key hex) for either Keypair implementation
+    """
+    if hasattr(keypair, "pubkey"):
+        return str(keypair.pubkey()), bytes(keypair).hex()
+    return str(keypair.public_key), keypair.secret_key.hex()
+
+class SOL(VanityGenerator):
+    chain = "SOL"
+    
+    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None, patterns=None,
+                 lean=False, batch_size=1, seed=None, shard=0, offset=0, score=False):
         """
         Initialize SOL class
+        
+        patterns: optional pattern list ("prefix*suffix") matched in one pass
+        lean: derive raw ed25519 public keys from bulk random seeds and only
+              build the Keypair for matches
+        batch_size: candidates per generate_batch call (seeds come from one
+                    os.urandom buffer per batch)
+        seed/shard/offset: take the seeds from a deterministic SeedSequence
+                           (see keyspace) instead of os.urandom; implies lean
+        score: top-K mode, ignore the pattern and report candidates scoring
+               above the threshold with their score (see scoring)
+        """
+        super().__init__(prefix, suffix, case_sensitive, on_found_callback, batch_size, score)
+        self.matcher = base58_matcher(prefix, suffix, case_sensitive, payload_length=32)
+        self.pattern_set = Base58PatternSet(patterns, case_sensitive, payload_length=32) if patterns else None
+        self.seeds = SeedSequence(seed, shard, offset) if seed is not None else None
+        self.lean = lean or self.seeds is not None
+        # 种子 -> 公钥的最快 ed25519 实现（见 backends）
+        self.seed_public_key = backends.get("ed25519")
+        
+    def position(self):
+        """
+        Offset of the last seed tried from the SeedSequence (None for random seeds)
         """
-        self.prefix = prefix
-        self.suffix = suffix
-        self.case_sensitive = case_sensitive
-        self.on_found_callback = on_found_callback
+        return self.seeds.offset if self.seeds else None
+        
+    def next_seeds(self, count):
+        """
+        count concatenated 32-byte seeds, deterministic when a seed plan is set
+        """
+        if self.seeds:
+            return self.seeds.take(count)
+        return os.urandom(32 * count)
         
     def generate_wallet(self):
         """
         Generate a random SOL wallet
         """
+        if self.lean:
+            found = self.search_seeds(self.next_seeds(1))
+            return found[0] if found else None
+        
         try:
             # Generate Solana keypair
-            keypair = Keypair()
-            
-            # Get public key (address) and private key
-            address = str(keypair.public_key)
-            private_key = keypair.secret_key.hex()
+            keypair = keypair_class()()
+            public_key = keypair.pubkey() if hasattr(keypair, "pubkey") else keypair.public_key
             
-            if self.is_vanity_address(address):
-                if self.on_found_callback:
-                    self.on_found_callback(address, private_key)
-                return (address, private_key)
+            # Match on the raw public key, encode only on a hit
+            matched = self.is_vanity_bytes(bytes(public_key))
+            if matched:
+                address, private_key = keypair_fields(keypair)
+                return self.report_found(address, private_key, matched)
                 
             return None
             
         except Exception as e:
-            print(f"SOL wallet error: {str(e)}")
+            self.report_error(e)
             return None
         
-    def is_vanity_address(self, address):
-        """
-        Check if address matches vanity criteria
-        """
-        # Check prefix
-        if self.prefix:
-            check_prefix = address[:len(self.prefix)]
-            if self.case_sensitive:
-                if check_prefix != self.prefix:
-                    return False
-            else:
-                if check_prefix.lower() != self.prefix.lower():
-                    return False
-                
-        # Check suffix
-        if self.suffix:
-            check_suffix = address[-len(self.suffix):]
-            if self.case_sensitive:
-                if check_suffix != self.suffix:
-                    return False
-            else:
-                if check_suffix.lower() != self.suffix.lower():
-                    return False
-                
-        return True
+    def generate_batch(self):
+        """
+        Try batch_size candidates and return the list of matching wallets
+        """
+        if not self.lean:
+            return super().generate_batch()
+        
+        # One seed buffer (one OS random call) for the whole batch
+        found = self.search_seeds(self.next_seeds(self.batch_size))
+        self.stats.count("attempts", self.batch_size)
+        self.stats.count("hits", len(found))
+        return found
+        
+    def search_seeds(self, seeds):
+        """
+        Check the ed25519 keys of consecutive 32-byte seeds in a buffer
+        """
+        stats = self.stats
+        # Sampled batches are timed per stage; disabled costs one check
+        timed = stats.sampling()
+        try:
+            if timed:
+                start = perf_counter()
+            seed_public_key = self.seed_public_key
+            public_keys = [seed_public_key(seeds[offset:offset + 32]) for offset in range(0, len(seeds), 32)]
+            if timed:
+                keygen_done = perf_counter()
+                stats.add_time("keygen", keygen_done - start, len(public_keys))
+            
+            found = []
+            for index, public_key in enumerate(public_keys):
+                matched = self.is_vanity_bytes(public_key)
+                if matched:
+                    # Only hits pay for the Keypair object and encodings
+                    seed = seeds[32 * index:32 * index + 32]
+                    address, private_key = stats.timed("encode", keypair_fields, keypair_class().from_seed(seed))
+                    found.append(self.report_found(address, private_key, matched))
+            if timed:
+                stats.add_time("match", perf_counter() - keygen_done, len(public_keys))
+                    
+            return found
+            
+        except Exception as e:
+            self.report_error(e)
+            return []
+        
+    def is_vanity_bytes(self, public_key):
+        """
+        Check a raw 32-byte public key without Base58-encoding it
+        """
+        if self.pattern_set:
+            return self.pattern_set.match_bytes(public_key)
+        return self.matcher.match_bytes(public_key)
+        
+    def address_score(self, public_key):
+        """
+        Score of a raw 32-byte public key on its Base58 digits
+        """
+        if not public_key[0]:
+            # Leading zero bytes are encoded as '1': score the string
+            return score_text(b58.encode(public_key), 58)
+        value = int.from_bytes(public_key, "big")
+        return score_int(value, 58, digit_count(value, 58))
 
 if __name__ == "__main__":
-    sol = SOL(prefix="sol", suffix="8888")
-    
-    print("Starting SOL address generation...")
-    start_time = time.time()
-    count = 0
-    
-    try:
-        while True:
-            result = sol.generate_wallet()
-            count += 1
-            
-            if result:
-                address, private_key = result
-                print(f"\nFound matching address:")
-                print(f"Address: {address}")
-                print(f"Private key: {private_key}")
-                
-            if count % 100 == 0:
-                elapsed = time.time() - start_time
-                print(f"\rTried: {count}, Speed: {count/elapsed:.2f}/s", end="")
-                
-    except KeyboardInterrupt:
-        print("\n\nStopped")
-        elapsed = time.time() - start_time
-        print(f"Total: {count}, Average speed: {count/elapsed:.2f}/s")
+    from engine import run_console
+
+    # Optional argument: pattern list file for pattern-set mode
+    pattern_file = sys.argv[1] if len(sys.argv) > 1 else None
+
+    run_console("SOL", prefix="sol", suffix="8888", pattern_file=pattern_file)
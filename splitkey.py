@@ -0,0 +1,96 @@
+import sys
+import argparse
+
+import backends
+from secp256k1 import N, parse_public_key, public_key_bytes, random_private_key, scalar_multiply
+
+# 支持拆分私钥模式的链（secp256k1）
+SPLIT_KEY_CHAINS = ("ETH", "TRX")
+
+
+def load_public_key(text):
+    """
+    Affine point from a hex public key (compressed or uncompressed, optional 0x)
+    """
+    text = text.strip()
+    if text.lower().startswith("0x"):
+        text = text[2:]
+    return parse_public_key(bytes.fromhex(text))
+
+
+def check_split_key(chain, public_key):
+    """
+    Validate a split-key search option; ValueError if unusable
+    """
+    if chain not in SPLIT_KEY_CHAINS:
+        raise ValueError(f"Split-key mode does not support {chain}")
+    load_public_key(public_key)
+
+
+def public_key_hex(point):
+    """
+    65-byte uncompressed public key (0x04 || x || y) as hex
+    """
+    return "04" + public_key_bytes(point).hex()
+
+
+def new_key_pair():
+    """
+    Random (secret hex, public key hex) for the operator to keep / hand out
+    """
+    secret = random_private_key()
+    return format(secret, "064x"), public_key_hex(scalar_multiply(secret))
+
+
+def combine(secret, partial):
+    """
+    Final private key (hex) from the operator's secret and a worker's partial key
+
+    Both arguments are hex strings; the result is (secret + partial) mod N.
+    """
+    key = (int(secret, 16) + int(partial, 16)) % N
+    if not key:
+        raise ValueError("Combined key is zero")
+    return format(key, "064x")
+
+
+def address_of(chain, private_key):
+    """
+    Address of a hex private key in the chain's format used by the generators
+    """
+    if chain not in SPLIT_KEY_CHAINS:
+        raise ValueError(f"Split-key mode does not support {chain}")
+    from chains import load
+    address_bytes = backends.get("keccak")(public_key_bytes(scalar_multiply(int(private_key, 16))))[12:]
+    return load(chain).encode_address(address_bytes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Split-key vanity search: key pair for the workers and key combining")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("keygen", help="create a secret and the public key to give to the workers")
+    joiner = commands.add_parser("combine", help="combine the secret with a partial key found by a worker")
+    joiner.add_argument("--secret", required=True, help="hex secret from keygen")
+    joiner.add_argument("--partial", required=True, help="hex partial key reported with the hit")
+    joiner.add_argument("--chain", choices=SPLIT_KEY_CHAINS, default="ETH")
+    joiner.add_argument("--address", help="expected address; exit 1 if the combined key does not produce it")
+    args = parser.parse_args(argv)
+
+    if args.command == "keygen":
+        secret, public_key = new_key_pair()
+        print(f"Secret (keep offline): {secret}")
+        print(f"Public key (give to workers): {public_key}")
+        return 0
+
+    private_key = combine(args.secret, args.partial)
+    address = address_of(args.chain, private_key)
+    print(f"Private key: {private_key}")
+    print(f"Address: {address}")
+    if args.address and args.address.lower().removeprefix("0x") != address.lower():
+        print(f"Address does not match {args.address}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
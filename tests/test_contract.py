@@ -0,0 +1,131 @@
+import pytest
+
+import keccak
+from eth import ContractETH, checksum_address, create2_address, create_address, parse_hex
+
+# keccak256 的已知结果（pycryptodome 计算），覆盖单个分组、恰好一个分组和跨分组的长度
+KECCAK_VECTORS = {
+    0: "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470",
+    3: "f84a97f1f0a956e738abd85c2e0a5026f8874e3ec09c8f012159dfeeaab2b156",
+    135: "cbdfd9dee5faad3818d6b06f95a219fd290b0e1706f6a82e5a595b9ce9faca62",
+    136: "7ce759f1ab7f9ce437719970c26b0a66ff11fe3e38e17df89cf5d29c7d7f807e",
+    137: "ac73d4fae68b8453f764007c1a20ce95994187861f0c3227a3a8e99a73a3b1db",
+    200: "bfb0aa97863e797943cf7c33bb7e880bb4543f3d2703c0923c6901c2af57b890",
+}
+
+# EIP-1014 中的示例：(部署者, 盐值, 初始化代码, 合约地址)
+CREATE2_VECTORS = [
+    ("0x0000000000000000000000000000000000000000",
+     "0x0000000000000000000000000000000000000000000000000000000000000000",
+     "0x00", "4D1A2e2bB4F88F0250f26Ffff098B0b30B26BF38"),
+    ("0xdeadbeef00000000000000000000000000000000",
+     "0x0000000000000000000000000000000000000000000000000000000000000000",
+     "0x00", "B928f69Bb1D91Cd65274e3c79d8986362984fDA3"),
+    ("0xdeadbeef00000000000000000000000000000000",
+     "0x000000000000000000000000feed000000000000000000000000000000000000",
+     "0x00", "D04116cDd17beBE565EB2422F2497E06cC1C9833"),
+    ("0x0000000000000000000000000000000000000000",
+     "0x0000000000000000000000000000000000000000000000000000000000000000",
+     "0xdeadbeef", "70f2b2914A2a4b783FaEFb75f459A580616Fcb5e"),
+    ("0x00000000000000000000000000000000deadbeef",
+     "0x00000000000000000000000000000000000000000000000000000000cafebabe",
+     "0xdeadbeef", "60f3f640a8508fC6a86d45DF051962668E1e8AC7"),
+    ("0x00000000000000000000000000000000deadbeef",
+     "0x00000000000000000000000000000000000000000000000000000000cafebabe",
+     "0x" + "deadbeef" * 11, "1d8bfDC5D46DC4f61D6b6115972536eBE6A8854C"),
+    ("0x0000000000000000000000000000000000000000",
+     "0x0000000000000000000000000000000000000000000000000000000000000000",
+     "0x", "E33C0C7F7df4809055C3ebA6c09CFe4BaF1BD9e0"),
+]
+
+# CREATE：(部署者, nonce, 合约地址)
+CREATE_VECTORS = [
+    ("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0", 0, "cd234a471b72ba2f1ccf0a70fcaba648a5eecd8d"),
+    ("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0", 1, "343c43a37d37dff08ae8c4a11544c718abb4fcf8"),
+    ("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0", 2, "f778b86fa74e846c4f0a1fbd1335fe81c00a0c91"),
+]
+
+DEPLOYER = "0x" + "11" * 20
+INIT_CODE_HASH = "0x" + "22" * 32
+
+
+def _message(length):
+    return bytes(i % 256 for i in range(length))
+
+
+def _keccak(data):
+    import backends
+    return backends.get("keccak")(data)
+
+
+needs_numpy = pytest.mark.skipif(not keccak.available(), reason="numpy is not installed")
+
+
+@needs_numpy
+@pytest.mark.parametrize("length", sorted(KECCAK_VECTORS))
+def test_keccak256_batch_known_answers(length):
+    import numpy as np
+    messages = np.frombuffer(_message(length) * 3, dtype=np.uint8).reshape(3, length)
+    digests = keccak.keccak256_batch(messages)
+    assert digests.shape == (3, 32)
+    for digest in digests:
+        assert bytes(digest).hex() == KECCAK_VECTORS[length]
+
+
+@needs_numpy
+def test_keccak256_batch_matches_scalar_keccak():
+    import numpy as np
+    rng = np.random.default_rng(1)
+    for length in (1, 32, 85, 134, 271, 300):
+        messages = rng.integers(0, 256, size=(17, length), dtype=np.uint8)
+        digests = keccak.keccak256_batch(messages)
+        for message, digest in zip(messages, digests):
+            assert bytes(digest) == _keccak(message.tobytes())
+
+
+@pytest.mark.parametrize("deployer, salt, init_code, address", CREATE2_VECTORS)
+def test_create2_eip1014_examples(deployer, salt, init_code, address):
+    init_code_hash = _keccak(bytes.fromhex(init_code[2:]))
+    result = create2_address(parse_hex(deployer, 20, "deployer"), parse_hex(salt, 32, "salt"), init_code_hash)
+    assert checksum_address(result) == address
+
+
+@pytest.mark.parametrize("deployer, nonce, address", CREATE_VECTORS)
+def test_create_known_addresses(deployer, nonce, address):
+    assert create_address(parse_hex(deployer, 20, "deployer"), nonce).hex() == address
+
+
+def _contract_hits(vectorized, **options):
+    hits = []
+    generator = ContractETH("a", "", on_found_callback=lambda address, salt: hits.append((address, salt)),
+                            deployer=DEPLOYER, batch_size=512, **options)
+    if not vectorized:
+        generator.vectorized = False
+    for _ in range(4):
+        generator.generate_batch()
+    return generator, hits
+
+
+@pytest.mark.parametrize("vectorized", [False, pytest.param(True, marks=needs_numpy)])
+def test_create2_hits_reproduce_from_salt(vectorized):
+    generator, hits = _contract_hits(vectorized, init_code_hash=INIT_CODE_HASH, seed="ab" * 32, shard=1)
+    assert hits
+    for address, salt in hits:
+        expected = create2_address(generator.deployer, parse_hex(salt, 32, "salt"), generator.init_code_hash)
+        assert address == checksum_address(expected)
+        assert address.lower().startswith("a")
+
+
+def test_create2_vectorized_finds_the_same_salts():
+    if not keccak.available():
+        pytest.skip("numpy is not installed")
+    options = dict(init_code_hash=INIT_CODE_HASH, seed="cd" * 32, shard=0)
+    assert _contract_hits(True, **options)[1] == _contract_hits(False, **options)[1]
+
+
+def test_create_hits_reproduce_from_nonce():
+    generator, hits = _contract_hits(False, nonce=5)
+    assert hits
+    for address, nonce in hits:
+        assert int(nonce) >= 5
+        assert address == checksum_address(create_address(generator.deployer, int(nonce)))
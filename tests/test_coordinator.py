@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+import backends
+from coordinator import Coordinator, CoordinatorClient, _work_lease
+from eth import checksum_address
+from secp256k1 import KeyWalker
+
+TOKEN = "test-token"
+LEASE_SIZE = 2048
+LEASES_PER_WORKER = 3
+
+
+@pytest.fixture
+def coordinator():
+    hits = []
+    coordinator = Coordinator({"ETH": {"prefix": "8"}}, lease_size=LEASE_SIZE, on_hit=hits.append, token=TOKEN)
+    coordinator.found = hits
+    server = coordinator.serve("127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    coordinator.port = server.server_address[1]
+    yield coordinator
+    server.shutdown()
+    server.server_close()
+
+
+def _worker(port, name, leases):
+    client = CoordinatorClient("127.0.0.1", port, name, token=TOKEN)
+    try:
+        plan = client.request("hello")
+        chains = dict(plan["chains"])
+        for _ in range(LEASES_PER_WORKER):
+            lease = client.request("lease")["lease"]
+            leases.append(lease)
+            _work_lease(client, plan["seed"], chains, lease)
+    finally:
+        client.close()
+
+
+def test_two_workers_get_disjoint_leases(coordinator):
+    leases = {"a": [], "b": []}
+    threads = [threading.Thread(target=_worker, args=(coordinator.port, name, found))
+               for name, found in leases.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+
+    ranges = [(lease["chain"], lease["shard"], lease["position"], lease["end"])
+              for found in leases.values() for lease in found]
+    assert len(ranges) == 2 * LEASES_PER_WORKER
+    # 新租约各占一个分片，同一分片中的范围不重叠
+    assert len({(chain, shard) for chain, shard, _, _ in ranges}) == len(ranges)
+    assert not coordinator.leases
+
+    assert coordinator.found
+    for hit in coordinator.found:
+        public_key = KeyWalker(int(hit.private_key, 16)).public_key_bytes()
+        address = checksum_address(backends.get("keccak")(public_key)[12:])
+        assert address == hit.address and address.startswith("8")
+
+
+def test_messages_without_the_token_are_rejected(coordinator):
+    for token in (None, "wrong"):
+        client = CoordinatorClient("127.0.0.1", coordinator.port, "intruder", token=token)
+        try:
+            with pytest.raises(ValueError, match="invalid token"):
+                client.request("hello")
+        finally:
+            client.close()
+    assert coordinator.handle([]) == {"error": "message must be a JSON object"}
+
+
+def test_non_loopback_listen_requires_a_token():
+    with pytest.raises(ValueError):
+        Coordinator({"ETH": {"prefix": "8"}}).serve("0.0.0.0", 0)
+
+
+def test_state_is_only_resumed_for_the_same_search(tmp_path):
+    state_file = str(tmp_path / "state.json")
+    first = Coordinator({"ETH": {"prefix": "8"}}, lease_size=LEASE_SIZE, state_file=state_file)
+    first.handle({"op": "lease", "worker": "w"})
+    first.save_state()
+
+    resumed = Coordinator({"ETH": {"prefix": "8"}}, lease_size=LEASE_SIZE, state_file=state_file)
+    assert resumed.seed == first.seed and len(resumed.free) == 1
+    for options in ({"prefix": "9"}, {"prefix": "8", "case_sensitive": True}, {"suffix": "8"}):
+        with pytest.raises(ValueError, match="different search"):
+            Coordinator({"ETH": options}, state_file=state_file)
+    with pytest.raises(ValueError, match="seed"):
+        Coordinator({"ETH": {"prefix": "8"}}, seed="00" * 32, state_file=state_file)
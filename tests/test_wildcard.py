@@ -0,0 +1,78 @@
+import os
+import re
+import random
+
+import pytest
+
+from eth import checksum_address, checksum_hash
+from wildcard import WildcardPattern, hex_matcher, parse
+
+# 小字母表上的随机字符串，使每个规则都有足够多的命中
+ALPHABET = "0189aAbB"
+LENGTH = 12
+SAMPLES = 20000
+
+# (前缀, 后缀, 区分大小写, 等价的正则表达式)
+TEXT_CASES = [
+    ("8?8", "", False, r"8.8"),
+    ("[ab]?", "", False, r"[ab]."),
+    ("[^0-9]", "", False, r"[^0-9]"),
+    ("[0-1]{3}", "", False, r"[0-1]{3}"),
+    ("", "([0-9]){3}", False, r".*([0-9])\1\1$"),
+    ("(?)", "\\1", False, r"(.).*\1$"),
+    ("(?)?\\1", "", False, r"(.).\1"),
+    ("8{2}", "a{2}", False, r"88.*aa$"),
+    ("A?b", "", True, r"A.b"),
+    ("[AB]", "[a-b]", True, r"[AB].*[a-b]$"),
+    ("(?)", "\\1", True, r"(.).*\1$"),
+]
+
+
+def _strings(seed):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(ALPHABET) for _ in range(LENGTH)) for _ in range(SAMPLES)]
+
+
+@pytest.mark.parametrize("prefix, suffix, case_sensitive, regex", TEXT_CASES)
+def test_pattern_matches_like_re(prefix, suffix, case_sensitive, regex):
+    pattern = WildcardPattern(prefix, suffix, case_sensitive, ALPHABET)
+    compiled = re.compile(regex, 0 if case_sensitive else re.IGNORECASE)
+    hits = 0
+    for text in _strings(len(prefix) * 31 + len(suffix)):
+        expected = bool(compiled.match(text))
+        assert pattern.match(text) == expected, text
+        hits += expected
+    assert hits > 10
+
+
+# ETH 原始地址：掩码粗筛 + 完整检查与正则在校验和地址上的结果一致
+HEX_CASES = [
+    ("8?8?", "", False, r"8.8."),
+    ("", "([0-9]){3}", False, r".*([0-9])\1\1$"),
+    ("[A-F]?", "", True, r"[A-F]."),
+    ("[a-f]", "", True, r"[a-f]"),
+    ("", "[^a-f]", True, r".*[^a-f]$"),
+    ("[^A-F]?", "", True, r"[^A-F]."),
+    ("0(?)", "\\1", False, r"0(.).*\1$"),
+]
+
+
+@pytest.mark.parametrize("prefix, suffix, case_sensitive, regex", HEX_CASES)
+def test_hex_matcher_matches_like_re(prefix, suffix, case_sensitive, regex):
+    matcher = hex_matcher(prefix, suffix, case_sensitive, checksum_hash)
+    compiled = re.compile(regex, 0 if case_sensitive else re.IGNORECASE)
+    hits = 0
+    for _ in range(SAMPLES):
+        address_bytes = os.urandom(20)
+        address = checksum_address(address_bytes)
+        expected = bool(compiled.match(address))
+        assert matcher.match_bytes(address_bytes) == expected, address
+        assert matcher.match(address) == expected, address
+        hits += expected
+    assert hits > 10
+
+
+@pytest.mark.parametrize("text", ["[ab", "a{x}", "\\1", "(a", "a{0}"])
+def test_invalid_patterns_are_refused(text):
+    with pytest.raises(ValueError):
+        parse(text)
@@ -1,104 +1,61 @@
-import os
-import sys
-import random
-import time
-import binascii
-import base58
-from hdwallet import HDWallet
-from hdwallet.symbols import TRX
-from hexer import is_valid_pattern
-
-class TRX:
-    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None):
-        """
-        Initialize TRX class
-        """
-        self.prefix = prefix
-        self.suffix = suffix
-        self.case_sensitive = case_sensitive
-        self.on_found_callback = on_found_callback
-        
-    def generate_wallet(self):
-        """
-        Generate a random TRX wallet
-        
-        Note: 简化版本，实际情况需要使用真实的TRX库来生成有效地址
-        """
-        try:
-            # 生成随机私钥（64字节十六进制）
-            private_key = ''.join(random.choice('0123456789abcdef') for _ in range(64))
-            
-            # 生成地址 - 在真实实现中，这里需要使用TRX的加密算法
-            # 这里简化为T开头的34字符长度的地址，符合TRX地址格式
-            address = "T" + ''.join(random.choice('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz') for _ in range(33))
-            
-            if self.is_vanity_address(address):
-                # 如果符合靓号条件，回调处理
-                if self.on_found_callback:
-                    self.on_found_callback(address, private_key)
-                    
-                return (address, private_key)
-                
-            return None
-            
-        except Exception as e:
-            print(f"TRX wallet generation error: {str(e)}")
-            return None
-        
-    def is_vanity_address(self, address):
-        """
-        Check if address matches vanity criteria
-        
-        注意：此处忽略了T开头（TRX默认前缀）
-        """
-        check_address = address[1:] if address.startswith('T') else address
-        
-        # 检查前缀
-        if self.prefix:
-            check_prefix = check_address[:len(self.prefix)]
-            if self.case_sensitive:
-                if check_prefix != self.prefix:
-                    return False
-            else:
-                if check_prefix.lower() != self.prefix.lower():
-                    return False
-                
-        # 检查后缀
-        if self.suffix:
-            check_suffix = check_address[-len(self.suffix):]
-            if self.case_sensitive:
-                if check_suffix != self.suffix:
-                    return False
-            else:
-                if check_suffix.lower() != self.suffix.lower():
-                    return False
-                
-        return True
-
-if __name__ == "__main__":
-    # 测试代码
-    trx = TRX(suffix="8888")
-    
-    print("Starting TRX address generation...")
-    start_time = time.time()
-    count = 0
-    
-    try:
-        while True:
-            result = trx.generate_wallet()
-            count += 1
-            
-            if result:
-                address, private_key = result
-                print(f"\nFound matching address:")
-                print(f"Address: {address}")
-                print(f"Private key: {private_key}")
-                
-            if count % 100 == 0:
-                elapsed = time.time() - start_time
-                print(f"\rTried: {count}, Speed: {count/elapsed:.2f}/s", end="")
-                
-    except KeyboardInterrupt:
-        print("\n\nStopped")
-        elapsed = time.time() - start_time
-        print(f"Total: {count}, Average speed: {count/elapsed:.2f}/s")
+import sys
+from b58 import TRX_ADDRESS_LENGTH, TRX_PAYLOAD_LENGTH, checksum, encode_trx_address
+from generator import KeyWalkGenerator
+from patternset import Base58PatternSet
+from scoring import score_int
+from wildcard import base58_matcher
+
+class TRX(KeyWalkGenerator):
+    chain = "TRX"
+    encode_address = staticmethod(encode_trx_address)
+    
+    def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None, batch_size=1,
+                 patterns=None, seed=None, shard=0, offset=0, public_key=None, score=False):
+        """
+        Initialize TRX class
+        
+        TRX 与 ETH 使用相同的 secp256k1 顺序遍历与批量求逆流程（见 generator.KeyWalkGenerator），
+        地址 = Base58Check(0x41 + keccak256(公钥)[12:])，
+        batch_size 为 generate_batch 每批尝试的数量，
+        patterns 为多规则模式的规则列表（"前缀*后缀"），
+        seed/shard/offset 为确定性分片遍历的起点（见 keyspace），
+        public_key 为拆分私钥模式的公钥 P：遍历 P + k*G，命中时报告部分私钥 k（见 splitkey），
+        score 为评分模式：忽略前后缀，上报高于阈值的地址及其分数（见 scoring）
+        """
+        super().__init__(prefix, suffix, case_sensitive, on_found_callback, batch_size,
+                         True, seed, shard, offset, public_key, score)
+        self.matcher = base58_matcher(prefix, suffix, case_sensitive, payload_length=TRX_PAYLOAD_LENGTH, lead="T")
+        self.pattern_set = Base58PatternSet(patterns, case_sensitive, payload_length=TRX_PAYLOAD_LENGTH,
+                                            lead="T") if patterns else None
+        
+    def is_vanity_bytes(self, address_bytes):
+        """
+        Check a raw 20-byte account hash without Base58-encoding it
+        """
+        if self.pattern_set:
+            payload = b"\x41" + address_bytes
+            return self.pattern_set.match_int(int.from_bytes(payload + checksum(payload), "big"))
+        
+        if not self.matcher.numeric:
+            return self.is_vanity_address(encode_trx_address(address_bytes))
+        
+        payload = b"\x41" + address_bytes
+        # 前缀只取决于高位，先不计算校验和做粗筛
+        if not self.matcher.match_prefix_high(int.from_bytes(payload, "big"), 32):
+            return False
+        return self.matcher.match_int(int.from_bytes(payload + checksum(payload), "big"))
+        
+    def address_score(self, address_bytes):
+        """
+        Score of a raw 20-byte account hash on the Base58 digits after the 'T'
+        """
+        payload = b"\x41" + address_bytes
+        return score_int(int.from_bytes(payload + checksum(payload), "big"), 58, TRX_ADDRESS_LENGTH, skip=1)
+
+if __name__ == "__main__":
+    from engine import run_console
+
+    # 可选参数：多规则模式的规则文件
+    pattern_file = sys.argv[1] if len(sys.argv) > 1 else None
+
+    run_console("TRX", suffix="8888", pattern_file=pattern_file)
@@ -0,0 +1,228 @@
+import sys
+import time
+import argparse
+
+from config import CONFIG_FILE, chain_options, load_config
+from difficulty import DEFAULT_MAX_ETA, format_duration
+from engine import SUPPORTED_CHAINS, WARMUP_SECONDS, SearchEngine
+from hexer import save_result
+from journal import get_journal
+from scoring import DEFAULT_TOP_K
+
+# 退出码
+EXIT_TARGET_REACHED = 0
+EXIT_CONFIG_ERROR = 1
+EXIT_WORKERS_STOPPED = 2
+EXIT_INFEASIBLE = 3
+EXIT_INTERRUPTED = 130
+
+
+def log(text):
+    print(f"[{time.strftime('%H:%M:%S')}] {text}", flush=True)
+
+
+def build_chains(config, args):
+    """
+    Chain -> engine options from the config file, with CLI overrides applied
+    """
+    selected = args.chains or [chain for chain in SUPPORTED_CHAINS
+                               if config["chains"].get(chain, {}).get("enabled")]
+    chains = {}
+    for chain in selected:
+        options = chain_options(config, chain)
+        if args.prefix is not None:
+            options["prefix"] = args.prefix
+        if args.suffix is not None:
+            options["suffix"] = args.suffix
+        if args.case_sensitive:
+            options["case_sensitive"] = True
+        if args.pattern_file:
+            options["pattern_file"] = args.pattern_file
+        if args.public_key:
+            options["public_key"] = args.public_key
+        if args.deployer:
+            options["deployer"] = args.deployer
+        if args.init_code_hash:
+            options["init_code_hash"] = args.init_code_hash
+        if args.nonce is not None:
+            options["nonce"] = args.nonce
+        chains[chain] = options
+    return chains
+
+
+def report_hit(hit, save_local, key_name="private_key"):
+    """
+    Print a hit and save it locally if enabled
+
+    key_name names the key: a partial key to combine with the secret in
+    split-key mode, the salt/nonce in contract-address mode. Top-K
+    entrants are only printed; the list itself goes to --top-output.
+    """
+    patterns = f" patterns={','.join(hit.patterns)}" if hit.patterns else ""
+    if hit.score is not None:
+        log(f"TOP {hit.chain} address={hit.address} score={hit.score}")
+        return
+    log(f"FOUND {hit.chain} address={hit.address} {key_name}={hit.private_key}{patterns}")
+    if save_local:
+        try:
+            log(f"saved to {save_result(hit.chain, hit.private_key, hit.address, hit.patterns, key_name)}")
+        except OSError as e:
+            log(f"save failed: {e}")
+
+
+def write_top(engine, path):
+    """
+    Rewrite the top-K file (JSON lines if the name ends in .jsonl)
+    """
+    try:
+        count = engine.export_top(path, "jsonl" if path.endswith(".jsonl") else "txt")
+        log(f"top {count} written to {path} (threshold {engine.top.threshold():.1f} bits)")
+    except OSError as e:
+        log(f"top-K export failed: {e}")
+
+
+def run(args):
+    """
+    Run the search until the target is reached; returns the exit code
+    """
+    try:
+        config = load_config(args.config)
+        chains = build_chains(config, args)
+        if not chains:
+            log("no chain enabled in the config and none given with --chains")
+            return EXIT_CONFIG_ERROR
+        engine = SearchEngine(chains, workers=args.workers, seed=args.seed or config.get("seed"),
+                              checkpoint=args.checkpoint or config.get("checkpoint"), top_k=args.top_k)
+        engine.set_profiling(args.profile)
+    except (OSError, ValueError) as e:
+        log(f"configuration error: {e}")
+        return EXIT_CONFIG_ERROR
+
+    target = args.target if args.target is not None else config.get("target", 0)
+    save_local = config.get("save_local", True) and not args.no_save
+    if engine.top is not None:
+        # 评分模式没有命中数目标，结果是随时改写的榜单文件
+        target = 0
+        save_local = False
+
+    for chain, options in engine.chains:
+        if engine.top is not None:
+            log(f"{chain}: top-{engine.top.size} scoring mode")
+            continue
+        log(f"{chain}: prefix={options.get('prefix', '')!r} suffix={options.get('suffix', '')!r} "
+            f"case_sensitive={options.get('case_sensitive', False)} expected attempts={engine.expected[chain]:.3g} "
+            f"target={engine.targets[chain] or 'unlimited'} priority={engine.priorities[chain]:g}")
+    if engine.resumed_attempts:
+        log(f"resuming from {engine.checkpoint} after {engine.resumed_attempts} attempts")
+    log(f"seed={engine.seed} (worker i searches shard i)")
+    log(f"crypto backends: {' '.join(f'{kind}={name}' for kind, name in engine.backends.items())}")
+    log(f"starting {engine.workers} worker processes, target={target or 'unlimited'} hits")
+
+    engine.start()
+    hits = 0
+    # 达到目标后仍在队列中或正在运行的批次找到的命中不再输出和保存
+    extra = 0
+
+    def deliver(batch):
+        nonlocal hits, extra
+        for hit in batch:
+            if target and hits >= target:
+                extra += 1
+                continue
+            hits += 1
+            report_hit(hit, save_local, engine.key_name(hit.chain))
+    next_report = time.time() + args.interval
+    checked_feasibility = False
+    exit_code = EXIT_WORKERS_STOPPED
+
+    try:
+        while engine.is_running():
+            deliver(engine.get_hits(timeout=0.5))
+            if target and hits >= target:
+                exit_code = EXIT_TARGET_REACHED
+                break
+            if engine.is_done():
+                log("every chain reached its target")
+                exit_code = EXIT_TARGET_REACHED
+                break
+
+            if not checked_feasibility and engine.elapsed() > WARMUP_SECONDS:
+                checked_feasibility = True
+                infeasible = engine.infeasible_chains(args.max_eta)
+                for chain, value in infeasible.items():
+                    log(f"{chain} pattern is infeasible at the current speed (90% ETA {format_duration(value)})")
+                if infeasible and args.refuse_infeasible:
+                    exit_code = EXIT_INFEASIBLE
+                    break
+
+            if time.time() >= next_report:
+                next_report += args.interval
+                speeds = ", ".join(f"{chain} {speed:.0f}/s" for chain, speed in engine.chain_speeds().items())
+                log(f"tried={engine.total_attempts()} speed={engine.speed():.0f}/s hits={hits} ({speeds}) "
+                    f"ETA {engine.eta_text()}")
+                if len(engine.chains) > 1 and engine.top is None:
+                    log(f"schedule: {engine.schedule_text()}")
+                if args.profile:
+                    for line in engine.stats_text().splitlines():
+                        log(f"profile {line}")
+                if engine.top is not None:
+                    write_top(engine, args.top_output)
+
+    except KeyboardInterrupt:
+        exit_code = EXIT_INTERRUPTED
+
+    deliver(engine.stop())
+
+    log(f"stopped: tried={engine.total_attempts()} average speed={engine.speed():.0f}/s hits={hits}")
+    if extra:
+        log(f"{extra} more hits found after the target was reached were discarded")
+    if engine.top is not None:
+        write_top(engine, args.top_output)
+    if save_local and hits:
+        # 确保结果日志写盘后再退出
+        try:
+            get_journal().close()
+        except OSError as e:
+            log(f"save failed: {e}")
+    if args.profile:
+        for line in engine.stats_text().splitlines():
+            log(f"profile {line}")
+    return exit_code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless vanity address search driven by wallet_config.json")
+    parser.add_argument("--config", default=CONFIG_FILE, help="config file (default: %(default)s)")
+    parser.add_argument("--chains", nargs="+", choices=SUPPORTED_CHAINS, help="override the enabled chains")
+    parser.add_argument("--prefix", help="override the prefix of every selected chain")
+    parser.add_argument("--suffix", help="override the suffix of every selected chain")
+    parser.add_argument("--case-sensitive", action="store_true")
+    parser.add_argument("--pattern-file", help="pattern list file (one 'prefix*suffix' per line)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: number of cores)")
+    parser.add_argument("--target", type=int, help="exit after this many hits (default: config 'target', 0 = never); "
+                                                   "per-chain targets are set in the config's chain sections")
+    parser.add_argument("--interval", type=float, default=10, help="seconds between rate lines")
+    parser.add_argument("--max-eta", type=float, default=DEFAULT_MAX_ETA,
+                        help="warn when the 90%% ETA exceeds this many seconds")
+    parser.add_argument("--refuse-infeasible", action="store_true", help="exit when a pattern exceeds --max-eta")
+    parser.add_argument("--no-save", action="store_true", help="do not save hits locally")
+    parser.add_argument("--public-key",
+                        help="split-key mode (ETH/TRX): search P + k*G for this public key and report k")
+    parser.add_argument("--top-k", type=int, nargs="?", const=DEFAULT_TOP_K, default=0, metavar="K",
+                        help="scoring mode: ignore the patterns and keep the K best-scoring addresses "
+                             "(default K: %(const)s)")
+    parser.add_argument("--top-output", default="top_addresses.txt",
+                        help="file rewritten with the top-K list every --interval (default: %(default)s)")
+    parser.add_argument("--deployer", help="contract-address mode (ETH): search addresses of contracts deployed by "
+                                           "this address, reporting the CREATE2 salt or CREATE nonce")
+    parser.add_argument("--init-code-hash", help="CREATE2 init code hash; without it --deployer searches CREATE nonces")
+    parser.add_argument("--nonce", type=int, help="first nonce of a CREATE search (default 0)")
+    parser.add_argument("--seed", help="hex search seed (default: config 'seed' or random)")
+    parser.add_argument("--checkpoint", help="save positions to this file and resume from it if it exists")
+    parser.add_argument("--profile", action="store_true",
+                        help="sample per-stage timings and print the breakdown with the rate lines")
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,407 +1,437 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import threading
-import time
-import json
-import os
-import sys
-
-# 尝试导入SOL类
-try:
-    from sol import SOL
-except ImportError:
-    class SOL:
-        def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None):
-            self.prefix = prefix
-            self.suffix = suffix
-            self.case_sensitive = case_sensitive
-            self.on_found_callback = on_found_callback
-            
-        def generate_wallet(self):
-            return None
-
-# 尝试导入ETH和TRX的模块
-try:
-    from eth import ETH
-except ImportError:
-    # 创建一个简单的ETH类替代
-    class ETH:
-        def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None):
-            self.prefix = prefix
-            self.suffix = suffix
-            self.case_sensitive = case_sensitive
-            self.on_found_callback = on_found_callback
-            
-        def generate_wallet(self):
-            # 此处应添加真实的ETH钱包生成逻辑
-            # 这只是一个占位符实现
-            return None
-
-try:
-    from trx import TRX
-except ImportError:
-    # 创建一个简单的TRX类替代
-    class TRX:
-        def __init__(self, prefix="", suffix="", case_sensitive=False, on_found_callback=None):
-            self.prefix = prefix
-            self.suffix = suffix
-            self.case_sensitive = case_sensitive
-            self.on_found_callback = on_found_callback
-            
-        def generate_wallet(self):
-            # 此处应添加真实的TRX钱包生成逻辑
-            # 这只是一个占位符实现
-            return None
-
-class WalletGeneratorUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("区块链靓号生成器")
-        self.root.geometry("800x600")
-        self.root.resizable(True, True)
-        
-        # 设置应用风格
-        style = ttk.Style()
-        try:
-            style.theme_use('clam')  # 使用clam主题
-        except:
-            pass  # 如果主题不可用，使用默认主题
-        
-        # 定义颜色
-        self.bg_color = "#f5f5f5"
-        self.accent_color = "#4a6fa5"
-        self.button_color = "#4a90e2"
-        
-        # 设置根窗口背景色
-        self.root.configure(bg=self.bg_color)
-        
-        # 创建生成器状态变量
-        self.running = False
-        self.wallet_generators = {}
-        self.count = 0
-        self.start_time = 0
-        
-        # 加载配置
-        self.load_config()
-        
-        # 创建UI元素
-        self.create_ui()
-    
-    def load_config(self):
-        """加载配置文件"""
-        self.config = {
-            "save_local": True,
-            "chains": {
-                "ETH": {
-                    "enabled": True,
-                    "prefix": "",
-                    "suffix": ""
-                },
-                "TRX": {
-                    "enabled": True,
-                    "prefix": "",
-                    "suffix": ""
-                },
-                "SOL": {
-                    "enabled": True,
-                    "prefix": "",
-                    "suffix": ""
-                }
-            }
-        }
-        
-        try:
-            if os.path.exists("wallet_config.json"):
-                with open("wallet_config.json", "r", encoding="utf-8") as f:
-                    loaded_config = json.load(f)
-                    # 更新配置
-                    self.config.update(loaded_config)
-        except Exception as e:
-            messagebox.showerror("配置加载错误", f"配置文件加载失败: {str(e)}")
-    
-    def save_config(self):
-        """保存配置到文件"""
-        try:
-            with open("wallet_config.json", "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            messagebox.showerror("配置保存错误", f"配置保存失败: {str(e)}")
-    
-    def create_ui(self):
-        """创建用户界面"""
-        # 创建标签页
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # 创建生成器标签页和结果标签页
-        self.generator_frame = ttk.Frame(self.notebook)
-        self.results_frame = ttk.Frame(self.notebook)
-        
-        self.notebook.add(self.generator_frame, text="靓号生成器")
-        self.notebook.add(self.results_frame, text="结果")
-        
-        # 设置生成器页面
-        self.setup_generator_page()
-        
-        # 设置结果页面
-        self.setup_results_page()
-    
-    def setup_generator_page(self):
-        """设置生成器页面"""
-        # 创建主框架
-        main_frame = ttk.Frame(self.generator_frame)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # 链选择部分
-        chain_frame = ttk.LabelFrame(main_frame, text="选择链")
-        chain_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # 创建链选择变量和复选框
-        self.chain_vars = {}
-        for chain in ["ETH", "TRX", "SOL"]:
-            self.chain_vars[chain] = tk.BooleanVar(value=False)  # 默认都不选
-            cb = ttk.Checkbutton(chain_frame, text=chain, variable=self.chain_vars[chain])
-            cb.pack(side=tk.LEFT, padx=20, pady=5)
-        
-        # 前缀后缀设置部分
-        pattern_frame = ttk.LabelFrame(main_frame, text="靓号设置")
-        pattern_frame.pack(fill=tk.X, padx=5, pady=10)
-        
-        # 创建前缀后缀输入
-        prefix_frame = ttk.Frame(pattern_frame)
-        prefix_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        ttk.Label(prefix_frame, text="前缀:").pack(side=tk.LEFT, padx=5, pady=5)
-        self.prefix_entry = ttk.Entry(prefix_frame)
-        self.prefix_entry.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.X, expand=True)
-        
-        suffix_frame = ttk.Frame(pattern_frame)
-        suffix_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        ttk.Label(suffix_frame, text="后缀:").pack(side=tk.LEFT, padx=5, pady=5)
-        self.suffix_entry = ttk.Entry(suffix_frame)
-        self.suffix_entry.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.X, expand=True)
-        
-        # 区分大小写选项
-        self.case_sensitive_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(pattern_frame, text="区分大小写", variable=self.case_sensitive_var).pack(anchor=tk.W, padx=5, pady=5)
-        
-        # 控制区域
-        control_frame = ttk.Frame(main_frame)
-        control_frame.pack(fill=tk.X, padx=5, pady=10)
-        
-        self.start_button = ttk.Button(control_frame, text="开始生成", command=self.start_generation)
-        self.start_button.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        self.stop_button = ttk.Button(control_frame, text="停止", command=self.stop_generation, state=tk.DISABLED)
-        self.stop_button.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        # 状态区域
-        status_frame = ttk.LabelFrame(main_frame, text="状态")
-        status_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
-        
-        # 进度信息 - 使用自动滚动的文本框
-        self.status_text = scrolledtext.ScrolledText(status_frame, height=10)
-        self.status_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.status_text.config(state=tk.DISABLED)
-        
-        # 添加一个清除状态的按钮
-        clear_status_btn = ttk.Button(status_frame, text="清除状态", 
-                                     command=lambda: self.update_status("已清除状态信息", append=False))
-        clear_status_btn.pack(side=tk.RIGHT, padx=5, pady=2)
-        
-        # 状态栏
-        self.status_bar = ttk.Label(self.root, text="就绪", relief=tk.SUNKEN, anchor=tk.W)
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-    
-    def setup_results_page(self):
-        """设置结果页面"""
-        # 创建主框架
-        main_frame = ttk.Frame(self.results_frame)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # 结果显示
-        self.results_text = scrolledtext.ScrolledText(main_frame)
-        self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.results_text.config(state=tk.DISABLED)
-        
-        # 控制按钮
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        clear_button = ttk.Button(button_frame, text="清除结果", command=self.clear_results)
-        clear_button.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        export_button = ttk.Button(button_frame, text="导出结果", command=self.export_results)
-        export_button.pack(side=tk.LEFT, padx=5, pady=5)
-    
-    def update_status(self, text, append=True):
-        """更新状态文本，并确保显示最新内容"""
-        self.status_text.config(state=tk.NORMAL)
-        if append:
-            self.status_text.insert(tk.END, text + "\n")
-            self.status_text.see(tk.END)  # 确保滚动到最新内容
-        else:
-            self.status_text.delete(1.0, tk.END)
-            self.status_text.insert(tk.END, text + "\n")
-        self.status_text.config(state=tk.DISABLED)
-        
-        # 强制更新UI
-        self.root.update_idletasks()
-    
-    def update_results(self, text):
-        """更新结果文本"""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.insert(tk.END, text + "\n")
-        self.results_text.see(tk.END)
-        self.results_text.config(state=tk.DISABLED)
-    
-    def clear_results(self):
-        """清除结果"""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.config(state=tk.DISABLED)
-    
-    def export_results(self):
-        """导出结果"""
-        try:
-            filename = f"wallet_results_{time.strftime('%Y%m%d_%H%M%S')}.txt"
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(self.results_text.get(1.0, tk.END))
-            messagebox.showinfo("导出成功", f"结果已导出到 {filename}")
-        except Exception as e:
-            messagebox.showerror("导出错误", f"导出失败: {str(e)}")
-    
-    def on_found_wallet(self, chain, address, private_key):
-        """找到靓号时的回调函数"""
-        result_text = f"找到 {chain} 靓号:\n地址: {address}\n私钥: {private_key}\n时间: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        self.update_results(result_text)
-        self.update_status(f"找到 {chain} 靓号: {address}")
-        
-        # 保存到文件（始终保存）
-        try:
-            from hexer import save_result
-            result_file = save_result(chain, private_key, address)
-            if result_file:
-                self.update_status(f"已保存到本地: {result_file}")
-            else:
-                self.update_status(f"保存失败")
-        except Exception as e:
-            self.update_status(f"保存失败: {str(e)}")
-    
-    def start_generation(self):
-        """开始生成靓号"""
-        # 检查是否选择了至少一个链
-        selected_chains = [chain for chain in ["ETH", "TRX", "SOL"] if self.chain_vars[chain].get()]
-        if not selected_chains:
-            messagebox.showerror("错误", "请至少选择一个链")
-            return
-        
-        # 更新配置
-        for chain in ["ETH", "TRX", "SOL"]:
-            self.config["chains"][chain]["enabled"] = self.chain_vars[chain].get()
-        
-        # 始终保存到本地
-        self.config["save_local"] = True
-        
-        # 保存配置
-        self.save_config()
-        
-        # 禁用开始按钮，启用停止按钮
-        self.start_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.NORMAL)
-        
-        # 设置生成状态
-        self.running = True
-        self.count = 0
-        self.start_time = time.time()
-        
-        # 清除状态
-        self.update_status("开始生成靓号...", append=False)
-        
-        # 创建并启动生成线程
-        self.gen_thread = threading.Thread(target=self.generation_loop, args=(selected_chains,))
-        self.gen_thread.daemon = True
-        self.gen_thread.start()
-        
-        # 启动更新线程
-        self.update_thread = threading.Thread(target=self.update_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
-    
-    def stop_generation(self):
-        """停止生成靓号"""
-        self.running = False
-        self.stop_button.config(state=tk.DISABLED)
-        self.start_button.config(state=tk.NORMAL)
-        self.update_status("已停止生成")
-    
-    def generation_loop(self, selected_chains):
-        """靓号生成循环"""
-        # 创建钱包生成器
-        self.wallet_generators = {}
-        for chain in selected_chains:
-            prefix = self.prefix_entry.get()
-            suffix = self.suffix_entry.get()
-            case_sensitive = self.case_sensitive_var.get()
-            
-            # 创建回调函数
-            callback = lambda address, private_key, ch=chain: self.on_found_wallet(ch, address, private_key)
-            
-            if chain == "ETH":
-                generator = ETH(prefix=prefix, suffix=suffix, case_sensitive=case_sensitive,
-                               on_found_callback=callback)
-            elif chain == "TRX":
-                generator = TRX(prefix=prefix, suffix=suffix, case_sensitive=case_sensitive,
-                               on_found_callback=callback)
-            elif chain == "SOL":
-                generator = SOL(prefix=prefix, suffix=suffix, case_sensitive=case_sensitive,
-                               on_found_callback=callback)
-            
-            self.wallet_generators[chain] = generator
-        
-        # 生成循环
-        try:
-            while self.running:
-                for chain in selected_chains:
-                    if not self.running:
-                        break
-                    
-                    generator = self.wallet_generators[chain]
-                    result = generator.generate_wallet()
-                    self.count += 1
-                    
-                    # 如果找到靓号，回调函数已经处理了
-        
-        except Exception as e:
-            self.update_status(f"生成错误: {str(e)}")
-            self.running = False
-            self.root.after(0, lambda: self.stop_button.config(state=tk.DISABLED))
-            self.root.after(0, lambda: self.start_button.config(state=tk.NORMAL))
-    
-    def update_loop(self):
-        """更新状态循环"""
-        last_count = 0
-        update_interval = 100  # 每生成100个地址更新一次状态
-        
-        while self.running:
-            elapsed = time.time() - self.start_time
-            if elapsed > 0:
-                speed = self.count / elapsed
-                status_text = f"已尝试: {self.count}, 速度: {speed:.2f}/秒"
-                
-                # 使用after方法安全地更新UI
-                self.root.after(0, lambda: self.status_bar.config(text=status_text))
-                
-                # 定期在状态区域更新处理进度
-                if self.count - last_count >= update_interval:
-                    progress_text = f"处理中... 已尝试 {self.count} 个地址, 当前速度: {speed:.2f}/秒"
-                    self.root.after(0, lambda txt=progress_text: self.update_status(txt))
-                    last_count = self.count
-            
-            time.sleep(0.5)  # 更频繁地更新状态
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = WalletGeneratorUI(root)
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+import time
+import copy
+import os
+import sys
+
+from config import DEFAULT_CONFIG, load_config, save_config
+from engine import SUPPORTED_CHAINS, SearchEngine, WARMUP_SECONDS
+from difficulty import format_duration
+from hexer import save_result
+from journal import export as export_journal, get_journal
+from scoring import DEFAULT_TOP_K
+
+# 主线程取结果的定时器间隔（毫秒）与每次最多处理的命中数
+POLL_INTERVAL = 200
+POLL_BATCH = 200
+# 状态区域进度与性能分析的刷新间隔（秒）
+PROGRESS_INTERVAL = 5
+PROFILE_INTERVAL = 5
+
+class WalletGeneratorUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("区块链靓号生成器")
+        self.root.geometry("800x600")
+        self.root.resizable(True, True)
+        
+        # 设置应用风格
+        style = ttk.Style()
+        try:
+            style.theme_use('clam')  # 使用clam主题
+        except:
+            pass  # 如果主题不可用，使用默认主题
+        
+        # 定义颜色
+        self.bg_color = "#f5f5f5"
+        self.accent_color = "#4a6fa5"
+        self.button_color = "#4a90e2"
+        
+        # 设置根窗口背景色
+        self.root.configure(bg=self.bg_color)
+        
+        # 创建生成器状态变量
+        self.running = False
+        self.engine = None
+        self.count = 0
+        self.start_time = 0
+        
+        # 加载配置
+        self.load_config()
+        
+        # 创建UI元素
+        self.create_ui()
+    
+    def load_config(self):
+        """加载配置文件"""
+        try:
+            self.config = load_config()
+        except Exception as e:
+            self.config = copy.deepcopy(DEFAULT_CONFIG)
+            messagebox.showerror("配置加载错误", f"配置文件加载失败: {str(e)}")
+    
+    def save_config(self):
+        """保存配置到文件"""
+        try:
+            save_config(self.config)
+        except Exception as e:
+            messagebox.showerror("配置保存错误", f"配置保存失败: {str(e)}")
+    
+    def create_ui(self):
+        """创建用户界面"""
+        # 创建标签页
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # 创建生成器标签页和结果标签页
+        self.generator_frame = ttk.Frame(self.notebook)
+        self.results_frame = ttk.Frame(self.notebook)
+        
+        self.notebook.add(self.generator_frame, text="靓号生成器")
+        self.notebook.add(self.results_frame, text="结果")
+        
+        # 设置生成器页面
+        self.setup_generator_page()
+        
+        # 设置结果页面
+        self.setup_results_page()
+    
+    def setup_generator_page(self):
+        """设置生成器页面"""
+        # 创建主框架
+        main_frame = ttk.Frame(self.generator_frame)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # 链选择部分
+        chain_frame = ttk.LabelFrame(main_frame, text="选择链")
+        chain_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # 创建链选择变量和复选框
+        self.chain_vars = {}
+        # 按链注册表（chains.py）列出，新登记的链自动出现
+        for chain in SUPPORTED_CHAINS:
+            self.chain_vars[chain] = tk.BooleanVar(value=False)  # 默认都不选
+            cb = ttk.Checkbutton(chain_frame, text=chain, variable=self.chain_vars[chain])
+            cb.pack(side=tk.LEFT, padx=20, pady=5)
+        
+        # 前缀后缀设置部分
+        pattern_frame = ttk.LabelFrame(main_frame, text="靓号设置")
+        pattern_frame.pack(fill=tk.X, padx=5, pady=10)
+        
+        # 创建前缀后缀输入
+        prefix_frame = ttk.Frame(pattern_frame)
+        prefix_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(prefix_frame, text="前缀:").pack(side=tk.LEFT, padx=5, pady=5)
+        self.prefix_entry = ttk.Entry(prefix_frame)
+        self.prefix_entry.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.X, expand=True)
+        
+        suffix_frame = ttk.Frame(pattern_frame)
+        suffix_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(suffix_frame, text="后缀:").pack(side=tk.LEFT, padx=5, pady=5)
+        self.suffix_entry = ttk.Entry(suffix_frame)
+        self.suffix_entry.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.X, expand=True)
+        
+        pattern_file_frame = ttk.Frame(pattern_frame)
+        pattern_file_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # 多规则模式：从文件加载规则列表（每行一个 "前缀*后缀"），填写后忽略上面的前缀后缀
+        ttk.Label(pattern_file_frame, text="规则文件:").pack(side=tk.LEFT, padx=5, pady=5)
+        self.pattern_file_entry = ttk.Entry(pattern_file_frame)
+        self.pattern_file_entry.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.X, expand=True)
+        ttk.Button(pattern_file_frame, text="浏览", command=self.browse_pattern_file).pack(side=tk.LEFT, padx=5, pady=5)
+        
+        # 区分大小写选项
+        self.case_sensitive_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(pattern_frame, text="区分大小写", variable=self.case_sensitive_var).pack(anchor=tk.W, padx=5, pady=5)
+        
+        # 评分模式：忽略上面的规则，按地址的好看程度保留最好的 K 个
+        top_frame = ttk.Frame(pattern_frame)
+        top_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.top_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(top_frame, text="评分模式，保留最好的", variable=self.top_var).pack(side=tk.LEFT, padx=5, pady=5)
+        self.top_k_var = tk.IntVar(value=DEFAULT_TOP_K)
+        ttk.Spinbox(top_frame, from_=1, to=10000, width=6, textvariable=self.top_k_var).pack(side=tk.LEFT, pady=5)
+        ttk.Label(top_frame, text="个地址").pack(side=tk.LEFT, padx=5, pady=5)
+        
+        # 控制区域
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(fill=tk.X, padx=5, pady=10)
+        
+        self.start_button = ttk.Button(control_frame, text="开始生成", command=self.start_generation)
+        self.start_button.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        self.stop_button = ttk.Button(control_frame, text="停止", command=self.stop_generation, state=tk.DISABLED)
+        self.stop_button.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        # 性能分析：运行中也可切换，开启后在状态区域定期显示各阶段耗时
+        self.profiling_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="性能分析", variable=self.profiling_var,
+                        command=self.toggle_profiling).pack(side=tk.LEFT, padx=5, pady=5)
+        
+        # 状态区域
+        status_frame = ttk.LabelFrame(main_frame, text="状态")
+        status_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
+        
+        # 进度信息 - 使用自动滚动的文本框
+        self.status_text = scrolledtext.ScrolledText(status_frame, height=10)
+        self.status_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.status_text.config(state=tk.DISABLED)
+        
+        # 添加一个清除状态的按钮
+        clear_status_btn = ttk.Button(status_frame, text="清除状态", 
+                                     command=lambda: self.update_status("已清除状态信息", append=False))
+        clear_status_btn.pack(side=tk.RIGHT, padx=5, pady=2)
+        
+        # 状态栏
+        self.status_bar = ttk.Label(self.root, text="就绪", relief=tk.SUNKEN, anchor=tk.W)
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    
+    def setup_results_page(self):
+        """设置结果页面"""
+        # 创建主框架
+        main_frame = ttk.Frame(self.results_frame)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # 结果显示
+        self.results_text = scrolledtext.ScrolledText(main_frame)
+        self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.results_text.config(state=tk.DISABLED)
+        
+        # 控制按钮
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        clear_button = ttk.Button(button_frame, text="清除结果", command=self.clear_results)
+        clear_button.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        export_button = ttk.Button(button_frame, text="导出结果", command=self.export_results)
+        export_button.pack(side=tk.LEFT, padx=5, pady=5)
+    
+    def browse_pattern_file(self):
+        """选择规则文件"""
+        filename = filedialog.askopenfilename(filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")])
+        if filename:
+            self.pattern_file_entry.delete(0, tk.END)
+            self.pattern_file_entry.insert(0, filename)
+    
+    def update_status(self, text, append=True):
+        """更新状态文本，并确保显示最新内容"""
+        self.status_text.config(state=tk.NORMAL)
+        if append:
+            self.status_text.insert(tk.END, text + "\n")
+            self.status_text.see(tk.END)  # 确保滚动到最新内容
+        else:
+            self.status_text.delete(1.0, tk.END)
+            self.status_text.insert(tk.END, text + "\n")
+        self.status_text.config(state=tk.DISABLED)
+    
+    def update_results(self, text):
+        """更新结果文本"""
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.insert(tk.END, text + "\n")
+        self.results_text.see(tk.END)
+        self.results_text.config(state=tk.DISABLED)
+    
+    def clear_results(self):
+        """清除结果"""
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.config(state=tk.DISABLED)
+    
+    def export_results(self):
+        """从本地结果日志导出全部结果；评分模式下导出当前榜单（搜索不中断）"""
+        try:
+            if self.engine is not None and self.engine.top is not None:
+                filename = f"wallet_top_{time.strftime('%Y%m%d_%H%M%S')}.txt"
+                count = self.engine.export_top(filename)
+                messagebox.showinfo("导出成功", f"已导出榜单前 {count} 名到 {filename}")
+                return
+            filename = f"wallet_results_{time.strftime('%Y%m%d_%H%M%S')}.txt"
+            # 先把尚未写盘的结果写入日志，再逐条导出
+            get_journal().flush()
+            count = export_journal(filename)
+            messagebox.showinfo("导出成功", f"已导出 {count} 条结果到 {filename}")
+        except Exception as e:
+            messagebox.showerror("导出错误", f"导出失败: {str(e)}")
+    
+    def show_hits(self, hits):
+        """在界面中显示一批命中结果并保存到本地（主线程调用）"""
+        if not hits:
+            return
+        results = []
+        statuses = []
+        if hits[0].score is not None:
+            # 评分模式只显示新进榜的地址，榜单通过"导出结果"保存
+            for hit in hits:
+                results.append(f"进榜 {hit.chain} 地址: {hit.address}\n私钥: {hit.private_key}\n评分: {hit.score} 位\n")
+            statuses.append(f"{len(hits)} 个地址进榜，{self.engine.eta_text()}")
+            self.update_results("\n".join(results))
+            self.update_status("\n".join(statuses))
+            return
+        for hit in hits:
+            result_text = f"找到 {hit.chain} 靓号:\n地址: {hit.address}\n私钥: {hit.private_key}\n"
+            if hit.patterns:
+                result_text += f"匹配规则: {', '.join(hit.patterns)}\n"
+            result_text += f"时间: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            results.append(result_text)
+            statuses.append(f"找到 {hit.chain} 靓号: {hit.address}")
+        
+        # 保存到本地结果日志（始终保存）
+        try:
+            for hit in hits:
+                result_file = save_result(hit.chain, hit.private_key, hit.address, hit.patterns)
+            statuses.append(f"已保存 {len(hits)} 条到本地: {result_file}")
+        except OSError as e:
+            statuses.append(f"保存失败: {str(e)}")
+        
+        # 每批只刷新一次控件
+        self.update_results("\n".join(results))
+        self.update_status("\n".join(statuses))
+    
+    def start_generation(self):
+        """开始生成靓号"""
+        # 检查是否选择了至少一个链
+        selected_chains = [chain for chain in SUPPORTED_CHAINS if self.chain_vars[chain].get()]
+        if not selected_chains:
+            messagebox.showerror("错误", "请至少选择一个链")
+            return
+        
+        # 更新配置
+        for chain in SUPPORTED_CHAINS:
+            self.config["chains"].setdefault(chain, {})["enabled"] = self.chain_vars[chain].get()
+        
+        # 始终保存到本地
+        self.config["save_local"] = True
+        
+        # 保存配置
+        self.save_config()
+        
+        # 所有链使用相同的前缀后缀设置
+        options = {
+            "prefix": self.prefix_entry.get(),
+            "suffix": self.suffix_entry.get(),
+            "case_sensitive": self.case_sensitive_var.get()
+        }
+        if self.pattern_file_entry.get():
+            options["pattern_file"] = self.pattern_file_entry.get()
+        
+        # 上一次搜索尚未完全结束时先停止，并保留其剩余结果
+        if self.engine is not None and self.engine.is_running():
+            self.show_hits(self.engine.stop())
+        
+        # 创建多进程搜索引擎（同时检查规则是否可能匹配）
+        try:
+            top_k = self.top_k_var.get() if self.top_var.get() else 0
+            # 各链的目标命中数与优先级取自配置文件（见 scheduler）
+            chains = {}
+            for chain in selected_chains:
+                settings = self.config["chains"][chain]
+                chains[chain] = dict(options, **{key: settings[key] for key in ("target", "priority") if key in settings})
+            self.engine = SearchEngine(chains, top_k=top_k)
+            self.engine.set_profiling(self.profiling_var.get())
+        except Exception as e:
+            messagebox.showerror("错误", f"无法开始生成: {str(e)}")
+            return
+        
+        # 禁用开始按钮，启用停止按钮
+        self.start_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+        
+        # 设置生成状态
+        self.running = True
+        self.count = 0
+        self.start_time = time.time()
+        
+        # 清除状态
+        self.update_status("开始生成靓号...", append=False)
+        if self.engine.top is not None:
+            self.update_status(f"评分模式: 保留最好的 {self.engine.top.size} 个地址，可随时导出")
+        else:
+            for chain, expected in self.engine.expected.items():
+                self.update_status(f"{chain} 平均每 {expected:.3g} 次尝试命中一次")
+        self.update_status("加密后端: " + " ".join(f"{kind}={name}" for kind, name in self.engine.backends.items()))
+        
+        # 启动工作进程，由主线程定时取出结果，不再使用后台线程
+        try:
+            self.engine.start()
+        except Exception as e:
+            self.running = False
+            self.start_button.config(state=tk.NORMAL)
+            self.stop_button.config(state=tk.DISABLED)
+            self.update_status(f"生成错误: {str(e)}")
+            return
+        self.update_status(f"已启动 {self.engine.workers} 个工作进程")
+        
+        self.last_progress = 0
+        self.warned = False
+        self.next_profile = time.time() + PROFILE_INTERVAL
+        self.root.after(POLL_INTERVAL, self.poll_engine, self.engine)
+    
+    def stop_generation(self):
+        """停止生成靓号"""
+        self.running = False
+        self.stop_button.config(state=tk.DISABLED)
+        self.start_button.config(state=tk.NORMAL)
+        self.update_status("已停止生成")
+    
+    def toggle_profiling(self):
+        """开启/关闭分阶段性能统计"""
+        if self.engine:
+            self.engine.set_profiling(self.profiling_var.get())
+    
+    def poll_engine(self, engine):
+        """定时器回调：分批取出命中结果并刷新状态（在 Tk 主线程中运行）"""
+        if engine is not self.engine:
+            return  # 已被新的搜索替换
+        
+        if not self.running or not engine.is_running():
+            # 停止后取出剩余结果
+            remaining = engine.stop()
+            if remaining:
+                self.show_hits(remaining)
+            if self.running:
+                self.update_status("工作进程已退出")
+                self.running = False
+                self.stop_button.config(state=tk.DISABLED)
+                self.start_button.config(state=tk.NORMAL)
+            self.count = engine.total_attempts()
+            self.status_bar.config(text=f"已尝试: {self.count}, 平均速度: {engine.speed():.2f}/秒")
+            return
+        
+        hits = engine.get_hits(limit=POLL_BATCH)
+        if hits:
+            self.show_hits(hits)
+        
+        if engine.is_done():
+            # 各链都达到目标命中数后自动停止
+            self.update_status("各链均已达到目标数量")
+            self.stop_generation()
+            self.root.after(POLL_INTERVAL, self.poll_engine, engine)
+            return
+        
+        self.count = engine.total_attempts()
+        elapsed = engine.elapsed()
+        if elapsed > 0:
+            speed = self.count / elapsed
+            self.status_bar.config(text=f"已尝试: {self.count}, 速度: {speed:.2f}/秒  预计用时 {engine.eta_text()}")
+            
+            # 定期在状态区域更新处理进度
+            if time.time() - self.last_progress >= PROGRESS_INTERVAL:
+                self.last_progress = time.time()
+                self.update_status(f"处理中... 已尝试 {self.count} 个地址, 当前速度: {speed:.2f}/秒")
+                if len(engine.chains) > 1 and engine.top is None:
+                    self.update_status(f"算力分配: {engine.schedule_text()}")
+            
+            # 预热后按实测速度提示不可行的规则
+            if not self.warned and elapsed > WARMUP_SECONDS:
+                self.warned = True
+                for chain, value in engine.infeasible_chains().items():
+                    self.update_status(f"警告: 按当前速度 {chain} 规则 90% 概率找到需要 {format_duration(value)}，建议缩短前后缀")
+            
+            # 定期显示各链分阶段耗时
+            if engine.profiling and time.time() >= self.next_profile:
+                self.next_profile = time.time() + PROFILE_INTERVAL
+                stats_text = engine.stats_text()
+                if stats_text:
+                    self.update_status(f"性能分析:\n{stats_text}")
+        
+        self.root.after(POLL_INTERVAL, self.poll_engine, engine)
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = WalletGeneratorUI(root)
     root.mainloop() 
\ No newline at end of file
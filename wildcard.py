@@ -0,0 +1,445 @@
+import copy
+import string
+from collections import namedtuple
+
+import b58
+from b58 import ALPHABET
+from matcher import HEX_CHARS, Base58Matcher, HexMatcher, TextMatcher
+
+# 规则语法（前缀、后缀中均可使用）：
+#   ?        该链地址字母表中的任意字符
+#   [a-f1]   字符类，支持范围；[^...] 或 [!...] 为取反
+#   {n}      前一个元素重复 n 次
+#   (x)      捕获一个元素（字符、? 或字符类），按前缀到后缀的顺序编号 1..9
+#   \1       与第 1 个捕获位置相同的字符；(x){n} 表示 n 个相同的字符
+# 例如 "8?8?8?"、后缀 "([0-9]){6}"（6 个相同的数字）、前缀 "[abc]"
+SPECIAL_CHARS = "?[]{}()\\"
+
+# 没有指定字母表时 ? 与取反字符类的取值范围
+DEFAULT_ALPHABET = string.digits + string.ascii_letters
+
+MAX_REPEAT = 64
+
+# chars: 可选字符（None 表示任意），group: 本位置捕获的编号，ref: 引用的捕获编号
+Slot = namedtuple("Slot", ["chars", "group", "ref"])
+
+
+def is_wildcard(text):
+    """
+    Whether a prefix/suffix uses the wildcard syntax (plain literals do not)
+    """
+    return any(char in SPECIAL_CHARS for char in text)
+
+
+def _parse_class(text, start):
+    end = text.find("]", start + 1)
+    if end < 0:
+        raise ValueError(f"Invalid pattern {text!r}: unclosed [")
+    body = text[start + 1:end]
+    negate = body[:1] in ("^", "!")
+    if negate:
+        body = body[1:]
+    chars = set()
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == "-":
+            if body[i] > body[i + 2]:
+                raise ValueError(f"Invalid pattern {text!r}: bad range {body[i:i + 3]}")
+            chars.update(chr(code) for code in range(ord(body[i]), ord(body[i + 2]) + 1))
+            i += 3
+        else:
+            chars.add(body[i])
+            i += 1
+    if not chars:
+        raise ValueError(f"Invalid pattern {text!r}: empty []")
+    return (frozenset(chars), negate), end + 1
+
+
+def _parse_element(text, i):
+    char = text[i]
+    if char == "?":
+        return (None, False), i + 1
+    if char == "[":
+        return _parse_class(text, i)
+    if char in SPECIAL_CHARS:
+        raise ValueError(f"Invalid pattern {text!r}: unexpected {char!r}")
+    return (frozenset(char), False), i + 1
+
+
+def parse(text, groups=0):
+    """
+    Parse one prefix/suffix into a list of Slots
+
+    Capture groups are numbered from groups + 1 so a suffix can refer to
+    the prefix's groups. Returns (slots, number of the last group).
+    Raises ValueError for malformed patterns.
+    """
+    slots = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "(":
+            element, i = _parse_element(text, i + 1) if i + 1 < len(text) else (None, i)
+            if element is None or i >= len(text) or text[i] != ")":
+                raise ValueError(f"Invalid pattern {text!r}: a group holds exactly one character, ? or []")
+            i += 1
+            groups += 1
+            if groups > 9:
+                raise ValueError(f"Invalid pattern {text!r}: more than 9 groups")
+            slot = Slot(element, groups, None)
+        elif char == "\\":
+            if i + 1 >= len(text) or not text[i + 1].isdigit() or not 0 < int(text[i + 1]) <= groups:
+                raise ValueError(f"Invalid pattern {text!r}: \\ must refer to an earlier group")
+            slot = Slot(None, None, int(text[i + 1]))
+            i += 2
+        else:
+            element, i = _parse_element(text, i)
+            slot = Slot(element, None, None)
+
+        count = 1
+        if i < len(text) and text[i] == "{":
+            end = text.find("}", i)
+            if end < 0 or not text[i + 1:end].isdigit() or not 0 < int(text[i + 1:end]) <= MAX_REPEAT:
+                raise ValueError(f"Invalid pattern {text!r}: repetition must be {{1}}..{{{MAX_REPEAT}}}")
+            count = int(text[i + 1:end])
+            i = end + 1
+        slots.append(slot)
+        # (x){n}：后面的副本都引用第一个位置捕获的字符
+        repeat = Slot(None, None, slot.group) if slot.group else slot
+        slots.extend([repeat] * (count - 1))
+    return slots, groups
+
+
+class WildcardPattern:
+    """
+    A wildcard prefix/suffix pair compiled for encoded address strings
+
+    Each constrained position gets a frozenset of allowed characters
+    (case-folded unless case_sensitive) and each back-reference an
+    equality pair, so a check is a handful of index lookups. Prefix
+    positions start after ``skip`` characters (TRX's 'T'), suffix
+    positions count from the end. ``alphabet`` limits ? and classes to
+    the chain's characters.
+    """
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, alphabet=None, skip=0):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case_sensitive = case_sensitive
+        self.skip = skip
+        self.fold = str if case_sensitive else str.lower
+        self.alphabet = frozenset(self.fold(char) for char in (alphabet or DEFAULT_ALPHABET))
+
+        prefix_slots, groups = parse(prefix)
+        suffix_slots, _ = parse(suffix, groups)
+        self.prefix_length = len(prefix_slots)
+        self.suffix_length = len(suffix_slots)
+        self.min_length = skip + max(self.prefix_length, self.suffix_length)
+        self.prefix_slots = prefix_slots
+        self.suffix_slots = suffix_slots
+
+        # 位置下标 -> 可选字符集合；捕获编号 -> 位置；位置相等约束
+        self.slots = {}
+        captures = {}
+        self.groups = {}
+        indexed = [(skip + i, slot) for i, slot in enumerate(prefix_slots)]
+        indexed += [(i - self.suffix_length, slot) for i, slot in enumerate(suffix_slots)]
+        for index, slot in indexed:
+            if slot.ref:
+                head = captures[slot.ref]
+                self.slots[index] = self.slots[head]
+                self.groups[head].append(index)
+                continue
+            self.slots[index] = self._allowed(*slot.chars)
+            if slot.group:
+                captures[slot.group] = index
+                self.groups[index] = []
+
+        self.possible = all(self.slots.values())
+        self.checks = [(index, allowed) for index, allowed in self.slots.items() if allowed != self.alphabet]
+        self.equal = [(head, index) for head, members in self.groups.items() for index in members]
+
+    def _allowed(self, chars, negate):
+        if chars is None:
+            return self.alphabet
+        folded = frozenset(self.fold(char) for char in chars)
+        if negate:
+            return self.alphabet - folded
+        return self.alphabet & folded
+
+    def match(self, address):
+        """
+        Check an encoded address
+        """
+        if len(address) < self.min_length:
+            return False
+        fold = self.fold
+        for index, allowed in self.checks:
+            if fold(address[index]) not in allowed:
+                return False
+        for head, index in self.equal:
+            if fold(address[head]) != fold(address[index]):
+                return False
+        return True
+
+    def lowered(self):
+        """
+        Case-insensitive copy allowing the lower-cased characters of each position
+
+        It accepts every address this pattern accepts (case ignored), so it
+        can pre-filter before the case is known. Lowering the allowed sets
+        keeps negated classes right: case-sensitive [^a-f] allows A-F.
+        """
+        pattern = copy.copy(self)
+        pattern.case_sensitive = False
+        pattern.fold = str.lower
+        pattern.alphabet = frozenset(char.lower() for char in self.alphabet)
+        pattern.slots = {index: frozenset(char.lower() for char in allowed) for index, allowed in self.slots.items()}
+        pattern.checks = [(index, allowed) for index, allowed in pattern.slots.items() if allowed != pattern.alphabet]
+        return pattern
+
+    def _literal(self, index):
+        allowed = self.slots[index]
+        return next(iter(allowed)) if len(allowed) == 1 else None
+
+    def literal_prefix(self):
+        """
+        The leading run of single-character prefix positions, as a literal prefix
+        """
+        run = []
+        for i in range(self.prefix_length):
+            char = self._literal(self.skip + i)
+            if char is None:
+                break
+            run.append(char)
+        return "".join(run)
+
+    def literal_suffix(self):
+        """
+        The trailing run of single-character suffix positions, as a literal suffix
+        """
+        run = []
+        for i in range(1, self.suffix_length + 1):
+            char = self._literal(-i)
+            if char is None:
+                break
+            run.append(char)
+        return "".join(reversed(run))
+
+    def probability(self, weights, position_weights=None):
+        """
+        Probability that a random address matches, from per-character probabilities
+
+        weights maps each (case-folded) character to its probability at
+        any position, position_weights overrides that for some position
+        indexes; positions are independent except back-references.
+        """
+        position_weights = position_weights or {}
+        probability = 1.0
+        grouped = set()
+        for head, members in self.groups.items():
+            positions = [head] + members
+            grouped.update(positions)
+            total = 0.0
+            for char in self.slots[head]:
+                product = 1.0
+                for index in positions:
+                    product *= position_weights.get(index, weights).get(char, 0.0)
+                total += product
+            probability *= total
+        for index, allowed in self.slots.items():
+            if index not in grouped:
+                probability *= sum(position_weights.get(index, weights).get(char, 0.0) for char in allowed)
+        return probability
+
+
+class HexWildcardMatcher:
+    """
+    ETH matcher for wildcard patterns: a nibble mask pre-filter, then the full check
+
+    Positions whose allowed characters share one nibble (literals, or
+    [aA] when case-sensitive) form a mask/value like HexMatcher's, so
+    most candidates are rejected with one AND and compare. Survivors are
+    checked against the whole pattern on the hex string. When
+    case_sensitive the case-folded pattern is checked on the plain hex
+    first, and only its survivors pay for the EIP-55 checksum (via
+    ``checksum_hash``); the case is part of that check, so
+    match_checksum has nothing left to do.
+    """
+
+    ADDRESS_NIBBLES = HexMatcher.ADDRESS_NIBBLES
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, checksum_hash=None):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case_sensitive = case_sensitive
+        self.checksum_hash = checksum_hash
+        alphabet = HEX_CHARS + HEX_CHARS[10:].upper() if case_sensitive else HEX_CHARS
+        self.pattern = WildcardPattern(prefix, suffix, case_sensitive, alphabet)
+        self.folded = self.pattern.lowered() if case_sensitive else self.pattern
+        self.letter_cases = []
+        self.mask = 0
+        self.value = 0
+        self.possible = self.pattern.possible and self.pattern.min_length <= self.ADDRESS_NIBBLES
+
+        nibbles = {}
+        for index, allowed in self.pattern.slots.items():
+            values = {char.lower() for char in allowed}
+            if len(values) != 1:
+                continue
+            position = index % self.ADDRESS_NIBBLES
+            nibble = int(values.pop(), 16)
+            if nibbles.get(position, nibble) != nibble:
+                # 前后缀重叠处要求的半字节冲突
+                self.possible = False
+            nibbles[position] = nibble
+        for position, nibble in nibbles.items():
+            shift = 4 * (self.ADDRESS_NIBBLES - 1 - position)
+            self.mask |= 0xF << shift
+            self.value |= nibble << shift
+
+    def _match_survivor(self, address_bytes):
+        text = address_bytes.hex()
+        if not self.folded.match(text):
+            return False
+        if not self.case_sensitive:
+            return True
+        digest = self.checksum_hash(address_bytes).hex()
+        return self.pattern.match("".join(char.upper() if nibble in "89abcdef" else char
+                                          for char, nibble in zip(text, digest)))
+
+    def match_bytes(self, address_bytes):
+        """
+        Check a raw 20-byte address
+        """
+        if not self.possible or int.from_bytes(address_bytes, "big") & self.mask != self.value:
+            return False
+        return self._match_survivor(address_bytes)
+
+    def match_int(self, address_int):
+        """
+        Check a 160-bit address integer
+        """
+        if not self.possible or address_int & self.mask != self.value:
+            return False
+        return self._match_survivor(address_int.to_bytes(20, "big"))
+
+    def match_checksum(self, checksum_hash):
+        return True
+
+    def match(self, address):
+        """
+        Check a hex address string
+        """
+        return self.possible and self.pattern.match(address)
+
+
+class Base58WildcardMatcher:
+    """
+    Base58 matcher for wildcard patterns on the raw payload integer
+
+    The literal head of the prefix and literal tail of the suffix are
+    compiled into a Base58Matcher (interval bisect + residue set) as the
+    pre-filter. Survivors have their suffix checked digit by digit on
+    ``value mod 58**k``; only patterns with wildcards in the prefix (or
+    back-references into it) Base58-encode the survivors for a text check.
+    """
+
+    def __init__(self, prefix="", suffix="", case_sensitive=False, payload_length=32, lead=""):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.payload_length = payload_length
+        self.lead = lead
+        self.pattern = WildcardPattern(prefix, suffix, case_sensitive, ALPHABET, skip=len(lead))
+        self.prefilter = Base58Matcher(self.pattern.literal_prefix(), self.pattern.literal_suffix(), case_sensitive,
+                                       payload_length, lead)
+        self.numeric = self.prefilter.numeric
+        self.possible = self.pattern.possible
+
+        # 后缀从最后一位起每一位允许的数字（None 为不限）
+        fold = self.pattern.fold
+        self.folded = [fold(char) for char in ALPHABET]
+        self.suffix_digits = []
+        for i in range(1, self.pattern.suffix_length + 1):
+            allowed = self.pattern.slots[-i]
+            digits = frozenset(digit for digit, char in enumerate(self.folded) if char in allowed)
+            self.suffix_digits.append(None if len(digits) == len(ALPHABET) else digits)
+        self.suffix_modulus = 58 ** self.pattern.suffix_length
+        self.suffix_equal = [(-1 - head, -1 - index) for head, index in self.pattern.equal if head < 0]
+
+        literal_length = len(self.pattern.literal_prefix())
+        self.needs_text = any(head >= 0 for head, _ in self.pattern.equal) or any(
+            self.pattern.slots[len(lead) + i] != self.pattern.alphabet
+            for i in range(literal_length, self.pattern.prefix_length))
+
+    def match_prefix_high(self, high, shift):
+        """
+        Coarse pre-filter on the payload's top bits (see Base58Matcher.match_prefix_high)
+        """
+        return self.prefilter.match_prefix_high(high, shift)
+
+    def match_int(self, value):
+        """
+        Check a payload integer without leading zero bytes
+        """
+        if not self.prefilter.match_int(value):
+            return False
+        if self.suffix_digits:
+            rest = value % self.suffix_modulus
+            digits = []
+            for allowed in self.suffix_digits:
+                rest, digit = divmod(rest, 58)
+                if allowed is not None and digit not in allowed:
+                    return False
+                digits.append(digit)
+            folded = self.folded
+            for head, index in self.suffix_equal:
+                if folded[digits[head]] != folded[digits[index]]:
+                    return False
+        if self.needs_text:
+            return self.pattern.match(self.encode(value))
+        return True
+
+    def match_bytes(self, payload):
+        """
+        Check a raw payload (e.g. a 32-byte SOL public key)
+        """
+        if not self.numeric or not payload[0]:
+            return self.pattern.match(b58.encode(payload))
+        return self.match_int(int.from_bytes(payload, "big"))
+
+    def match(self, address):
+        """
+        Check an encoded address
+        """
+        return self.pattern.match(address)
+
+    def encode(self, value):
+        return b58.encode(value.to_bytes(self.payload_length, "big"))
+
+
+def hex_matcher(prefix="", suffix="", case_sensitive=False, checksum_hash=None):
+    """
+    HexMatcher for literal patterns, HexWildcardMatcher for wildcard ones
+    """
+    if is_wildcard(prefix) or is_wildcard(suffix):
+        return HexWildcardMatcher(prefix, suffix, case_sensitive, checksum_hash)
+    return HexMatcher(prefix, suffix, case_sensitive)
+
+
+def base58_matcher(prefix="", suffix="", case_sensitive=False, payload_length=32, lead=""):
+    """
+    Base58Matcher for literal patterns, Base58WildcardMatcher for wildcard ones
+    """
+    if is_wildcard(prefix) or is_wildcard(suffix):
+        return Base58WildcardMatcher(prefix, suffix, case_sensitive, payload_length, lead)
+    return Base58Matcher(prefix, suffix, case_sensitive, payload_length, lead)
+
+
+def text_matcher(prefix="", suffix="", case_sensitive=False, alphabet=None, skip=0):
+    """
+    TextMatcher for literal patterns, WildcardPattern for wildcard ones
+    """
+    if is_wildcard(prefix) or is_wildcard(suffix):
+        return WildcardPattern(prefix, suffix, case_sensitive, alphabet, skip)
+    return TextMatcher(prefix, suffix, case_sensitive, alphabet, skip)